@@ -0,0 +1,98 @@
+"""
+Micro-benchmark for check_schema lookups.
+
+Compares the precomputed SchemaIndex (uncached and memoized) with the linear
+scan over PHARMA_SCHEMA that check_schema used before: exact table loop,
+module check, substring loop and an indented json.dumps on every call.
+
+Usage:
+    poetry run python benchmarks/bench_check_schema.py --number 2000
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.schema import load_schema  # noqa: E402
+from src.schema_index import SchemaIndex, normalize_name  # noqa: E402
+
+# Mix of exact tables, synonyms, module names, partial names and misses
+QUERIES = [
+    "drugs", "drug", "company", "clinical_trials", "Clinical Trial", "regulatory",
+    "Clinical_Module", "pricing", "regimen efficacy", "target", "biomarker", "xyz",
+]
+
+PHARMA_SCHEMA = load_schema()
+
+SYNONYMS = {"drug": "drugs", "company": "companies", "disease": "diseases", "target": "molecular_targets"}
+
+
+def linear_check_schema(entity_type):
+    """The previous check_schema lookup, kept here as the baseline."""
+    entity_type = SYNONYMS.get(entity_type.strip().lower(), entity_type.strip().lower())
+    for module_name, module_tables in PHARMA_SCHEMA.items():
+        if entity_type in module_tables:
+            return json.dumps(
+                {
+                    "module": module_name,
+                    "table": entity_type,
+                    "description": module_tables[entity_type]["description"],
+                    "fields": module_tables[entity_type]["fields"],
+                },
+                indent=2,
+            )
+    if entity_type in PHARMA_SCHEMA:
+        return json.dumps(
+            {
+                "module": entity_type,
+                "tables": {
+                    name: {"description": data["description"], "field_count": len(data["fields"])}
+                    for name, data in PHARMA_SCHEMA[entity_type].items()
+                },
+            },
+            indent=2,
+        )
+    matches = [
+        {"module": module_name, "table": table_name, "description": tables[table_name]["description"]}
+        for module_name, tables in PHARMA_SCHEMA.items()
+        for table_name in tables
+        if entity_type in table_name
+    ]
+    if matches:
+        return json.dumps({"partial_matches": matches}, indent=2)
+    return json.dumps({"error": f"No schema information found for '{entity_type}'"}, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark check_schema lookups")
+    parser.add_argument("--number", type=int, default=2000, help="Passes over the query mix")
+    args = parser.parse_args()
+
+    build_seconds = timeit.timeit(lambda: SchemaIndex(PHARMA_SCHEMA), number=10) / 10
+    index = SchemaIndex(PHARMA_SCHEMA)
+
+    candidates = {
+        "linear scan (previous)": lambda: [linear_check_schema(q) for q in QUERIES],
+        "SchemaIndex, uncached": lambda: [index._lookup(normalize_name(q)) for q in QUERIES],
+        "SchemaIndex, memoized": lambda: [index.find(q) for q in QUERIES],
+    }
+
+    print(f"Index build: {build_seconds * 1000:.2f}ms")
+    print(f"Per lookup over {len(QUERIES)} mixed queries:")
+    for name, run in candidates.items():
+        seconds = timeit.timeit(run, number=args.number)
+        per_lookup = seconds / (args.number * len(QUERIES)) * 1e6
+        print(f"  {name:<24} {per_lookup:8.2f}us")
+
+    sizes = {
+        "linear": sum(len(linear_check_schema(q)) for q in QUERIES),
+        "index": sum(len(index.find(q)[2]) for q in QUERIES),
+    }
+    print(f"Response size for the mix: {sizes['linear']} chars -> {sizes['index']} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Import-time budget check for CLI startup.
+
+Imports the workflow modules (and runs `main.py --help`) in fresh
+subprocesses with API keys removed from the environment, so it also checks
+that startup works offline. Tools, clients and providers are built lazily on
+first use; this fails if an eager import or client construction creeps back
+in. The repo has no test suite, so this script doubles as the regression
+check: the `import main` target also fails if importing the CLI module loads
+any model provider SDK.
+
+Exits with status 1 if a target fails or the best of --repeats runs exceeds
+--budget.
+
+Usage:
+    poetry run python benchmarks/bench_import.py
+    poetry run python benchmarks/bench_import.py --budget 1.0 --repeats 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+KEY_VARIABLES = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "TAVILY_API_KEY")
+
+# Provider SDKs that must only be imported once a model of that provider is used
+SDK_MODULES = ("langchain_openai", "langchain_anthropic", "langchain_google_genai")
+
+IMPORT_MAIN = (
+    "import sys, main\n"
+    f"loaded = [name for name in {SDK_MODULES!r} if name in sys.modules]\n"
+    "if loaded:\n"
+    "    sys.exit('import main eagerly imported: ' + ', '.join(loaded))\n"
+)
+
+TARGETS = {
+    "import src.graph": [sys.executable, "-c", "import src.graph"],
+    "import main": [sys.executable, "-c", IMPORT_MAIN],
+    "main.py --help": [sys.executable, os.path.join(ROOT_DIR, "main.py"), "--help"],
+}
+
+
+def offline_env():
+    """Current environment without API keys (a project .env file still applies)."""
+    env = {key: value for key, value in os.environ.items() if key not in KEY_VARIABLES}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def time_command(command, env, repeats):
+    """
+    Run a command repeatedly in fresh interpreters.
+
+    Returns:
+        List of wall-clock durations in seconds
+
+    Raises:
+        RuntimeError: If the command fails
+    """
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        completed = subprocess.run(command, env=env, capture_output=True, text=True)
+        timings.append(time.perf_counter() - started_at)
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(command)} failed:\n{completed.stderr.strip()[-2000:]}"
+            )
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI startup against an import-time budget")
+    parser.add_argument(
+        "--budget", type=float, default=1.5, help="Maximum best-of-N time in seconds"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per target")
+    args = parser.parse_args()
+
+    env = offline_env()
+    baseline = min(time_command([sys.executable, "-c", "pass"], env, args.repeats))
+
+    failed = False
+    print(f"Interpreter startup: {baseline:.3f}s (budget {args.budget:.2f}s)")
+    for name, command in TARGETS.items():
+        try:
+            timings = time_command(command, env, args.repeats)
+        except RuntimeError as e:
+            print(f"{name:<18} FAILED\n{e}")
+            failed = True
+            continue
+        best = min(timings)
+        status = "ok" if best <= args.budget else "OVER BUDGET"
+        print(
+            f"{name:<18} best {best:.3f}s  median {sorted(timings)[len(timings) // 2]:.3f}s  "
+            f"(+{best - baseline:.3f}s over bare interpreter)  {status}"
+        )
+        failed = failed or best > args.budget
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Query latency of the lookup_previous vector index as a deck grows.
+
+Fills VectorIndex (and, when docarray is installed, the
+DocArrayInMemorySearch store it replaced) with random embeddings and times
+top-3 queries at increasing document counts. Embeddings are precomputed
+random vectors, so only index work is measured.
+
+Usage:
+    poetry run python benchmarks/bench_vector_index.py --sizes 50,200,1000 --dimension 1536
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.documents import Document  # noqa: E402
+from langchain_core.embeddings import Embeddings  # noqa: E402
+from src.vector_index import VectorIndex  # noqa: E402
+
+
+class RandomEmbeddings(Embeddings):
+    """Random vectors per text, cached so embedding cost is not timed."""
+
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self._vectors = {}
+
+    def _vector(self, text):
+        if text not in self._vectors:
+            rng = np.random.default_rng(abs(hash(text)) % 2**32)
+            self._vectors[text] = rng.standard_normal(self.dimension).tolist()
+        return self._vectors[text]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def time_queries(store, queries):
+    started_at = time.perf_counter()
+    for query in queries:
+        store.similarity_search(query, k=3)
+    return (time.perf_counter() - started_at) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector index query latency")
+    parser.add_argument("--sizes", default="50,200,1000", help="Comma-separated document counts")
+    parser.add_argument("--dimension", type=int, default=1536, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per measurement")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    embedding = RandomEmbeddings(args.dimension)
+    queries = [f"query {i}" for i in range(args.queries)]
+    embedding.embed_documents(queries)
+
+    stores = {"VectorIndex": lambda: VectorIndex(embedding)}
+    try:
+        from langchain_community.vectorstores import DocArrayInMemorySearch
+
+        stores["DocArrayInMemorySearch"] = lambda: DocArrayInMemorySearch.from_documents(
+            documents=[], embedding=embedding
+        )
+    except ImportError:
+        print("docarray not installed; timing VectorIndex only")
+
+    print(f"{'store':<24}" + "".join(f"{size:>12}" for size in sizes))
+    for name, factory in stores.items():
+        row = []
+        for size in sizes:
+            documents = [
+                Document(page_content=f"slide {i} extraction", metadata={"slide_number": i})
+                for i in range(size)
+            ]
+            embedding.embed_documents([doc.page_content for doc in documents])
+            store = factory()
+            store.add_documents(documents)
+            row.append(time_queries(store, queries) * 1000)
+        print(f"{name:<24}" + "".join(f"{ms:>10.3f}ms" for ms in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Graph-level throughput benchmark for PharmDataWorkflow.
+
+Generates a synthetic PDF deck with PyMuPDF and runs the full workflow against
+the local provider (simulated latency, no API calls) in each execution mode.
+Each mode runs in its own subprocess so peak RSS is measured in isolation.
+
+Reports slides/minute, p50/p95/p99 per-slide latency, time to first result
+and peak RSS per mode.
+
+Usage:
+    poetry run python benchmarks/bench_workflow.py --pages 20 --latency 0.2
+    poetry run python benchmarks/bench_workflow.py --modes sequential --json results.json
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("sequential", "parallel_models", "parallel_slides")
+
+DRUGS = ["pembrolizumab", "osimertinib", "sotorasib", "tirzepatide", "dupilumab"]
+COMPANIES = ["Merck", "AstraZeneca", "Amgen", "Eli Lilly", "Regeneron"]
+DISEASES = ["NSCLC", "HER2+ breast cancer", "obesity", "atopic dermatitis"]
+
+
+def generate_deck(pdf_path, pages, seed=0):
+    """
+    Write a synthetic slide deck with a text layer to pdf_path.
+
+    Args:
+        pdf_path: Output path for the PDF
+        pages: Number of slides to generate
+        seed: Random seed for slide content
+    """
+    rng = random.Random(seed)
+    document = fitz.open()
+    for page_num in range(1, pages + 1):
+        page = document.new_page(width=960, height=540)
+        drug = rng.choice(DRUGS)
+        company = rng.choice(COMPANIES)
+        disease = rng.choice(DISEASES)
+        page.insert_text((50, 70), f"{drug}: Phase 3 results in {disease}", fontsize=28)
+        bullets = [
+            f"Sponsor: {company}",
+            f"Trial: NCT0{rng.randint(1000000, 9999999)} (N={rng.randint(100, 900)})",
+            f"ORR {rng.randint(20, 70)}% vs {rng.randint(5, 30)}% control",
+            f"Median PFS {rng.randint(4, 24)}.{rng.randint(0, 9)} months",
+            f"Grade 3+ adverse events: {rng.randint(5, 40)}%",
+        ]
+        for index, bullet in enumerate(bullets):
+            page.insert_text((70, 140 + index * 50), f"- {bullet}", fontsize=20)
+        page.insert_text((850, 520), str(page_num), fontsize=12)
+    document.save(pdf_path)
+    document.close()
+
+
+def run_mode(mode, pdf_path, models, max_workers, latency, result_file):
+    """
+    Run the workflow once in this process and write its metrics to result_file.
+    """
+    os.environ["LOCAL_MODEL_LATENCY_MEDIAN"] = str(latency)
+    sys.path.insert(0, ROOT_DIR)
+
+    from src.graph import PharmDataWorkflow
+    from src.metrics import run_metrics
+
+    workflow = PharmDataWorkflow(
+        active_models=models,
+        aggregator_model=models[0],
+        execution_mode=mode,
+        max_workers=max_workers,
+    )
+
+    initial_state = {
+        "document_metadata": None,
+        "slides": [],
+        "current_slide": None,
+        "extracted_data": [],
+        "processing_complete": False,
+        "pdf_path": pdf_path,
+        "run_id": f"bench-{mode}",
+    }
+
+    # Keep exported markdown out of the working tree
+    os.chdir(os.path.dirname(result_file))
+    started_at = time.perf_counter()
+    workflow.app.invoke(initial_state, config={"recursion_limit": 10000})
+    wall_seconds = time.perf_counter() - started_at
+
+    snapshot = run_metrics.for_run(f"bench-{mode}").snapshot()
+    slides = snapshot["slides_completed"]
+    result = {
+        "mode": mode,
+        "slides": slides,
+        "wall_seconds": wall_seconds,
+        "slides_per_minute": slides / wall_seconds * 60 if wall_seconds else 0,
+        "slide_latency_seconds": snapshot["slide_latency_seconds"],
+        "time_to_first_result_seconds": snapshot["time_to_first_result_seconds"],
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "counters": snapshot["counters"],
+    }
+    with open(result_file, "w") as f:
+        json.dump(result, f)
+
+
+def format_seconds(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def print_table(results):
+    header = f"{'mode':<16} {'slides':>6} {'slides/min':>10} {'p50':>7} {'p95':>7} {'p99':>7} {'first':>7} {'rss MB':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        latency = result["slide_latency_seconds"]
+        print(
+            f"{result['mode']:<16} {result['slides']:>6} "
+            f"{result['slides_per_minute']:>10.1f} "
+            f"{format_seconds(latency['p50']):>7} {format_seconds(latency['p95']):>7} "
+            f"{format_seconds(latency['p99']):>7} "
+            f"{format_seconds(result['time_to_first_result_seconds']):>7} "
+            f"{result['peak_rss_mb']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PharmDataWorkflow throughput")
+    parser.add_argument("--pages", type=int, default=20, help="Slides in the synthetic deck")
+    parser.add_argument(
+        "--modes",
+        default=",".join(MODES),
+        help="Comma-separated execution modes to benchmark",
+    )
+    parser.add_argument(
+        "--models",
+        default="local-a,local-b,local-c",
+        help="Comma-separated local models (first one aggregates)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="Median simulated model latency in seconds"
+    )
+    parser.add_argument(
+        "--max-workers", type=int, default=4, help="Workers for parallel_slides mode"
+    )
+    parser.add_argument("--json", help="Write results to this JSON file")
+    # Internal: run a single mode in this process
+    parser.add_argument("--run-mode", help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    models = [model.strip() for model in args.models.split(",")]
+
+    if args.run_mode:
+        run_mode(
+            args.run_mode, args.pdf, models, args.max_workers, args.latency, args.result_file
+        )
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        pdf_path = os.path.join(workdir, "synthetic_deck.pdf")
+        generate_deck(pdf_path, args.pages)
+
+        for mode in [mode.strip() for mode in args.modes.split(",")]:
+            if mode not in MODES:
+                raise ValueError(f"Unknown execution mode: {mode}")
+            print(f"Running {mode} on {args.pages} slides...", file=sys.stderr)
+            result_file = os.path.join(workdir, f"{mode}.json")
+            subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--run-mode", mode,
+                    "--pdf", pdf_path,
+                    "--result-file", result_file,
+                    "--models", args.models,
+                    "--latency", str(args.latency),
+                    "--max-workers", str(args.max_workers),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            with open(result_file) as f:
+                results.append(json.load(f))
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
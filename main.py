@@ -1,5 +1,15 @@
 from colorama import Fore, Style
-from src.graph import PharmDataWorkflow
+from src.graph import (
+    PharmDataWorkflow,
+    EXECUTION_MODES,
+    AGGREGATION_STRATEGIES,
+    CONTEXT_MODES,
+)
+from src.budgets import ExtractionBudget
+from src.resilience import ResiliencePolicy
+from src.hedging import HedgingPolicy
+from src.quorum import QuorumPolicy
+from src.cascade import CascadePolicy
 import argparse
 import os
 
@@ -12,7 +22,8 @@ def main():
     parser.add_argument("pdf_path", help="Path to the PDF file to process")
     parser.add_argument(
         "--models", 
-        help="Comma-separated list of models to use (e.g., 'gemini-1.5-pro,gemini-2.0-flash,gemini-2.5-pro-exp-03-25')",
+        help="Comma-separated list of models to use (e.g., 'gemini-1.5-pro,gemini-2.0-flash,gemini-2.5-pro-exp-03-25'). "
+        "Models named 'local' or 'local-*' use the offline local provider",
         default="gemini-2.5-pro-exp-03-25"
     )
     parser.add_argument(
@@ -20,8 +31,179 @@ def main():
         help="Model to use for aggregation (defaults to first model in --models)",
         default="gemini-2.5-pro-exp-03-25"
     )
+    parser.add_argument(
+        "--max-tool-calls",
+        type=int,
+        help="Maximum tool calls per model per slide before forcing a final answer",
+        default=10,
+    )
+    parser.add_argument(
+        "--max-agent-steps",
+        type=int,
+        help="Maximum ReAct agent steps per model per slide before forcing a final answer",
+        default=15,
+    )
+    parser.add_argument(
+        "--model-deadline",
+        type=float,
+        help="Wall-clock seconds per model per slide before forcing a final answer",
+        default=300,
+    )
+    parser.add_argument(
+        "--slide-max-tool-calls",
+        type=int,
+        help="Maximum tool calls shared by all models on a slide (default: unbounded)",
+        default=None,
+    )
+    parser.add_argument(
+        "--slide-deadline",
+        type=float,
+        help="Wall-clock seconds shared by all models on a slide (default: unbounded)",
+        default=None,
+    )
+    parser.add_argument(
+        "--execution-mode",
+        choices=EXECUTION_MODES,
+        help="How slides and models are scheduled (default: sequential)",
+        default="sequential",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum slides extracted concurrently in parallel_slides and speculative modes",
+        default=4,
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        help="Attempts per provider call on transient errors (with exponential backoff)",
+        default=3,
+    )
+    parser.add_argument(
+        "--circuit-failure-threshold",
+        type=int,
+        help="Consecutive provider failures before its circuit opens and it is skipped",
+        default=5,
+    )
+    parser.add_argument(
+        "--circuit-recovery-timeout",
+        type=float,
+        help="Seconds a provider is skipped after its circuit opens",
+        default=60,
+    )
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        help="Hedge extraction calls slower than this percentile of the model's recent latency (default: no hedging)",
+        default=None,
+    )
+    parser.add_argument(
+        "--hedge-initial-delay",
+        type=float,
+        help="Hedge delay in seconds until enough latency samples exist (default: wait for samples)",
+        default=None,
+    )
+    parser.add_argument(
+        "--max-hedge-rate",
+        type=float,
+        help="Maximum fraction of a model's calls that may be hedged",
+        default=0.25,
+    )
+    parser.add_argument(
+        "--max-concurrent-hedges",
+        type=int,
+        help="Maximum hedged calls in flight at once, including cancelled ones still finishing a request",
+        default=4,
+    )
+    parser.add_argument(
+        "--hedge-backup",
+        help="Comma-separated model=backup pairs to hedge with a different model (e.g., 'gemini-2.5-pro-exp-03-25=gemini-2.0-flash')",
+        default="",
+    )
+    parser.add_argument(
+        "--quorum",
+        type=int,
+        help="Aggregate a slide once this many models have returned (default: wait for all models)",
+        default=None,
+    )
+    parser.add_argument(
+        "--quorum-deadline",
+        type=float,
+        help="Aggregate a slide with the extractions available after this many seconds",
+        default=None,
+    )
+    parser.add_argument(
+        "--late-results",
+        choices=("drop", "reaggregate"),
+        help="Cancel models that miss the quorum, or re-aggregate their slides before export",
+        default="drop",
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="Extract each slide with one model first and only run the other models when its extraction scores poorly",
+    )
+    parser.add_argument(
+        "--cascade-model",
+        help="Model that extracts first in cascade mode (must be one of --models; default: the first)",
+        default=None,
+    )
+    parser.add_argument(
+        "--cascade-min-confidence",
+        type=float,
+        help="Escalate when the first model's mean confidence is below this",
+        default=3.5,
+    )
+    parser.add_argument(
+        "--cascade-min-coverage",
+        type=float,
+        help="Escalate when the first model covers less than this fraction of the schema modules in the slide text",
+        default=0.6,
+    )
+    parser.add_argument(
+        "--cascade-max-complexity",
+        type=float,
+        help="Escalate slides whose text complexity (0-1) is above this",
+        default=0.7,
+    )
+    parser.add_argument(
+        "--agreement-threshold",
+        type=float,
+        help="Skip the aggregator when the models' data points agree at least this much (0-1, e.g. 0.9; default: always aggregate)",
+        default=None,
+    )
+    parser.add_argument(
+        "--aggregation-strategy",
+        choices=AGGREGATION_STRATEGIES,
+        help="Combine model extractions with the aggregator model (llm) or a local field-level merge (local)",
+        default="llm",
+    )
+    parser.add_argument(
+        "--compact-aggregation",
+        action="store_true",
+        help="Send the aggregator model only the data points the models disagree on",
+    )
+    parser.add_argument(
+        "--context-tokens",
+        type=int,
+        help="Token budget for previous-slide context in each extraction prompt (relevant context mode)",
+        default=800,
+    )
+    parser.add_argument(
+        "--context-mode",
+        choices=CONTEXT_MODES,
+        help="Previous-slide context: relevant data points from earlier slides, or a rolling deck summary",
+        default="relevant",
+    )
+    parser.add_argument(
+        "--schema-routing",
+        action="store_true",
+        help="Put only the schema modules relevant to each slide's text in its prompt",
+    )
 
     args = parser.parse_args()
+    if args.agreement_threshold is not None and not 0 <= args.agreement_threshold <= 1:
+        parser.error("--agreement-threshold must be between 0 and 1")
 
     # Ensure PDF file exists
     if not os.path.exists(args.pdf_path):
@@ -38,8 +220,72 @@ def main():
     active_models = [model.strip() for model in args.models.split(",")]
     print(Fore.GREEN + f"Using models: {', '.join(active_models)}" + Style.RESET_ALL)
     
+    # Per-model and per-slide extraction budgets
+    model_budget = ExtractionBudget(
+        max_tool_calls=args.max_tool_calls,
+        max_agent_steps=args.max_agent_steps,
+        deadline_seconds=args.model_deadline,
+    )
+    slide_budget = ExtractionBudget(
+        max_tool_calls=args.slide_max_tool_calls,
+        deadline_seconds=args.slide_deadline,
+    )
+
+    resilience_policy = ResiliencePolicy(
+        max_attempts=args.max_attempts,
+        failure_threshold=args.circuit_failure_threshold,
+        recovery_timeout=args.circuit_recovery_timeout,
+    )
+
+    hedging_policy = None
+    if args.hedge_percentile is not None:
+        backup_models = dict(
+            pair.strip().split("=", 1) for pair in args.hedge_backup.split(",") if "=" in pair
+        )
+        hedging_policy = HedgingPolicy(
+            percentile=args.hedge_percentile,
+            initial_delay=args.hedge_initial_delay,
+            max_hedge_rate=args.max_hedge_rate,
+            max_concurrent_hedges=args.max_concurrent_hedges,
+            backup_models=backup_models,
+        )
+
+    quorum_policy = None
+    if args.quorum is not None or args.quorum_deadline is not None:
+        quorum_policy = QuorumPolicy(
+            min_results=args.quorum if args.quorum is not None else len(active_models),
+            deadline_seconds=args.quorum_deadline,
+            late_results=args.late_results,
+        )
+
+    cascade_policy = None
+    if args.cascade:
+        cascade_policy = CascadePolicy(
+            first_model=args.cascade_model,
+            min_confidence=args.cascade_min_confidence,
+            min_coverage=args.cascade_min_coverage,
+            max_complexity=args.cascade_max_complexity,
+        )
+
     # Initialize workflow with model configuration
-    workflow = PharmDataWorkflow(active_models=active_models, aggregator_model=args.aggregator_model)
+    workflow = PharmDataWorkflow(
+        active_models=active_models,
+        aggregator_model=args.aggregator_model,
+        model_budget=model_budget,
+        slide_budget=slide_budget,
+        execution_mode=args.execution_mode,
+        max_workers=args.max_workers,
+        resilience_policy=resilience_policy,
+        hedging_policy=hedging_policy,
+        quorum_policy=quorum_policy,
+        cascade_policy=cascade_policy,
+        agreement_threshold=args.agreement_threshold,
+        aggregation_strategy=args.aggregation_strategy,
+        compact_aggregation=args.compact_aggregation,
+        context_token_budget=args.context_tokens,
+        context_mode=args.context_mode,
+        schema_routing=args.schema_routing,
+    )
     app = workflow.app
 
     # Initial state for the workflow - include active models
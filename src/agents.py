@@ -1,13 +1,27 @@
-from trustcall import create_extractor
+from functools import cached_property, partial
 from .tools import search, lookup_previous, check_schema
-from .prompts import PHARMA_EXTRACTION_SYSTEM_PROMPT
+from .prompts import PHARMA_EXTRACTION_SYSTEM_PROMPT, PHARMA_EXTRACTION_ROUTED_SYSTEM_PROMPT
 from .state import DocumentMetadata
-from .providers import create_model_provider
+from .providers import get_model_provider
+from .budgets import BudgetTracker
+from .resilience import ResilientCaller, CircuitOpenError
+from .hedging import Hedger
+from .metrics import run_metrics
 from colorama import Fore, Style
 
 
 class Agents:
-    def __init__(self, active_models=None, aggregator_model=None):
+    def __init__(
+        self,
+        active_models=None,
+        aggregator_model=None,
+        model_budget=None,
+        slide_budget=None,
+        model_budgets=None,
+        resilience_policy=None,
+        hedging_policy=None,
+        schema_routing=False,
+    ):
         """
         Initialize the Agents class with support for multiple model providers.
 
@@ -16,15 +30,41 @@ class Agents:
                           If None, defaults to just gemini-1.5-pro
             aggregator_model: Model to use for aggregation
                              If None, defaults to the first model in active_models
+            model_budget: ExtractionBudget applied to each model's ReAct run on a slide
+                          If None, model runs are unbounded
+            slide_budget: ExtractionBudget shared by all models on a slide
+                          If None, slides are unbounded
+            model_budgets: Optional dict of model name -> ExtractionBudget overriding model_budget
+            resilience_policy: ResiliencePolicy for retries and per-provider circuit breakers
+                               If None, defaults are used
+            hedging_policy: HedgingPolicy for duplicating slow extraction calls
+                            If None, extraction calls are not hedged
+            schema_routing: Use the system prompt without the full schema listing
+                            (extraction prompts then carry the slide's schema slice)
         """
         # Initialize with default if no models specified
         self.active_models = active_models or ["gemini-1.5-pro"]
+
+        # Extraction budgets (None means unbounded)
+        self.model_budget = model_budget
+        self.slide_budget = slide_budget
+        self.model_budgets = model_budgets or {}
+
+        # Retries with backoff and a circuit breaker per provider type
+        self.resilience = ResilientCaller(resilience_policy)
         print(
             Fore.GREEN
             + f"Initializing with models: {', '.join(self.active_models)}"
             + Style.RESET_ALL
         )
 
+        # Static across slides either way, so providers can cache it
+        self.system_prompt = (
+            PHARMA_EXTRACTION_ROUTED_SYSTEM_PROMPT
+            if schema_routing
+            else PHARMA_EXTRACTION_SYSTEM_PROMPT
+        )
+
         # Define tools - same for all models
         self.tools = [search, lookup_previous, check_schema]
 
@@ -36,7 +76,7 @@ class Agents:
                 provider_type = self._determine_provider_type(model_name)
 
                 # Create provider
-                self.providers[model_name] = create_model_provider(
+                self.providers[model_name] = get_model_provider(
                     provider_type, model_name
                 )
                 print(
@@ -69,9 +109,41 @@ class Agents:
                 + Style.RESET_ALL
             )
 
-        # Create metadata extractor using the first available model
-        default_model = self.providers[self.active_models[0]].model
-        self.metadata_extractor = create_extractor(
+        # Hedge slow extraction calls, only with backup models that initialized
+        self.hedger = None
+        if hedging_policy is not None:
+            for model_name, backup_model in hedging_policy.backup_models.items():
+                if backup_model not in self.providers:
+                    print(
+                        Fore.YELLOW
+                        + f"Hedge backup {backup_model} for {model_name} not available. Hedging with {model_name} itself."
+                        + Style.RESET_ALL
+                    )
+            # A filtered copy, so the caller's policy keeps all its backups
+            hedging_policy = hedging_policy.model_copy(
+                update={
+                    "backup_models": {
+                        model_name: backup_model
+                        for model_name, backup_model in hedging_policy.backup_models.items()
+                        if backup_model in self.providers
+                    }
+                }
+            )
+            self.hedger = Hedger(hedging_policy)
+
+    @cached_property
+    def metadata_extractor(self):
+        """
+        Trustcall extractor for document metadata, built on first use from the
+        first available model (None for local providers, which have no chat model).
+        """
+        default_model = next(iter(self.providers.values())).model
+        if default_model is None:
+            return None
+
+        from trustcall import create_extractor
+
+        return create_extractor(
             default_model,
             tools=[DocumentMetadata, search],
             tool_choice="DocumentMetadata",
@@ -80,7 +152,9 @@ class Agents:
     def _determine_provider_type(self, model_name):
         model_name = model_name.lower()
 
-        if "gemini" in model_name:
+        if model_name.startswith("local"):
+            return "local"
+        elif "gemini" in model_name:
             return "google"
         elif "claude" in model_name:
             return "anthropic"
@@ -95,7 +169,19 @@ class Agents:
             )
             return "google"
 
-    def extract_with_model(self, model_name, slide_image, prompt):
+    def create_slide_budget(self, slide_number):
+        """
+        Create the budget tracker shared by all models extracting a slide.
+
+        Args:
+            slide_number: Number of the slide being extracted
+
+        Returns:
+            BudgetTracker for the slide
+        """
+        return BudgetTracker(self.slide_budget, label=f"slide {slide_number}")
+
+    def extract_with_model(self, model_name, slide_image, prompt, slide_budget=None):
         """
         Extract pharmaceutical data using the specified model.
 
@@ -103,6 +189,7 @@ class Agents:
             model_name: Name of the model to use
             slide_image: Base64-encoded slide image
             prompt: Formatted extraction prompt
+            slide_budget: Optional slide-level BudgetTracker from create_slide_budget
 
         Returns:
             Markdown-formatted extraction result
@@ -110,21 +197,79 @@ class Agents:
         if model_name not in self.providers:
             raise ValueError(f"Model {model_name} not available")
 
-        provider = self.providers[model_name]
-        return provider.extract_pharmaceutical_data(
-            slide_image, prompt, PHARMA_EXTRACTION_SYSTEM_PROMPT, self.tools
-        )
+        def make_budget(name):
+            model_budget = self.model_budgets.get(name, self.model_budget)
+            if slide_budget is not None:
+                return slide_budget.child(model_budget, label=name)
+            return BudgetTracker(model_budget, label=name)
+
+        def run_attempt(name, budget):
+            provider_type = self._determine_provider_type(name)
+            if not self.resilience.is_available(provider_type):
+                run_metrics.increment(f"resilience.skipped.{provider_type}")
+                raise CircuitOpenError(f"Circuit open for provider {provider_type}")
+            # Retries and the circuit breaker apply to each model call of the
+            # agent, so a late transient error does not replay the whole run
+            return self.providers[name].extract_pharmaceutical_data(
+                slide_image,
+                prompt,
+                self.system_prompt,
+                self.tools,
+                budget,
+                guard=partial(self.resilience.call, provider_type),
+            )
+
+        if self.hedger is None:
+            return run_attempt(model_name, make_budget(model_name))
+        return self.hedger.call(model_name, make_budget, run_attempt)
 
     def aggregate_results(self, extractions, prompt):
         """
         Aggregate multiple extraction results.
 
+        Uses the aggregator model first; if its provider keeps failing or its
+        circuit is open, the other available models are tried in turn.
+
         Args:
             extractions: List of extraction results
             prompt: Formatted aggregation prompt
 
         Returns:
             Aggregated extraction in markdown format
+
+        Raises:
+            Exception: The last aggregation error if no model could aggregate
         """
-        provider = self.providers[self.aggregator_model]
-        return provider.aggregate_extractions(extractions, prompt)
+        candidates = [self.aggregator_model] + [
+            model_name
+            for model_name in self.providers
+            if model_name != self.aggregator_model
+        ]
+
+        last_error = None
+        for model_name in candidates:
+            provider_type = self._determine_provider_type(model_name)
+            if not self.resilience.is_available(provider_type):
+                continue
+            if model_name != self.aggregator_model:
+                print(
+                    Fore.YELLOW
+                    + f"Falling back to {model_name} for aggregation."
+                    + Style.RESET_ALL
+                )
+            try:
+                return self.resilience.call(
+                    provider_type,
+                    self.providers[model_name].aggregate_extractions,
+                    extractions,
+                    prompt,
+                )
+            except Exception as e:
+                print(
+                    Fore.RED
+                    + f"Aggregation with {model_name} failed: {str(e)}"
+                    + Style.RESET_ALL
+                )
+                last_error = e
+
+        raise last_error or CircuitOpenError("No aggregator provider is available")
@@ -0,0 +1,311 @@
+# aggregation.py
+import re
+from itertools import combinations
+from .parsing import extraction_body, parse_extraction
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?%?")
+
+
+def normalize_text(text):
+    """Lowercase and reduce text to its word and number tokens."""
+    return " ".join(TOKEN_PATTERN.findall(text.lower()))
+
+
+def record_key(record):
+    """Comparable form of a data point: normalized field and value."""
+    return (normalize_text(record.field), normalize_text(record.value))
+
+
+def jaccard(first, second):
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def extraction_agreement(extractions):
+    """
+    Measure how closely model extractions agree, from 0 to 1.
+
+    Compares the normalized data point bullets (field and value, ignoring
+    categories, confidence and slide references) of every pair of extractions
+    and returns the lowest pairwise Jaccard similarity. Extractions without
+    parseable bullets are compared by their tokens instead.
+
+    Args:
+        extractions: List of extraction markdown strings
+
+    Returns:
+        Agreement score; 1.0 means identical data points
+    """
+    keys = [{record_key(record) for record in parse_extraction(text)} for text in extractions]
+    if not all(keys):
+        keys = [set(normalize_text(extraction_body(text)).split()) for text in extractions]
+
+    return min(
+        (jaccard(first, second) for first, second in combinations(keys, 2)),
+        default=1.0,
+    )
+
+
+def most_complete_extraction(model_extractions):
+    """
+    Pick the extraction with the most data points, preferring higher confidence.
+
+    Args:
+        model_extractions: List of ModelExtraction
+
+    Returns:
+        ModelExtraction
+    """
+
+    def completeness(model_extraction):
+        records = parse_extraction(model_extraction.extraction)
+        confidence = sum(record.confidence or 3 for record in records)
+        return (len(records), confidence)
+
+    return max(model_extractions, key=completeness)
+
+
+def merge_extractions(model_extractions, slide_number):
+    """
+    Merge model extractions field by field without calling a model.
+
+    Data points from all extractions are grouped by normalized field name.
+    Each model votes for its value with its confidence score (3 if missing);
+    the value with the highest total wins, ties going to the value backed by
+    more models and then to the more specific (longer) one. Fields a single
+    model lists several times (e.g., multiple indications) keep every value.
+    Merged confidence is the mean of the supporting models' scores, lowered by
+    one when other models disagreed.
+
+    Args:
+        model_extractions: List of ModelExtraction
+        slide_number: Slide the data points belong to
+
+    Returns:
+        Aggregated extraction in the aggregation output format
+    """
+    fields = {}
+    for model_extraction in model_extractions:
+        for record in parse_extraction(model_extraction.extraction):
+            field_key = normalize_text(record.field)
+            value_key = normalize_text(record.value)
+            if not field_key or not value_key:
+                continue
+            field = fields.setdefault(
+                field_key, {"values": {}, "multi_valued": False, "seen": {}}
+            )
+            seen = field["seen"].setdefault(model_extraction.model_name, set())
+            if value_key in seen:
+                continue
+            if seen:
+                field["multi_valued"] = True
+            seen.add(value_key)
+
+            candidate = field["values"].setdefault(
+                value_key, {"records": [], "weight": 0}
+            )
+            candidate["records"].append(record)
+            candidate["weight"] += record.confidence or 3
+
+    if not fields:
+        return most_complete_extraction(model_extractions).extraction
+
+    categories = {}
+    conflicts = 0
+    for field in fields.values():
+        ranked = sorted(
+            field["values"].values(),
+            key=lambda c: (
+                c["weight"],
+                len(c["records"]),
+                max(len(record.value) for record in c["records"]),
+            ),
+            reverse=True,
+        )
+        kept = ranked if field["multi_valued"] else ranked[:1]
+        disagreement = not field["multi_valued"] and len(ranked) > 1
+        conflicts += disagreement
+
+        for candidate in kept:
+            records = candidate["records"]
+            best = max(records, key=lambda record: len(record.value))
+            confidence = round(
+                sum(record.confidence or 3 for record in records) / len(records)
+            )
+            if disagreement:
+                confidence = max(1, confidence - 1)
+            category_names = [record.category for record in records]
+            category = max(dict.fromkeys(category_names), key=category_names.count)
+            categories.setdefault(category, []).append(
+                format_record(best, confidence, slide_number)
+            )
+
+    model_names = ", ".join(extraction.model_name for extraction in model_extractions)
+    data_points = sum(len(bullets) for bullets in categories.values())
+    return format_final_extraction(
+        f"Merged {data_points} data points from {len(model_extractions)} "
+        f"extractions ({model_names}); {conflicts} conflicting fields resolved.",
+        "Local field-level merge with confidence-weighted voting.",
+        categories,
+    )
+
+
+def format_record(record, confidence, slide_number):
+    return (
+        f"- **{record.field}**: {record.value} (Confidence: {confidence}) "
+        f"[Slide: {slide_number}]"
+    )
+
+
+def format_final_extraction(analysis, approach, categories):
+    """
+    Render aggregated data points in the aggregation output format.
+
+    Args:
+        analysis: Text for the "Analysis:" line
+        approach: Text for the "Aggregation Approach:" line
+        categories: Dict of category -> list of bullet lines
+
+    Returns:
+        Aggregated extraction markdown
+    """
+    lines = [
+        f"Analysis: {analysis}",
+        "",
+        f"Aggregation Approach: {approach}",
+        "",
+        "Final Extraction:",
+        "",
+    ]
+    for category, bullets in categories.items():
+        if not bullets:
+            continue
+        lines.append(f"### {category}")
+        lines.extend(bullets)
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def compact_extractions(model_extractions, slide_number):
+    """
+    Split model extractions into agreed data points and everything else.
+
+    A field is agreed when every model reported it with the same value(s).
+    Agreed data points are final and need no aggregator; the rest (conflicting
+    values and data points only some models found) are returned per model,
+    without the extractions' reasoning sections.
+
+    Args:
+        model_extractions: List of ModelExtraction
+        slide_number: Slide the data points belong to
+
+    Returns:
+        Tuple of (dict of category -> agreed bullet lines,
+        list of (model name, differing bullets markdown)), or None if any
+        extraction has no parseable data points (its content would be lost)
+    """
+    parsed = [
+        (model_extraction.model_name, parse_extraction(model_extraction.extraction))
+        for model_extraction in model_extractions
+    ]
+    if not all(records for _, records in parsed):
+        return None
+
+    # field -> model -> set of values
+    field_values = {}
+    for model_name, records in parsed:
+        for record in records:
+            field_values.setdefault(normalize_text(record.field), {}).setdefault(
+                model_name, set()
+            ).add(normalize_text(record.value))
+
+    agreed_fields = {
+        field
+        for field, values in field_values.items()
+        if len(values) == len(parsed)
+        and all(model_values == next(iter(values.values())) for model_values in values.values())
+    }
+
+    agreed = {}
+    added = set()
+    for _, records in parsed:
+        for record in records:
+            field = normalize_text(record.field)
+            key = (field, normalize_text(record.value))
+            if field not in agreed_fields or key in added:
+                continue
+            added.add(key)
+            confidences = [
+                other.confidence or 3
+                for _, other_records in parsed
+                for other in other_records
+                if (normalize_text(other.field), normalize_text(other.value)) == key
+            ]
+            confidence = round(sum(confidences) / len(confidences))
+            agreed.setdefault(record.category, []).append(
+                format_record(record, confidence, slide_number)
+            )
+
+    differing = []
+    for model_name, records in parsed:
+        categories = {}
+        for record in records:
+            if normalize_text(record.field) in agreed_fields:
+                continue
+            categories.setdefault(record.category, []).append(
+                format_record(record, record.confidence or 3, slide_number)
+            )
+        text = "\n\n".join(
+            f"### {category}\n" + "\n".join(bullets)
+            for category, bullets in categories.items()
+        )
+        differing.append((model_name, text))
+
+    return agreed, differing
+
+
+def summarize_agreed(agreed):
+    """One line per category listing the agreed data points compactly."""
+    lines = []
+    for category, bullets in agreed.items():
+        items = [
+            bullet[len("- **"):].split(" (Confidence:")[0].replace("**:", ":")
+            for bullet in bullets
+        ]
+        lines.append(f"- {category}: " + "; ".join(items))
+    return "\n".join(lines)
+
+
+def splice_aggregation(agreed, aggregated, model_count, slide_number):
+    """
+    Combine agreed data points with the aggregator's resolution of the rest.
+
+    Args:
+        agreed: Dict of category -> agreed bullet lines (from compact_extractions)
+        aggregated: Aggregator output for the differing data points
+        model_count: Number of models aggregated
+        slide_number: Slide the data points belong to
+
+    Returns:
+        Complete aggregated extraction markdown
+    """
+    categories = {category: list(bullets) for category, bullets in agreed.items()}
+    resolved = parse_extraction(aggregated)
+    if resolved:
+        for record in resolved:
+            categories.setdefault(record.category, []).append(
+                format_record(record, record.confidence or 3, slide_number)
+            )
+    elif extraction_body(aggregated):
+        categories.setdefault("Additional Data Points", []).append(
+            extraction_body(aggregated)
+        )
+
+    agreed_count = sum(len(bullets) for bullets in agreed.values())
+    return format_final_extraction(
+        f"{agreed_count} data points agreed across all {model_count} extractions; "
+        f"{len(resolved)} differing data points resolved by the aggregator.",
+        "Local merge of agreed data points, aggregator model for the differences.",
+        categories,
+    )
@@ -0,0 +1,157 @@
+# budgets.py
+import threading
+import time
+from typing import Optional
+from pydantic import BaseModel
+from langchain_core.tools import StructuredTool
+from colorama import Fore, Style
+from .prompts import BUDGET_EXHAUSTED_TOOL_MESSAGE
+
+
+class ExtractionBudget(BaseModel):
+    """Limits for a ReAct extraction run. None means unbounded."""
+
+    max_tool_calls: Optional[int] = None
+    max_agent_steps: Optional[int] = None
+    deadline_seconds: Optional[float] = None
+
+
+class ExtractionCancelled(Exception):
+    """Raised inside an extraction whose result is no longer needed (e.g., a hedge loser)."""
+
+
+class BudgetTracker:
+    """
+    Tracks tool calls, agent steps and elapsed time against an ExtractionBudget.
+
+    Trackers can be nested: a per-model tracker with a per-slide parent is
+    exhausted as soon as either of them runs out.
+    """
+
+    def __init__(self, budget=None, parent=None, label=""):
+        """
+        Initialize the tracker.
+
+        Args:
+            budget: ExtractionBudget to enforce (None for unbounded)
+            parent: Optional enclosing BudgetTracker (e.g., the slide budget)
+            label: Name used in log messages (e.g., "slide 3", "gemini-2.0-flash")
+        """
+        self.budget = budget or ExtractionBudget()
+        self.parent = parent
+        self.label = label
+        self.started_at = time.monotonic()
+        self.tool_calls = 0
+        self.agent_steps = 0
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._children = []
+
+    def elapsed_seconds(self):
+        return time.monotonic() - self.started_at
+
+    def cancel(self):
+        """Signal the extraction using this budget (and nested ones) to stop as soon as possible."""
+        self._cancelled.set()
+        with self._lock:
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def wait_cancelled(self, seconds):
+        """
+        Sleep for up to seconds, waking early if the tracker is cancelled.
+
+        Returns:
+            True if the tracker was cancelled
+        """
+        return self._cancelled.wait(seconds)
+
+    def exhausted_reason(self):
+        """
+        Return a human-readable reason if this budget (or its parent) is used up.
+
+        Returns:
+            Reason string, or None if the budget still has room
+        """
+        budget = self.budget
+        if self.cancelled:
+            reason = f"{self.label} was cancelled"
+        elif budget.max_tool_calls is not None and self.tool_calls >= budget.max_tool_calls:
+            reason = f"{self.label} used all {budget.max_tool_calls} tool calls"
+        elif (
+            budget.max_agent_steps is not None
+            and self.agent_steps >= budget.max_agent_steps
+        ):
+            reason = f"{self.label} used all {budget.max_agent_steps} agent steps"
+        elif (
+            budget.deadline_seconds is not None
+            and self.elapsed_seconds() >= budget.deadline_seconds
+        ):
+            reason = f"{self.label} passed its {budget.deadline_seconds:g}s deadline"
+        else:
+            reason = None
+
+        if reason is None and self.parent is not None:
+            return self.parent.exhausted_reason()
+        return reason
+
+    def record_tool_call(self):
+        with self._lock:
+            self.tool_calls += 1
+        if self.parent is not None:
+            self.parent.record_tool_call()
+
+    def record_step(self):
+        with self._lock:
+            self.agent_steps += 1
+        if self.parent is not None:
+            self.parent.record_step()
+
+    def child(self, budget=None, label=""):
+        """Create a nested tracker that also counts against this one."""
+        child = BudgetTracker(budget, parent=self, label=label)
+        with self._lock:
+            self._children.append(child)
+        if self.cancelled:
+            child.cancel()
+        return child
+
+    def wrap_tools(self, tools):
+        """
+        Wrap tools so that calls are counted and refused once the budget runs out.
+
+        A refused call returns a message telling the model to stop using tools
+        and write its final extraction, instead of raising.
+
+        Args:
+            tools: List of LangChain tools
+
+        Returns:
+            List of budget-aware tools with the same names and schemas
+        """
+        return [self._wrap_tool(tool) for tool in tools]
+
+    def _wrap_tool(self, tool):
+        def run(**kwargs):
+            reason = self.exhausted_reason()
+            if reason:
+                print(
+                    Fore.YELLOW
+                    + f"[BUDGET] Refusing {tool.name} call: {reason}"
+                    + Style.RESET_ALL
+                )
+                return BUDGET_EXHAUSTED_TOOL_MESSAGE.format(reason=reason)
+            self.record_tool_call()
+            return tool.invoke(kwargs)
+
+        return StructuredTool.from_function(
+            func=run,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+        )
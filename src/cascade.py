@@ -0,0 +1,100 @@
+# cascade.py
+import re
+from typing import Optional
+from pydantic import BaseModel
+from .schema import schema_modules, WORD_PATTERN
+from .parsing import parse_extraction
+
+NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)?%?")
+
+
+class CascadePolicy(BaseModel):
+    """When the first (cheap) model's extraction is good enough to skip the ensemble."""
+
+    # Model that extracts every slide first (default: the first active model)
+    first_model: Optional[str] = None
+    # Escalate when the mean confidence of its data points is below this
+    min_confidence: float = 3.5
+    # ...or more than this fraction of data points have confidence 1-2
+    max_low_confidence_share: float = 0.25
+    # ...or it covers less than this fraction of the schema modules the slide text touches
+    min_coverage: float = 0.6
+    # ...or the slide is more complex than this (0-1, see score_extraction)
+    max_complexity: float = 0.7
+    # ...or it extracted fewer data points than this
+    min_data_points: int = 1
+    # Words (numbers count double) at which a slide's text is considered maximally complex
+    complexity_words: int = 300
+
+
+class CascadeScore(BaseModel):
+    """Local quality signals for a single model's extraction of a slide."""
+
+    data_points: int
+    mean_confidence: float
+    low_confidence_share: float
+    coverage: float
+    complexity: float
+
+    def escalation_reason(self, policy: CascadePolicy):
+        """
+        Decide whether the slide needs the full ensemble.
+
+        Returns:
+            Human-readable reason to escalate, or None to accept the extraction
+        """
+        if self.data_points < policy.min_data_points:
+            return f"only {self.data_points} data points"
+        if self.mean_confidence < policy.min_confidence:
+            return f"mean confidence {self.mean_confidence:.2f} < {policy.min_confidence:g}"
+        if self.low_confidence_share > policy.max_low_confidence_share:
+            return f"{self.low_confidence_share:.0%} low-confidence data points"
+        if self.coverage < policy.min_coverage:
+            return f"schema coverage {self.coverage:.0%} < {policy.min_coverage:.0%}"
+        if self.complexity > policy.max_complexity:
+            return f"slide complexity {self.complexity:.2f} > {policy.max_complexity:g}"
+        return None
+
+
+def score_extraction(extraction, slide_text, policy: CascadePolicy):
+    """
+    Score an extraction without calling a model.
+
+    Coverage is the share of schema modules referenced by the slide's text
+    layer that the extraction also touches; slides without a text layer have
+    full coverage and zero complexity, so only confidence decides for them.
+    Data points without a confidence score count as confidence 3.
+
+    Args:
+        extraction: Extraction markdown from the first model
+        slide_text: Text layer of the slide (may be empty)
+        policy: CascadePolicy (for the complexity scale)
+
+    Returns:
+        CascadeScore
+    """
+    records = parse_extraction(extraction)
+    confidences = [record.confidence or 3 for record in records]
+
+    expected = schema_modules(slide_text)
+    if expected:
+        covered = schema_modules(
+            " ".join(f"{r.category} {r.field} {r.value}" for r in records)
+        )
+        coverage = len(expected & covered) / len(expected)
+    else:
+        coverage = 1.0
+
+    weight = len(WORD_PATTERN.findall(slide_text.lower())) + 2 * len(
+        NUMBER_PATTERN.findall(slide_text)
+    )
+
+    return CascadeScore(
+        data_points=len(records),
+        mean_confidence=sum(confidences) / len(confidences) if confidences else 0.0,
+        low_confidence_share=(
+            sum(1 for c in confidences if c <= 2) / len(confidences) if confidences else 0.0
+        ),
+        coverage=coverage,
+        complexity=min(1.0, weight / policy.complexity_words),
+    )
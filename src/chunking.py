@@ -0,0 +1,101 @@
+# chunking.py
+from langchain_core.documents import Document
+from .aggregation import normalize_text
+from .parsing import extraction_body, parse_extraction
+
+# Longest chunk taken from extractions without parseable bullets
+MAX_FALLBACK_CHUNK_CHARS = 600
+
+
+def chunk_extraction(extraction, slide_number):
+    """
+    Split an aggregated extraction into section and bullet documents.
+
+    Every data point becomes one document (with its category heading, so it
+    still matches category words), and every category with several data
+    points also becomes one section document. Confidence scores and slide
+    references are dropped from the text; the slide is kept in metadata.
+    Extractions without parseable bullets are split into paragraphs instead.
+
+    Args:
+        extraction: Aggregated extraction markdown
+        slide_number: Slide the extraction belongs to
+
+    Returns:
+        List of Document with "slide_number", "section" and "granularity" metadata
+    """
+    records = parse_extraction(extraction)
+    if not records:
+        body = extraction_body(extraction)
+        paragraphs = [paragraph.strip() for paragraph in body.split("\n\n") if paragraph.strip()]
+        return [
+            Document(
+                page_content=paragraph[:MAX_FALLBACK_CHUNK_CHARS],
+                metadata={"slide_number": slide_number, "section": None, "granularity": "section"},
+            )
+            for paragraph in paragraphs
+        ]
+
+    sections = {}
+    for record in records:
+        sections.setdefault(record.category, []).append(f"- **{record.field}**: {record.value}")
+
+    documents = []
+    for category, bullets in sections.items():
+        metadata = {"slide_number": slide_number, "section": category}
+        if len(bullets) > 1:
+            documents.append(
+                Document(
+                    page_content=f"### {category}\n" + "\n".join(bullets),
+                    metadata={**metadata, "granularity": "section"},
+                )
+            )
+        documents.extend(
+            Document(
+                page_content=f"### {category}\n{bullet}",
+                metadata={**metadata, "granularity": "bullet"},
+            )
+            for bullet in bullets
+        )
+    return documents
+
+
+def format_snippets(documents, max_chars):
+    """
+    Render retrieved chunks as compact, deduplicated snippet lines.
+
+    Lines are kept in ranking order. A data point found on several slides is
+    listed once with all its slides, and lines stop once max_chars is reached.
+
+    Args:
+        documents: Retrieved chunks, best match first
+        max_chars: Size cap for the rendered snippets
+
+    Returns:
+        Tuple of (snippet markdown, number of lines left out by the cap)
+    """
+    # normalized line -> [line text, section, slide numbers]
+    snippets = {}
+    for doc in documents:
+        section = doc.metadata.get("section")
+        for line in doc.page_content.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            snippet = snippets.setdefault(normalize_text(line), [line, section, []])
+            slide_number = doc.metadata.get("slide_number", "?")
+            if slide_number not in snippet[2]:
+                snippet[2].append(slide_number)
+
+    lines = []
+    used = 0
+    for line, section, slide_numbers in snippets.values():
+        slides = ", ".join(str(number) for number in sorted(slide_numbers, key=lambda number: str(number).zfill(6)))
+        label = "Slides" if len(slide_numbers) > 1 else "Slide"
+        text = (line[2:] if line.startswith("- ") else line).replace("**", "")
+        rendered = f"- [{label} {slides}] " + (f"{section} > {text}" if section else text)
+        if lines and used + len(rendered) > max_chars:
+            break
+        lines.append(rendered)
+        used += len(rendered) + 1
+    return "\n".join(lines), len(snippets) - len(lines)
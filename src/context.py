@@ -0,0 +1,84 @@
+# context.py
+import math
+import re
+from .parsing import extraction_body, parse_extraction
+
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9-]{2,}")
+
+STOPWORDS = {
+    "and", "are", "for", "from", "has", "have", "into", "not", "of", "that",
+    "the", "this", "was", "were", "with", "slide", "confidence",
+}
+
+
+def estimate_tokens(text):
+    """Rough token count (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def terms(text):
+    """Lowercased content words of a text."""
+    return {term for term in TERM_PATTERN.findall(text.lower()) if term not in STOPWORDS}
+
+
+def _snippets(extraction):
+    """Compact one-line snippets for the data points of an extraction."""
+    records = parse_extraction(extraction)
+    if records:
+        return [f"- **{record.field}**: {record.value}" for record in records]
+    return [line.strip() for line in extraction_body(extraction).splitlines() if line.strip()]
+
+
+def build_previous_context(slides, current_slide, token_budget):
+    """
+    Select previous-slide data points relevant to the current slide.
+
+    Every data point of every earlier aggregated slide is a candidate. They
+    are ranked by how many content words they share with the current slide's
+    text layer, with more recent slides breaking ties (and deciding alone for
+    image-only slides), and added until the token budget is used up.
+
+    Args:
+        slides: All slides of the document
+        current_slide: Slide being extracted
+        token_budget: Maximum estimated tokens of context
+
+    Returns:
+        Markdown with the selected data points grouped by slide, or "" if none
+    """
+    previous = [
+        slide
+        for slide in slides
+        if slide.slide_number < current_slide.slide_number and slide.aggregated_extraction
+    ]
+    if not previous or token_budget <= 0:
+        return ""
+
+    slide_terms = terms(current_slide.text)
+    candidates = []
+    for slide in previous:
+        distance = current_slide.slide_number - slide.slide_number
+        for position, snippet in enumerate(_snippets(slide.aggregated_extraction)):
+            snippet_terms = terms(snippet)
+            overlap = len(snippet_terms & slide_terms)
+            relevance = overlap / math.sqrt(len(snippet_terms)) if overlap else 0.0
+            candidates.append((relevance, -distance, -position, slide.slide_number, snippet))
+
+    candidates.sort(reverse=True)
+
+    selected = {}
+    used = 0
+    for _, _, position, slide_number, snippet in candidates:
+        cost = estimate_tokens(snippet)
+        if slide_number not in selected:
+            cost += estimate_tokens(f"### Slide {slide_number} Extraction:")
+        if used + cost > token_budget:
+            continue
+        used += cost
+        selected.setdefault(slide_number, []).append((-position, snippet))
+
+    sections = []
+    for slide_number in sorted(selected):
+        snippets = [snippet for _, snippet in sorted(selected[slide_number])]
+        sections.append(f"### Slide {slide_number} Extraction:\n" + "\n".join(snippets))
+    return "\n\n".join(sections)
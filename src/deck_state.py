@@ -0,0 +1,230 @@
+# deck_state.py
+import re
+import threading
+from .parsing import parse_extraction
+
+# Field name keywords that identify the kind of entity a data point names
+ENTITY_FIELD_KEYWORDS = {
+    "drugs": ("drug", "compound", "product", "brand", "asset", "candidate", "molecule"),
+    "trials": ("trial", "study"),
+    "companies": ("company", "sponsor", "partner", "licensee", "licensor", "originator", "manufacturer"),
+    "indications": ("indication", "disease", "condition"),
+}
+
+# Field name parts that describe an attribute of the entity rather than the entity itself
+ATTRIBUTE_FIELD_KEYWORDS = (
+    "phase", "stage", "status", "date", "design", "enrollment", "endpoint",
+    "result", "role", "type", "size", "count", "duration", "population",
+)
+
+TRIAL_ID_PATTERN = re.compile(r"\bNCT\d{8}\b")
+
+# "full name (ABBR)" and "ABBR (full name)"
+DEFINED_ABBREVIATION_PATTERN = re.compile(r"([\w -]{3,80}?)\s+\(([A-Z][A-Za-z0-9]{1,9})\)")
+EXPANDED_ABBREVIATION_PATTERN = re.compile(
+    r"\b([A-Z][A-Z0-9]{1,9})\s+\(((?:[A-Za-z][\w-]*\s+){1,6}[A-Za-z][\w-]*)\)"
+)
+
+ENTITY_KINDS = ("drugs", "trials", "companies", "indications")
+
+# Hedges that models append to uncertain values, e.g. "Merck (approx.)"
+VALUE_HEDGE_PATTERN = re.compile(r"\s*\((?:approx\.?|est\.?)\)")
+
+
+def _clean(value):
+    return VALUE_HEDGE_PATTERN.sub("", value).strip(" .;")
+
+
+def _long_form(preceding, short):
+    """
+    Find the words before "(ABBR)" whose initials spell the abbreviation.
+
+    Hyphenated words count once per part ("progression-free survival" -> PFS).
+
+    Returns:
+        The long form, or None if the initials do not match
+    """
+    letters = [c.lower() for c in short if c.isalpha()]
+    words = preceding.split()
+    for count in range(1, min(len(words), len(letters)) + 1):
+        candidate = words[-count:]
+        initials = [part[0].lower() for word in candidate for part in word.split("-") if part]
+        if initials == letters:
+            return " ".join(candidate)
+    return None
+
+
+def entity_kind(record):
+    """
+    Kind of entity a data point names ("drugs", "trials", ...), or None.
+
+    Args:
+        record: ExtractionRecord
+
+    Returns:
+        One of ENTITY_KINDS, or None for attributes and other data points
+    """
+    field = record.field.lower()
+    if TRIAL_ID_PATTERN.search(record.value):
+        return "trials"
+    if any(keyword in field for keyword in ATTRIBUTE_FIELD_KEYWORDS):
+        return None
+    for kind, keywords in ENTITY_FIELD_KEYWORDS.items():
+        if any(keyword in field for keyword in keywords):
+            return kind
+    return None
+
+
+class DeckState:
+    """
+    Compact, incrementally updated summary of the entities seen so far in a deck.
+
+    Tracks drugs, trials, companies, indications and abbreviations with the
+    slide each was last mentioned on. Rendering keeps only the most frequent
+    and most recent entries per kind, so the summary stays roughly the same
+    size however long the deck is.
+    """
+
+    def __init__(self, max_items=12):
+        """
+        Initialize an empty deck state.
+
+        Args:
+            max_items: Entries rendered per entity kind
+        """
+        self.max_items = max_items
+        # kind -> normalized name -> {"name", "count", "last_slide", "details"}
+        self.entities = {kind: {} for kind in ENTITY_KINDS}
+        self.abbreviations = {}
+        # slide number -> (parsed data points, slide text), to rebuild after a re-run
+        self._slides = {}
+        self._lock = threading.Lock()
+
+    def _add(self, kind, name, slide_number):
+        name = _clean(name)
+        if not name or len(name) > 80:
+            return
+        entry = self.entities[kind].setdefault(
+            name.lower(), {"name": name, "count": 0, "last_slide": slide_number, "details": []}
+        )
+        entry["count"] += 1
+        entry["last_slide"] = max(entry["last_slide"], slide_number)
+
+    def _add_detail(self, entry, detail):
+        detail = _clean(detail)
+        if detail and detail not in entry["details"] and len(entry["details"]) < 2:
+            entry["details"].append(detail)
+
+    def update(self, extraction, slide_number, slide_text=""):
+        """
+        Add the entities of a slide's aggregated extraction.
+
+        A slide that was already added (a speculative re-run) replaces its
+        earlier extraction instead of being counted again.
+
+        Args:
+            extraction: Aggregated extraction markdown
+            slide_number: Slide the extraction belongs to
+            slide_text: Slide text layer, scanned for abbreviation definitions
+        """
+        records = parse_extraction(extraction)
+        with self._lock:
+            replaced = slide_number in self._slides
+            self._slides[slide_number] = (records, slide_text)
+            if not replaced:
+                self._add_slide(records, slide_number, slide_text)
+                return
+            self.entities = {kind: {} for kind in ENTITY_KINDS}
+            self.abbreviations = {}
+            for number in sorted(self._slides):
+                records, text = self._slides[number]
+                self._add_slide(records, number, text)
+
+    def _add_slide(self, records, slide_number, slide_text):
+        """Add a slide's parsed data points. Caller holds the lock."""
+        for record in records:
+            kind = entity_kind(record)
+            if kind == "trials":
+                trial_id = TRIAL_ID_PATTERN.search(record.value)
+                self._add(kind, trial_id.group(0) if trial_id else record.value, slide_number)
+            elif kind is not None:
+                self._add(kind, record.value, slide_number)
+            elif "phase" in record.field.lower() or "stage" in record.field.lower():
+                # Attach development stage to the drugs named on the same slide
+                for entry in self.entities["drugs"].values():
+                    if entry["last_slide"] == slide_number:
+                        self._add_detail(entry, record.value)
+
+        for text in [slide_text] + [f"{r.field}: {r.value}" for r in records]:
+            self._add_abbreviations(text)
+
+    def _add_abbreviations(self, text):
+        for preceding, short in DEFINED_ABBREVIATION_PATTERN.findall(text):
+            long_form = _long_form(preceding, short)
+            if long_form:
+                self.abbreviations.setdefault(short, long_form)
+        for short, long_form in EXPANDED_ABBREVIATION_PATTERN.findall(text):
+            self.abbreviations.setdefault(short, long_form.strip())
+
+    def known_names(self):
+        """
+        Names of all entities and abbreviations seen so far.
+
+        Returns:
+            Dict of lowercased name -> entity kind ("abbreviations" for abbreviations)
+        """
+        with self._lock:
+            names = {
+                key: kind for kind in ENTITY_KINDS for key in self.entities[kind]
+            }
+            names.update({short.lower(): "abbreviations" for short in self.abbreviations})
+        return names
+
+    def render(self, before_slide=None):
+        """
+        Render the deck state as compact markdown for the extraction prompt.
+
+        Args:
+            before_slide: Only summarize slides before this one (speculative
+                          re-runs, when later slides were already added)
+
+        Returns:
+            Markdown summary, or "" if nothing has been seen yet
+        """
+        if before_slide is not None:
+            earlier = DeckState(self.max_items)
+            with self._lock:
+                slides = sorted(
+                    (number, source) for number, source in self._slides.items()
+                    if number < before_slide
+                )
+            for number, (records, slide_text) in slides:
+                earlier._add_slide(records, number, slide_text)
+            return earlier.render()
+
+        with self._lock:
+            lines = []
+            for kind in ENTITY_KINDS:
+                entries = sorted(
+                    self.entities[kind].values(),
+                    key=lambda entry: (entry["count"], entry["last_slide"]),
+                    reverse=True,
+                )[: self.max_items]
+                if not entries:
+                    continue
+                items = []
+                for entry in entries:
+                    detail = f", {'; '.join(entry['details'])}" if entry["details"] else ""
+                    items.append(f"{entry['name']} (slide {entry['last_slide']}{detail})")
+                lines.append(f"- Known {kind}: " + "; ".join(items))
+
+            if self.abbreviations:
+                abbreviations = list(self.abbreviations.items())[-self.max_items:]
+                lines.append(
+                    "- Abbreviations: "
+                    + "; ".join(f"{short} = {long_form}" for short, long_form in abbreviations)
+                )
+
+        if not lines:
+            return ""
+        return "### Deck Summary (entities seen on earlier slides)\n" + "\n".join(lines)
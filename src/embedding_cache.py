@@ -0,0 +1,216 @@
+# embedding_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from .env_utils import get_env
+from .metrics import run_metrics
+from .search_cache import normalize_query
+from .single_flight import SingleFlight
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Batching, caching and deduplicating wrapper around an Embeddings model.
+
+    Texts are looked up in an in-memory LRU, then in an optional SQLite file
+    (pruned to the most recently used entries), and only the misses are sent
+    to the model, in batches. Queries are keyed by their normalized text, so
+    "Pembrolizumab" and "pembrolizumab " share one embedding; documents are
+    keyed by their exact text. Concurrent requests for the same text wait for
+    the one in flight instead of calling the model again.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        model_name,
+        path=None,
+        max_entries=2048,
+        max_disk_entries=50000,
+        batch_size=64,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Underlying Embeddings model
+            model_name: Part of every cache key, so models never share vectors
+            path: SQLite file for persistence (None keeps entries in memory only)
+            max_entries: Vectors kept in memory
+            max_disk_entries: Vectors kept in the SQLite file
+            batch_size: Maximum texts per embed_documents call to the model
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.path = path
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.batch_size = batch_size
+        self._memory = OrderedDict()
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB, used_at REAL)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls, embeddings, model_name):
+        """
+        Wrap embeddings using EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_SIZE and EMBEDDING_BATCH_SIZE.
+
+        An empty EMBEDDING_CACHE_PATH keeps the cache in memory for the current process.
+        """
+        return cls(
+            embeddings,
+            model_name,
+            path=get_env("EMBEDDING_CACHE_PATH", ".cache/embeddings.sqlite") or None,
+            max_entries=int(get_env("EMBEDDING_CACHE_SIZE", 2048)),
+            batch_size=int(get_env("EMBEDDING_BATCH_SIZE", 64)),
+        )
+
+    def _key(self, kind, text):
+        payload = f"{self.model_name}\0{kind}\0{text}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _remember(self, key, vector):
+        """Add a vector to the memory LRU. Caller holds the lock."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, key):
+        """Cached vector for key from memory or disk, or None."""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                return vector
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            vector = np.frombuffer(row[0], dtype=np.float32).tolist()
+            self._db.execute(
+                "UPDATE embeddings SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            self._remember(key, vector)
+            return vector
+
+    def _store(self, items):
+        """Cache (key, vector) pairs in memory and on disk."""
+        with self._lock:
+            for key, vector in items:
+                self._remember(key, vector)
+            if self._db is None:
+                return
+            now = time.time()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+                    for key, vector in items
+                ],
+            )
+            self._writes += len(items)
+            if self._writes >= 1000:
+                # Prune the file back to the most recently used entries
+                self._writes = 0
+                self._db.execute(
+                    "DELETE FROM embeddings WHERE key NOT IN "
+                    "(SELECT key FROM embeddings ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_disk_entries,),
+                )
+            self._db.commit()
+
+    def _embed(self, kind, texts, fetch):
+        """
+        Embed texts through the cache.
+
+        Args:
+            kind: "document" or "query" (part of the cache key)
+            texts: Cache texts (already normalized for queries)
+            fetch: Callable embedding a list of texts with the model
+
+        Returns:
+            List of vectors in the order of texts
+        """
+        keys = [self._key(kind, text) for text in texts]
+        vectors = {}
+        for key in dict.fromkeys(keys):
+            cached = self._load(key)
+            if cached is not None:
+                vectors[key] = cached
+
+        # Claim the misses nobody is embedding yet; wait for the others
+        leading, following = {}, {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in leading or key in following:
+                    continue
+                if key in self._memory:
+                    # Stored by a request that finished since the lookup
+                    vectors[key] = self._memory[key]
+                    continue
+                flight, leader = self._flights.claim(key)
+                if leader:
+                    leading[key] = text
+                else:
+                    following[key] = flight
+
+        run_metrics.increment("embedding.lookups", len(keys))
+        run_metrics.increment(
+            "embedding.cache_hits", len(keys) - len(leading) - len(following)
+        )
+
+        try:
+            items = list(leading.items())
+            for start in range(0, len(items), self.batch_size):
+                batch = items[start:start + self.batch_size]
+                run_metrics.increment("embedding.requests")
+                run_metrics.increment("embedding.texts", len(batch))
+                embedded = fetch([text for _, text in batch])
+                self._store([(key, vector) for (key, _), vector in zip(batch, embedded)])
+                with self._lock:
+                    for (key, _), vector in zip(batch, embedded):
+                        vectors[key] = vector
+                        self._flights.resolve(key, vector)
+        except Exception as e:
+            with self._lock:
+                for key in leading:
+                    if key not in vectors:
+                        self._flights.fail(key, e)
+            raise
+
+        for key, flight in following.items():
+            vectors[key] = flight.wait()
+            run_metrics.increment("embedding.coalesced")
+
+        return [vectors[key] for key in keys]
+
+    def embed_documents(self, texts):
+        return self._embed("document", list(texts), self.embeddings.embed_documents)
+
+    def embed_query(self, text):
+        return self._embed(
+            "query",
+            [normalize_query(text) or text],
+            lambda _: [self.embeddings.embed_query(text)],
+        )[0]
@@ -2,38 +2,112 @@ from langgraph.graph import END, StateGraph
 from .state import GraphState
 from .nodes import Nodes
 
+# Supported ways of scheduling slide and model extraction
+EXECUTION_MODES = ("sequential", "parallel_models", "parallel_slides", "speculative")
+
+# Supported kinds of previous-slide context in extraction prompts
+CONTEXT_MODES = ("relevant", "summary")
+
+# Supported ways of combining several models' extractions of a slide
+AGGREGATION_STRATEGIES = ("llm", "local")
+
 
 class PharmDataWorkflow:
-    def __init__(self, active_models=None, aggregator_model=None):
+    def __init__(
+        self,
+        active_models=None,
+        aggregator_model=None,
+        model_budget=None,
+        slide_budget=None,
+        execution_mode="sequential",
+        max_workers=4,
+        resilience_policy=None,
+        hedging_policy=None,
+        quorum_policy=None,
+        cascade_policy=None,
+        agreement_threshold=None,
+        aggregation_strategy="llm",
+        compact_aggregation=False,
+        context_token_budget=800,
+        context_mode="relevant",
+        schema_routing=False,
+    ):
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unsupported execution mode: {execution_mode}")
+        if aggregation_strategy not in AGGREGATION_STRATEGIES:
+            raise ValueError(f"Unsupported aggregation strategy: {aggregation_strategy}")
+        if context_mode not in CONTEXT_MODES:
+            raise ValueError(f"Unsupported context mode: {context_mode}")
+
         # Initialize graph state & nodes with model configuration
         workflow = StateGraph(GraphState)
-        nodes = Nodes(active_models, aggregator_model)
+        nodes = Nodes(
+            active_models,
+            aggregator_model,
+            model_budget=model_budget,
+            slide_budget=slide_budget,
+            execution_mode=execution_mode,
+            max_workers=max_workers,
+            resilience_policy=resilience_policy,
+            hedging_policy=hedging_policy,
+            quorum_policy=quorum_policy,
+            cascade_policy=cascade_policy,
+            agreement_threshold=agreement_threshold,
+            aggregation_strategy=aggregation_strategy,
+            compact_aggregation=compact_aggregation,
+            context_token_budget=context_token_budget,
+            context_mode=context_mode,
+            schema_routing=schema_routing,
+        )
 
         # Define graph nodes - add new aggregation node
         workflow.add_node("load_document", nodes.load_document)
         workflow.add_node("extract_document_metadata", nodes.extract_document_metadata)
-        workflow.add_node("process_next_slide", nodes.process_next_slide)
-        workflow.add_node("extract_pharma_data", nodes.extract_pharma_data)
-        workflow.add_node("aggregate_extractions", nodes.aggregate_extractions)  # New node
-        workflow.add_node("check_processing_complete", nodes.check_processing_complete)
         workflow.add_node("export_results", nodes.export_results)
 
+        # Slides aggregated before all models finished are re-aggregated before export
+        finish_node = "export_results"
+        if quorum_policy is not None and quorum_policy.late_results == "reaggregate":
+            finish_node = "reaggregate_late_extractions"
+            workflow.add_node(finish_node, nodes.reaggregate_late_extractions)
+            workflow.add_edge(finish_node, "export_results")
+
         # Entry point
         workflow.set_entry_point("load_document")
-
-        # Define workflow edges - modified to include aggregation
         workflow.add_edge("load_document", "extract_document_metadata")
-        workflow.add_edge("extract_document_metadata", "process_next_slide")
-        workflow.add_edge("process_next_slide", "extract_pharma_data")
-        workflow.add_edge("extract_pharma_data", "aggregate_extractions")  # Updated
-        workflow.add_edge("aggregate_extractions", "check_processing_complete")  # Updated
-
-        # Conditional routing for completion (unchanged)
-        workflow.add_conditional_edges(
-            "check_processing_complete",
-            nodes.is_processing_complete,
-            {"next_slide": "process_next_slide", "complete": "export_results"},
-        )
+
+        if execution_mode == "parallel_slides":
+            # All slides are extracted and aggregated concurrently in one node
+            workflow.add_node("extract_all_slides", nodes.extract_all_slides)
+            workflow.add_edge("extract_document_metadata", "extract_all_slides")
+            workflow.add_edge("extract_all_slides", finish_node)
+        elif execution_mode == "speculative":
+            # Concurrent extraction, then re-runs of slides that depend on earlier ones
+            workflow.add_node("extract_all_slides", nodes.extract_all_slides)
+            workflow.add_node(
+                "reconcile_speculative_slides", nodes.reconcile_speculative_slides
+            )
+            workflow.add_edge("extract_document_metadata", "extract_all_slides")
+            workflow.add_edge("extract_all_slides", "reconcile_speculative_slides")
+            workflow.add_edge("reconcile_speculative_slides", finish_node)
+        else:
+            workflow.add_node("process_next_slide", nodes.process_next_slide)
+            workflow.add_node("extract_pharma_data", nodes.extract_pharma_data)
+            workflow.add_node("aggregate_extractions", nodes.aggregate_extractions)  # New node
+            workflow.add_node("check_processing_complete", nodes.check_processing_complete)
+
+            # Define workflow edges - modified to include aggregation
+            workflow.add_edge("extract_document_metadata", "process_next_slide")
+            workflow.add_edge("process_next_slide", "extract_pharma_data")
+            workflow.add_edge("extract_pharma_data", "aggregate_extractions")  # Updated
+            workflow.add_edge("aggregate_extractions", "check_processing_complete")  # Updated
+
+            # Conditional routing for completion (unchanged)
+            workflow.add_conditional_edges(
+                "check_processing_complete",
+                nodes.is_processing_complete,
+                {"next_slide": "process_next_slide", "complete": finish_node},
+            )
 
         workflow.add_edge("export_results", END)
 
@@ -41,4 +115,5 @@ class PharmDataWorkflow:
         self.app = workflow.compile()
         
         # Store active models for later reference
-        self.active_models = active_models
\ No newline at end of file
+        self.active_models = active_models
+        self.execution_mode = execution_mode
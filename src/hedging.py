@@ -0,0 +1,177 @@
+# hedging.py
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Optional
+from pydantic import BaseModel
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from colorama import Fore, Style
+from .metrics import run_metrics, percentile
+
+
+class HedgingPolicy(BaseModel):
+    """When to fire a duplicate (hedged) extraction request."""
+
+    # Hedge once a call runs longer than this percentile of the model's recent latency
+    percentile: float = 95
+    # Latency samples needed before the percentile is trusted
+    min_samples: int = 5
+    # Hedge delay in seconds while there are fewer than min_samples (None: don't hedge yet)
+    initial_delay: Optional[float] = None
+    # Recent latencies kept per model
+    window: int = 50
+    # Upper bound on the fraction of a model's calls that get hedged
+    max_hedge_rate: float = 0.25
+    # Model name -> model to use for its hedge (default: the same model)
+    backup_models: Dict[str, str] = {}
+    # Hedges in flight at once, across all models. A cancelled loser holds its
+    # slot until its current model request returns (at most HTTP_TIMEOUT);
+    # while every slot is taken, slow calls are not hedged
+    max_concurrent_hedges: int = 4
+
+
+class Hedger:
+    """
+    Runs extraction calls with hedging to cut tail latency.
+
+    The primary call starts immediately. If it has not finished after the
+    model's hedge delay, a duplicate goes to the same model (or its backup);
+    the first successful result wins and the other call is cancelled through
+    its BudgetTracker.
+
+    Hedges run on an executor of their own with policy.max_concurrent_hedges
+    workers, so losers that are still finishing a model request cannot pile
+    up behind primary calls or grow without bound.
+    """
+
+    def __init__(self, policy: Optional[HedgingPolicy] = None, max_workers=32):
+        self.policy = policy or HedgingPolicy()
+        self._executor = ContextThreadPoolExecutor(max_workers=max_workers)
+        self._hedge_executor = ContextThreadPoolExecutor(
+            max_workers=self.policy.max_concurrent_hedges
+        )
+        self._hedge_slots = threading.BoundedSemaphore(self.policy.max_concurrent_hedges)
+        self._latencies = {}
+        self._calls = {}
+        self._hedges = {}
+        self._lock = threading.Lock()
+
+    def record_latency(self, model_name, seconds):
+        with self._lock:
+            if model_name not in self._latencies:
+                self._latencies[model_name] = deque(maxlen=self.policy.window)
+            self._latencies[model_name].append(seconds)
+
+    def hedge_delay(self, model_name):
+        """
+        Seconds to wait for the primary call before hedging.
+
+        Returns:
+            Delay in seconds, or None if this call should not be hedged
+        """
+        policy = self.policy
+        with self._lock:
+            samples = list(self._latencies.get(model_name, ()))
+            calls = self._calls.get(model_name, 0)
+            hedges = self._hedges.get(model_name, 0)
+
+        if calls and hedges / calls >= policy.max_hedge_rate:
+            return None
+        if len(samples) < policy.min_samples:
+            return policy.initial_delay
+        return percentile(samples, policy.percentile)
+
+    def call(self, model_name, make_budget, run_attempt):
+        """
+        Run an extraction with hedging.
+
+        Args:
+            model_name: Primary model
+            make_budget: Callable(model_name) -> BudgetTracker for one attempt
+            run_attempt: Callable(model_name, budget) -> extraction result
+
+        Returns:
+            Result of whichever attempt succeeds first
+
+        Raises:
+            Exception: The primary attempt's error if every attempt fails
+        """
+        with self._lock:
+            self._calls[model_name] = self._calls.get(model_name, 0) + 1
+        run_metrics.increment(f"hedging.calls.{model_name}")
+
+        delay = self.hedge_delay(model_name)
+        started_at = time.monotonic()
+        primary_budget = make_budget(model_name)
+        primary = self._executor.submit(run_attempt, model_name, primary_budget)
+
+        def record_primary(future):
+            if not primary_budget.cancelled and future.exception() is None:
+                self.record_latency(model_name, time.monotonic() - started_at)
+
+        primary.add_done_callback(record_primary)
+
+        if delay is None:
+            return primary.result()
+
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        if not self._hedge_slots.acquire(blocking=False):
+            # Every hedge slot is held by a running hedge (or a cancelled loser)
+            run_metrics.increment(f"hedging.saturated.{model_name}")
+            return primary.result()
+
+        backup_model = self.policy.backup_models.get(model_name, model_name)
+        print(
+            Fore.YELLOW
+            + f"[HEDGE] {model_name} slower than {delay:.1f}s, hedging with {backup_model}"
+            + Style.RESET_ALL
+        )
+        with self._lock:
+            self._hedges[model_name] = self._hedges.get(model_name, 0) + 1
+        run_metrics.increment(f"hedging.hedged.{model_name}")
+
+        hedge_budget = make_budget(backup_model)
+        hedge = self._hedge_executor.submit(run_attempt, backup_model, hedge_budget)
+        hedge.add_done_callback(lambda _: self._hedge_slots.release())
+        budgets = {primary: primary_budget, hedge: hedge_budget}
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    continue
+
+                # Cancel the loser; its thread stops at its next checkpoint
+                for other in pending:
+                    budgets[other].cancel()
+                if future is hedge:
+                    run_metrics.increment(f"hedging.wins.{model_name}")
+                    # The primary took at least this long; recording the lower bound
+                    # keeps cancelled slow calls from dragging the percentile down
+                    self.record_latency(model_name, time.monotonic() - started_at)
+                return future.result()
+
+        raise primary.exception()
+
+    def report(self):
+        """Print per-model hedge rate and hedge win rate for the current run."""
+        counters = run_metrics.snapshot()["counters"]
+        prefix = "hedging.calls."
+        for name, calls in sorted(counters.items()):
+            if not name.startswith(prefix):
+                continue
+            model_name = name[len(prefix):]
+            hedged = counters.get(f"hedging.hedged.{model_name}", 0)
+            wins = counters.get(f"hedging.wins.{model_name}", 0)
+            saturated = counters.get(f"hedging.saturated.{model_name}", 0)
+            win_rate = f"{wins / hedged:.0%}" if hedged else "-"
+            print(
+                f"  Hedging {model_name}: {hedged}/{calls} calls hedged "
+                f"({hedged / calls:.0%}), hedge win rate {win_rate}, "
+                f"{saturated} not hedged (all hedge slots busy)"
+            )
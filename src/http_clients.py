@@ -0,0 +1,121 @@
+# http_clients.py
+import importlib.util
+import threading
+import weakref
+import httpx
+from colorama import Fore, Style
+from .env_utils import get_env
+from .metrics import run_metrics
+
+_lock = threading.Lock()
+_http_client = None
+_async_http_client = None
+_google_clients = {}
+
+# Network streams (connections) that have already served a request
+_seen_streams = weakref.WeakSet()
+
+
+def _http2_enabled():
+    """HTTP/2 is used when requested (default: auto) and the h2 package is installed."""
+    setting = get_env("HTTP2", "auto").lower()
+    if setting in ("0", "false", "no", "off"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_limits():
+    return httpx.Limits(
+        max_connections=int(get_env("HTTP_MAX_CONNECTIONS", 100)),
+        max_keepalive_connections=int(get_env("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)),
+        keepalive_expiry=float(get_env("HTTP_KEEPALIVE_EXPIRY", 30)),
+    )
+
+
+def _record_response(response):
+    """Count requests and whether they opened a new connection or reused one."""
+    run_metrics.increment("http.requests")
+    stream = response.extensions.get("network_stream")
+    if stream is None:
+        return
+    if stream in _seen_streams:
+        run_metrics.increment("http.connections_reused")
+    else:
+        _seen_streams.add(stream)
+        run_metrics.increment("http.connections_opened")
+
+
+async def _record_response_async(response):
+    _record_response(response)
+
+
+def get_http_client():
+    """
+    Shared keep-alive HTTP client for all synchronous provider and tool calls.
+
+    Pool sizes come from HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS and
+    HTTP_KEEPALIVE_EXPIRY; per-request timeouts are set by the SDKs themselves.
+
+    Returns:
+        httpx.Client
+    """
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            http2 = _http2_enabled()
+            _http_client = httpx.Client(
+                http2=http2,
+                limits=_pool_limits(),
+                timeout=float(get_env("HTTP_TIMEOUT", 600)),
+                event_hooks={"response": [_record_response]},
+            )
+            print(
+                Fore.GREEN
+                + f"Initialized shared HTTP client pool (HTTP/2: {http2})"
+                + Style.RESET_ALL
+            )
+        return _http_client
+
+
+def get_async_http_client():
+    """
+    Shared keep-alive HTTP client for asynchronous provider calls.
+
+    Returns:
+        httpx.AsyncClient
+    """
+    global _async_http_client
+    with _lock:
+        if _async_http_client is None:
+            _async_http_client = httpx.AsyncClient(
+                http2=_http2_enabled(),
+                limits=_pool_limits(),
+                timeout=float(get_env("HTTP_TIMEOUT", 600)),
+                event_hooks={"response": [_record_response_async]},
+            )
+        return _async_http_client
+
+
+def share_google_client(model):
+    """
+    Make a ChatGoogleGenerativeAI instance reuse a shared gRPC client.
+
+    Gemini models talk gRPC rather than httpx; sharing the generative service
+    client across models shares its HTTP/2 channel and keep-alive connections.
+
+    Args:
+        model: ChatGoogleGenerativeAI instance
+
+    Returns:
+        The same model instance, using the shared client
+    """
+    api_key = model.google_api_key
+    if hasattr(api_key, "get_secret_value"):
+        api_key = api_key.get_secret_value()
+    key = (api_key, model.transport)
+    with _lock:
+        shared_client = _google_clients.setdefault(key, model.client)
+    if model.client is not shared_client:
+        model.client = shared_client
+        run_metrics.increment("grpc.clients_shared")
+    return model
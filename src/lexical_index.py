@@ -0,0 +1,279 @@
+# lexical_index.py
+import math
+import re
+import threading
+from collections import Counter
+from colorama import Fore, Style
+from .aggregation import normalize_text
+from .context import STOPWORDS
+from .deck_state import TRIAL_ID_PATTERN, VALUE_HEDGE_PATTERN, entity_kind
+from .parsing import parse_extraction
+
+# Ranking bonus for documents naming an entity the query names exactly, so
+# they come before documents that only share words with it
+ENTITY_MATCH_BOOST = 100.0
+
+# Longest entity name (in tokens) matched inside a query
+MAX_ENTITY_TOKENS = 6
+
+# Splits values naming several entities or aliases ("A (B)", "A / B", "A; B")
+NAME_SEPARATOR_PATTERN = re.compile(r"[();,/]")
+
+
+def tokenize(text):
+    """Normalized word and number tokens of a text, without stopwords."""
+    return [token for token in normalize_text(text).split() if token not in STOPWORDS]
+
+
+def entity_names(text):
+    """
+    Normalized names of the drugs, trials, companies and indications in an extraction.
+
+    Args:
+        text: Extraction markdown
+
+    Returns:
+        Set of normalized names (trial IDs on their own as well)
+    """
+    names = set(normalize_text(trial_id) for trial_id in TRIAL_ID_PATTERN.findall(text))
+    for record in parse_extraction(text):
+        if entity_kind(record) is None:
+            continue
+        value = VALUE_HEDGE_PATTERN.sub("", record.value)
+        # "Pembrolizumab (Keytruda)" is found by either name as well as both
+        for variant in [value] + NAME_SEPARATOR_PATTERN.split(value):
+            name = normalize_text(variant)
+            if name and len(name.split()) <= MAX_ENTITY_TOKENS:
+                names.add(name)
+    return names
+
+
+class LexicalIndex:
+    """
+    Incremental BM25 index plus an exact entity-name index, no embeddings.
+
+    Each added document updates a term -> {document: term frequency}
+    inverted index and an entity name -> documents hash index. A query
+    scores only the documents sharing a term with it (BM25), and documents
+    naming an entity that appears verbatim (after normalization) in the
+    query rank first. Works offline and answers in microseconds.
+
+    Exposes the same add_documents / similarity_search / delete_slide
+    interface as VectorIndex.
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents = []
+        self._lengths = []
+        self._total_length = 0
+        self._postings = {}
+        self._entities = {}
+        # Documents removed by delete_slide (their IDs are not reused)
+        self._deleted = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents) - len(self._deleted)
+
+    def add_documents(self, documents):
+        """
+        Index documents.
+
+        Args:
+            documents: List of Document with an optional "slide_number" metadata entry
+        """
+        indexed = [
+            (doc, Counter(tokenize(doc.page_content)), entity_names(doc.page_content))
+            for doc in documents
+        ]
+        with self._lock:
+            for doc, counts, names in indexed:
+                doc_id = len(self._documents)
+                self._documents.append(doc)
+                self._lengths.append(sum(counts.values()))
+                self._total_length += self._lengths[-1]
+                for term, count in counts.items():
+                    self._postings.setdefault(term, {})[doc_id] = count
+                for name in names:
+                    self._entities.setdefault(name, set()).add(doc_id)
+
+    def delete_slide(self, slide_number):
+        """Remove the documents of a slide (before it is indexed again)."""
+        with self._lock:
+            for doc_id, doc in enumerate(self._documents):
+                if doc_id in self._deleted or doc.metadata.get("slide_number") != slide_number:
+                    continue
+                self._deleted.add(doc_id)
+                self._total_length -= self._lengths[doc_id]
+                for term in set(tokenize(doc.page_content)):
+                    postings = self._postings.get(term, {})
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        self._postings.pop(term, None)
+                for name in entity_names(doc.page_content):
+                    self._entities.get(name, set()).discard(doc_id)
+
+    def _entity_matches(self, tokens):
+        """Documents naming an entity whose normalized name appears in the query tokens."""
+        matches = Counter()
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(len(tokens), start + MAX_ENTITY_TOKENS) + 1):
+                for doc_id in self._entities.get(" ".join(tokens[start:end]), ()):
+                    matches[doc_id] += 1
+        return matches
+
+    def similarity_search(self, query, k=4, before_slide=None):
+        """
+        Return the k documents that best match the query.
+
+        Args:
+            query: Query text
+            k: Number of documents to return
+            before_slide: Only consider documents from slides before this one
+
+        Returns:
+            List of Document, best match first
+        """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, before_slide)]
+
+    def similarity_search_with_score(self, query, k=4, before_slide=None):
+        """Like similarity_search, but returns (Document, score) pairs."""
+        tokens = normalize_text(query).split()
+        with self._lock:
+            count = len(self._documents) - len(self._deleted)
+            if count == 0 or k <= 0:
+                return []
+            average_length = self._total_length / count
+            scores = Counter()
+            for term in set(tokens) - STOPWORDS:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                    scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+            for doc_id, matched in self._entity_matches(tokens).items():
+                scores[doc_id] += ENTITY_MATCH_BOOST * matched
+            documents = self._documents
+
+        ranked = [
+            (documents[doc_id], score)
+            for doc_id, score in scores.most_common()
+            if before_slide is None
+            or documents[doc_id].metadata.get("slide_number", -1) < before_slide
+        ]
+        return ranked[:k]
+
+
+class HybridIndex:
+    """
+    Lexical index blended with a vector index by reciprocal rank fusion.
+
+    The lexical side answers every query; the vector index is built on the
+    first search (so runs that never search need no embeddings client) and
+    is dropped for the rest of the run if embedding fails, e.g. offline.
+    """
+
+    def __init__(self, vector_factory, rank_constant=60):
+        """
+        Initialize an empty index.
+
+        Args:
+            vector_factory: Callable with no arguments that builds an empty VectorIndex
+            rank_constant: Reciprocal rank fusion constant (higher flattens ranks)
+        """
+        self.lexical = LexicalIndex()
+        self.vector_factory = vector_factory
+        self.rank_constant = rank_constant
+        self._vector = None
+        self._vector_failed = False
+        self._documents = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.lexical)
+
+    def add_documents(self, documents):
+        self.lexical.add_documents(documents)
+        with self._lock:
+            self._documents.extend(documents)
+            vector = self._vector
+        if vector is not None:
+            vector.add_documents(documents)
+
+    def delete_slide(self, slide_number):
+        """Remove the documents of a slide (before it is indexed again)."""
+        self.lexical.delete_slide(slide_number)
+        with self._lock:
+            self._documents = [
+                doc for doc in self._documents
+                if doc.metadata.get("slide_number") != slide_number
+            ]
+            vector = self._vector
+        if vector is not None:
+            vector.delete_slide(slide_number)
+
+    def _vector_index(self):
+        """The vector index, built on first use; None once embedding has failed."""
+        with self._lock:
+            if self._vector is None and not self._vector_failed:
+                try:
+                    self._vector = self.vector_factory()
+                    self._vector.add_documents(list(self._documents))
+                except Exception as e:
+                    self._disable_vector(e)
+            return self._vector
+
+    def _disable_vector(self, error):
+        """Fall back to lexical search only. Caller holds the lock."""
+        self._vector = None
+        self._vector_failed = True
+        print(
+            Fore.YELLOW
+            + f"Vector lookup unavailable, using lexical search only: {error}"
+            + Style.RESET_ALL
+        )
+
+    def similarity_search(self, query, k=4, before_slide=None):
+        """
+        Return the k documents ranked best by lexical and vector search combined.
+
+        Args:
+            query: Query text
+            k: Number of documents to return
+            before_slide: Only consider documents from slides before this one
+
+        Returns:
+            List of Document, best match first
+        """
+        lexical = self.lexical.similarity_search_with_score(query, 2 * k, before_slide)
+        rankings = [[doc for doc, _ in lexical]]
+        vector = self._vector_index()
+        if vector is not None:
+            try:
+                rankings.append(vector.similarity_search(query, 2 * k, before_slide))
+            except Exception as e:
+                with self._lock:
+                    self._disable_vector(e)
+
+        fused = {}
+        for ranking in rankings:
+            for rank, doc in enumerate(ranking):
+                entry = fused.setdefault(id(doc), [doc, 0.0])
+                entry[1] += 1 / (self.rank_constant + rank + 1)
+        # Exact entity matches outrank anything found by similarity alone
+        for doc, score in lexical:
+            if score >= ENTITY_MATCH_BOOST:
+                fused[id(doc)][1] += 1.0
+        ranked = sorted(fused.values(), key=lambda entry: entry[1], reverse=True)
+        return [doc for doc, _ in ranked[:k]]
@@ -0,0 +1,212 @@
+# metrics.py
+import math
+import threading
+import time
+from collections import defaultdict
+from colorama import Fore, Style
+from .env_utils import get_env
+from .vector_stores import VectorStorePool
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a list of numbers.
+
+    Args:
+        values: List of numbers
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunMetrics:
+    """
+    Thread-safe counters and timings for a single extraction run.
+
+    Counters are free-form names (e.g., "search.cache_hit"); timings collect
+    samples in seconds; slide latencies are recorded once per finished slide.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all metrics and restart the run clock."""
+        with self._lock:
+            self.started_at = time.monotonic()
+            self.first_result_at = None
+            self.counters = defaultdict(int)
+            self.timings = defaultdict(list)
+            self.slide_latencies = {}
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name, seconds):
+        with self._lock:
+            self.timings[name].append(seconds)
+
+    def record_slide(self, slide_number, seconds):
+        """Record the end-to-end latency of a finished slide."""
+        with self._lock:
+            self.slide_latencies[slide_number] = seconds
+            if self.first_result_at is None:
+                self.first_result_at = time.monotonic()
+
+    def snapshot(self):
+        """
+        Summarize the run so far.
+
+        Returns:
+            Dict with slide latency percentiles, time to first result, counters
+            and timing summaries
+        """
+        with self._lock:
+            latencies = list(self.slide_latencies.values())
+            timings = {name: list(samples) for name, samples in self.timings.items()}
+            counters = dict(self.counters)
+            elapsed = time.monotonic() - self.started_at
+            first_result = (
+                self.first_result_at - self.started_at
+                if self.first_result_at is not None
+                else None
+            )
+
+        return {
+            "elapsed_seconds": elapsed,
+            "slides_completed": len(latencies),
+            "time_to_first_result_seconds": first_result,
+            "slide_latency_seconds": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies) if latencies else None,
+            },
+            "counters": counters,
+            "timings": {
+                name: {
+                    "count": len(samples),
+                    "total": sum(samples),
+                    "p50": percentile(samples, 50),
+                    "p95": percentile(samples, 95),
+                }
+                for name, samples in timings.items()
+            },
+        }
+
+    def report(self):
+        """Print a short human-readable summary of the run."""
+        snapshot = self.snapshot()
+        latency = snapshot["slide_latency_seconds"]
+        print(Fore.MAGENTA + "Run metrics:" + Style.RESET_ALL)
+        print(
+            f"  Slides completed: {snapshot['slides_completed']} "
+            f"in {snapshot['elapsed_seconds']:.1f}s"
+        )
+        if latency["p50"] is not None:
+            print(
+                f"  Slide latency p50/p95/p99: {latency['p50']:.2f}s / "
+                f"{latency['p95']:.2f}s / {latency['p99']:.2f}s"
+            )
+        counters = snapshot["counters"]
+        if counters.get("aggregation.slides"):
+            skipped = counters.get("aggregation.skipped_agreement", 0)
+            print(
+                f"  Aggregator calls skipped on agreement: {skipped}/"
+                f"{counters['aggregation.slides']} "
+                f"({skipped / counters['aggregation.slides']:.0%})"
+            )
+        if counters.get("search_cache.lookups"):
+            saved = snapshot["timings"].get("search_cache.saved", {"total": 0.0})
+            served = counters.get("search_cache.hits", 0) + counters.get(
+                "search_cache.coalesced", 0
+            )
+            print(
+                f"  Search cache hit rate: {served}/{counters['search_cache.lookups']} "
+                f"({served / counters['search_cache.lookups']:.0%}), "
+                f"saved {saved['total']:.1f}s of search latency"
+            )
+        if counters.get("embedding.lookups"):
+            served = counters.get("embedding.cache_hits", 0) + counters.get(
+                "embedding.coalesced", 0
+            )
+            print(
+                f"  Embedding API calls: {counters.get('embedding.requests', 0)} for "
+                f"{counters.get('embedding.texts', 0)} texts "
+                f"({served}/{counters['embedding.lookups']} served from cache)"
+            )
+        if counters.get("tool_memo.calls"):
+            saved = snapshot["timings"].get("tool_memo.saved", {"total": 0.0})
+            reused = counters.get("tool_memo.reused", 0)
+            print(
+                f"  Tool calls shared across models: {reused}/"
+                f"{counters['tool_memo.calls']} "
+                f"({reused / counters['tool_memo.calls']:.0%}), "
+                f"saved {saved['total']:.1f}s of tool latency"
+            )
+        for name, value in sorted(snapshot["counters"].items()):
+            print(f"  {name}: {value}")
+        for name, summary in sorted(snapshot["timings"].items()):
+            print(
+                f"  {name}: {summary['count']} samples, total {summary['total']:.2f}s, "
+                f"p50 {summary['p50']:.3f}s"
+            )
+
+
+class RunScopedMetrics:
+    """
+    The RunMetrics of the run in the current context.
+
+    Runs are told apart by the same namespace (run ID) as the lookup_previous
+    vector stores, so concurrent runs on one graph keep separate metrics.
+    Metrics outlive their run until evicted (VECTOR_STORE_MAX_RUNS), so they
+    can still be read after the graph returns.
+    """
+
+    def __init__(self, max_runs=8):
+        self._runs = VectorStorePool(RunMetrics, max_namespaces=max_runs, label="run metrics")
+
+    def for_run(self, run_id=None):
+        """
+        RunMetrics of a run.
+
+        Args:
+            run_id: Run ID (defaults to the current context's run)
+
+        Returns:
+            RunMetrics
+        """
+        return self._runs.get(run_id)
+
+    def reset(self, run_id=None):
+        """Start fresh metrics for a run (defaults to the current context's run)."""
+        self._runs.drop(run_id)
+        self._runs.get(run_id)
+
+    def increment(self, name, value=1):
+        self.for_run().increment(name, value)
+
+    def observe(self, name, seconds):
+        self.for_run().observe(name, seconds)
+
+    def record_slide(self, slide_number, seconds):
+        self.for_run().record_slide(slide_number, seconds)
+
+    def snapshot(self):
+        return self.for_run().snapshot()
+
+    def report(self):
+        self.for_run().report()
+
+
+# Metrics of the current run
+run_metrics = RunScopedMetrics(max_runs=int(get_env("VECTOR_STORE_MAX_RUNS", 8)))
@@ -2,27 +2,144 @@ from colorama import Fore, Style
 from .agents import Agents
 from .utils import PDFToolsClass
 from .state import GraphState, DocumentMetadata, ModelExtraction
-from .tools import update_vector_store
+from .tools import update_vector_store, release_vector_store
+from .vector_stores import VectorStorePool, run_scoped, use_slide
+from .env_utils import get_env
+from .metrics import run_metrics
+from .resilience import CircuitOpenError
+from .budgets import ExtractionCancelled
+from .quorum import wait_for_quorum
+from .cascade import score_extraction
+from .context import build_previous_context, estimate_tokens
+from .deck_state import DeckState
+from .schema_router import render_schema_slice
+from .speculative import find_unresolved_slides, neighbour_context
+from .tool_memo import ToolMemo, tool_memo_scope
+from .aggregation import (
+    compact_extractions,
+    extraction_agreement,
+    merge_extractions,
+    most_complete_extraction,
+    splice_aggregation,
+    summarize_agreed,
+)
 from .prompts import (
     PHARMA_EXTRACTION_USER_PROMPT_TEMPLATE,
     SLIDE_METADATA_EXTRACTION_PROMPT,
-    PHARMA_EXTRACTION_SYSTEM_PROMPT,
+    AGGREGATION_USER_PROMPT_TEMPLATE,
+    AGGREGATION_DIFF_USER_PROMPT_TEMPLATE,
+    SCHEMA_SLICE_PROMPT_TEMPLATE,
 )
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 import os
+import time
+import uuid
+
+
+class RunState:
+    """Bookkeeping of one run (document) on a Nodes instance."""
+
+    def __init__(self):
+        self.deck_state = DeckState()
+        # Tool results shared by all models on the document (search, check_schema)
+        self.tool_memo = ToolMemo()
+        # Start times of slides currently being processed, for latency metrics
+        self.slide_started_at = {}
+        # Slide number -> futures of models that missed the quorum (reaggregate policy)
+        self.late_extractions = {}
 
 
 class Nodes:
-    def __init__(self, active_models=None, aggregator_model=None):
-        self.agents = Agents(active_models, aggregator_model)
+    def __init__(
+        self,
+        active_models=None,
+        aggregator_model=None,
+        model_budget=None,
+        slide_budget=None,
+        execution_mode="sequential",
+        max_workers=4,
+        resilience_policy=None,
+        hedging_policy=None,
+        quorum_policy=None,
+        cascade_policy=None,
+        agreement_threshold=None,
+        aggregation_strategy="llm",
+        compact_aggregation=False,
+        context_token_budget=800,
+        context_mode="relevant",
+        schema_routing=False,
+    ):
+        self.agents = Agents(
+            active_models,
+            aggregator_model,
+            model_budget=model_budget,
+            slide_budget=slide_budget,
+            resilience_policy=resilience_policy,
+            hedging_policy=hedging_policy,
+            schema_routing=schema_routing,
+        )
         self.pdf_tools = PDFToolsClass()
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.quorum_policy = quorum_policy
+        self.cascade_policy = cascade_policy
+        # Skip the aggregator when model extractions agree at least this much (None: never)
+        self.agreement_threshold = agreement_threshold
+        # "llm" asks the aggregator model, "local" merges data points field by field
+        self.aggregation_strategy = aggregation_strategy
+        # Send the aggregator only the data points the models disagree on
+        self.compact_aggregation = compact_aggregation
+        # Maximum estimated tokens of previous-slide context per extraction prompt
+        self.context_token_budget = context_token_budget
+        # "relevant": ranked previous-slide data points, "summary": rolling deck summary
+        self.context_mode = context_mode
+        # Put only the slide's relevant schema tables in the extraction prompt
+        self.schema_routing = schema_routing
+        # Per-run bookkeeping, kept apart like the lookup_previous vector
+        # stores so concurrent runs on a shared instance never mix
+        self._runs = VectorStorePool(
+            RunState,
+            max_namespaces=int(get_env("VECTOR_STORE_MAX_RUNS", 8)),
+            label="run state",
+        )
+        if quorum_policy is not None:
+            # Long-lived so that models missing the quorum can keep running
+            self._model_executor = ContextThreadPoolExecutor(
+                max_workers=max(1, len(self.agents.active_models)) * max(1, max_workers)
+            )
+
+    @property
+    def _run(self):
+        """RunState of the run in the current context (see run_scoped)."""
+        return self._runs.get()
 
-    def load_document(self, state: GraphState) -> GraphState:
+    @property
+    def deck_state(self):
+        """Deck summary of the run in the current context."""
+        return self._run.deck_state
+
+    def load_document(self, state: GraphState, config: RunnableConfig) -> GraphState:
         """Load PDF document and extract metadata."""
         print(Fore.YELLOW + "Loading document..." + Style.RESET_ALL)
 
         # Get the PDF path from the state
         pdf_path = state.get("pdf_path", "")
 
+        # Scope the lookup_previous vector store to this run: an explicit
+        # run_id, else the LangGraph thread ID, else a fresh ID
+        run_id = (
+            state.get("run_id")
+            or config.get("configurable", {}).get("thread_id")
+            or uuid.uuid4().hex
+        )
+        # A thread re-running a document starts from an empty store and state
+        release_vector_store(run_id)
+        self._runs.drop(str(run_id))
+
+        # Start a fresh metrics run for this document
+        run_metrics.reset(str(run_id))
+
         slides = self.pdf_tools.process_pdf(pdf_path)
 
         return {
@@ -30,8 +147,10 @@ class Nodes:
             "slides": slides,
             "extracted_data": [],
             "processing_complete": False if slides else True,
+            "run_id": str(run_id),
         }
 
+    @run_scoped
     def extract_document_metadata(self, state: GraphState) -> GraphState:
         """Extract metadata from the first slide of the document using trustcall."""
         print(
@@ -45,6 +164,14 @@ class Nodes:
             print(Fore.RED + "No slides found in the document!" + Style.RESET_ALL)
             return {**state, "processing_complete": True}
 
+        if self.agents.metadata_extractor is None:
+            print(
+                Fore.YELLOW
+                + "No metadata extractor available, using default metadata."
+                + Style.RESET_ALL
+            )
+            return {**state, "document_metadata": self._default_metadata(state)}
+
         try:
             # Get the first slide
             first_slide = state["slides"][0]
@@ -96,15 +223,19 @@ class Nodes:
                 Fore.RED + f"Error in metadata extraction: {str(e)}" + Style.RESET_ALL
             )
             # Fallback to basic metadata
-            document_metadata = DocumentMetadata(
-                title=os.path.basename(state.get("pdf_path", "Unknown")),
-                company="Unknown",
-                date="Unknown",
-                event="Unknown",
-                document_id=state.get("pdf_path", "Unknown"),
-            )
-            return {**state, "document_metadata": document_metadata}
+            return {**state, "document_metadata": self._default_metadata(state)}
+
+    def _default_metadata(self, state: GraphState) -> DocumentMetadata:
+        """Basic metadata derived from the PDF path."""
+        return DocumentMetadata(
+            title=os.path.basename(state.get("pdf_path", "Unknown")),
+            company="Unknown",
+            date="Unknown",
+            event="Unknown",
+            document_id=state.get("pdf_path", "Unknown"),
+        )
 
+    @run_scoped
     def process_next_slide(self, state: GraphState) -> GraphState:
         """Get next slide for processing."""
         updated_state = state.copy()
@@ -186,6 +317,7 @@ class Nodes:
             updated_state["error"] = str(e)
             return updated_state
 
+    @run_scoped
     def extract_pharma_data(self, state: GraphState) -> GraphState:
         """Extract pharmaceutical data from slide image using all active models."""
         # Check if we have a current slide to process
@@ -203,98 +335,274 @@ class Nodes:
             + Style.RESET_ALL
         )
 
-        # Get previous extractions to use as context (same as original)
-        previous_extractions = ""
-        if state["extracted_data"]:
-            # Combine previous extractions but limit to avoid context window issues
-            # We'll take the last 3 extractions as context
-            recent_extractions = state["extracted_data"][-3:]
-            for i, extraction in enumerate(recent_extractions):
-                slide_num = (
-                    state["current_slide"].slide_number - len(recent_extractions) + i
-                )
-                previous_extractions += (
-                    f"### Slide {slide_num} Extraction:\n{extraction}\n\n"
-                )
+        current_slide = state["current_slide"]
+        self._run.slide_started_at[current_slide.slide_number] = time.monotonic()
+
+        if self.context_mode == "summary":
+            # Entities seen so far in the deck, roughly constant in size
+            previous_extractions = self.deck_state.render()
+        else:
+            # Previous-slide data points most relevant to this slide, within the token budget
+            previous_extractions = build_previous_context(
+                state["slides"], current_slide, self.context_token_budget
+            )
+        run_metrics.increment("context.tokens", estimate_tokens(previous_extractions))
+
+        formatted_text = self._format_extraction_prompt(
+            state, current_slide, previous_extractions
+        )
 
-        # Format the prompt (same as original)
-        formatted_text = PHARMA_EXTRACTION_USER_PROMPT_TEMPLATE.format(
+        # Extract data using each active model
+        self._extract_slide(current_slide, formatted_text)
+
+        # Update the state with the modified current_slide
+        updated_state = state.copy()
+        self._replace_slide(updated_state, current_slide)
+        return updated_state
+
+    def _format_extraction_prompt(self, state, slide, previous_extractions):
+        """Format the extraction user prompt for a slide."""
+        prompt = PHARMA_EXTRACTION_USER_PROMPT_TEMPLATE.format(
             presentation_title=state["document_metadata"].title,
             company_name=state["document_metadata"].company,
             presentation_date=state["document_metadata"].date,
             event_name=state["document_metadata"].event,
-            slide_number=state["current_slide"].slide_number,
+            slide_number=slide.slide_number,
             total_slides=len(state["slides"]),
             document_source_id=state["document_metadata"].document_id,
             previous_extractions=previous_extractions,
         )
+        if not self.schema_routing:
+            return prompt
 
-        current_slide = state["current_slide"]
+        # Only the schema modules the slide's text touches
+        schema_slice, modules = render_schema_slice(slide.text)
+        run_metrics.increment("schema_router.slides")
+        run_metrics.increment("schema_router.modules", len(modules))
+        run_metrics.increment("schema_router.tokens", estimate_tokens(schema_slice))
+        return prompt + SCHEMA_SLICE_PROMPT_TEMPLATE.format(schema_slice=schema_slice)
 
-        # Extract data using each active model
-        for model_name in self.agents.active_models:
-            try:
-                print(
-                    Fore.BLUE
-                    + f"Using {model_name} for extraction..."
-                    + Style.RESET_ALL
-                )
+    def _extract_slide(self, slide, formatted_text):
+        """
+        Run every active model on a slide and attach their extractions.
 
-                # Use the provider's extraction method
-                provider = self.agents.providers[model_name]
-                provider_type = self.agents._determine_provider_type(model_name)
+        Models run one after another, or concurrently in parallel_models mode.
+        With a quorum policy, models always run concurrently and the slide moves
+        on to aggregation as soon as the quorum is met; see _extract_with_quorum.
+        With a cascade policy, the first model runs alone and the others only
+        run if its extraction is not good enough; see _extract_with_cascade.
+        A model that fails is reported and contributes no extraction.
 
-                # Extract data using the provider
-                markdown_result = provider.extract_pharmaceutical_data(
-                    state["current_slide"].base64_image,
-                    formatted_text,
-                    PHARMA_EXTRACTION_SYSTEM_PROMPT,
-                    self.agents.tools,
+        Args:
+            slide: Slide to extract
+            formatted_text: Formatted extraction prompt for the slide
+        """
+        # Budget shared by all models on this slide
+        slide_budget = self.agents.create_slide_budget(slide.slide_number)
+        model_names = self.agents.active_models
+
+        # lookup_previous only sees earlier slides, also when later slides were
+        # extracted first (speculative runs). The models' tool calls share
+        # results: per document for search and check_schema, per slide for
+        # lookup_previous. Model threads inherit both scopes, so concurrent
+        # identical calls wait for the first one.
+        with use_slide(slide.slide_number), tool_memo_scope(self._run.tool_memo, ToolMemo()):
+            if self.cascade_policy is not None and len(model_names) > 1:
+                model_names = self._extract_with_cascade(
+                    slide, model_names, formatted_text, slide_budget
                 )
+                if not model_names:
+                    return
 
-                # Ensure the result is a string
-                if not isinstance(markdown_result, str):
-                    print(
-                        Fore.YELLOW
-                        + f"Warning: Expected string result from {model_name}, got {type(markdown_result)}. Converting to string."
-                        + Style.RESET_ALL
-                    )
-                    markdown_result = str(markdown_result)
+            results = self._run_models(slide, model_names, formatted_text, slide_budget)
+        slide.model_extractions.extend(
+            extraction for extraction in results if extraction is not None
+        )
 
-                # Create a ModelExtraction object and add to current slide
-                model_extraction = ModelExtraction(
-                    model_name=model_name,
-                    provider=provider_type,
-                    extraction=markdown_result,
+    def _run_models(self, slide, model_names, formatted_text, slide_budget):
+        """Run the given models on a slide according to the execution mode."""
+        if self.quorum_policy is not None and len(model_names) > 1:
+            return self._extract_with_quorum(
+                slide, model_names, formatted_text, slide_budget
+            )
+        if self.execution_mode == "parallel_models" and len(model_names) > 1:
+            with ContextThreadPoolExecutor(max_workers=len(model_names)) as executor:
+                return list(
+                    executor.map(
+                        lambda model_name: self._extract_with_model(
+                            slide, model_name, formatted_text, slide_budget
+                        ),
+                        model_names,
+                    )
                 )
+        return [
+            self._extract_with_model(slide, model_name, formatted_text, slide_budget)
+            for model_name in model_names
+        ]
 
-                # Add to current slide's extractions
-                current_slide.model_extractions.append(model_extraction)
+    def _extract_with_cascade(self, slide, model_names, formatted_text, slide_budget):
+        """
+        Extract a slide with the cascade's first model and decide whether to escalate.
 
-                print(
-                    Fore.GREEN
-                    + f"Extraction with {model_name} complete."
-                    + Style.RESET_ALL
-                )
+        The first model's extraction is scored locally (confidence, schema
+        coverage, slide complexity). If it passes, it is the slide's only
+        extraction; otherwise it is kept and the remaining models run as well.
+
+        Returns:
+            Models that still need to run (empty if the extraction was accepted)
+        """
+        policy = self.cascade_policy
+        first_model = policy.first_model or model_names[0]
+        if first_model not in model_names:
+            first_model = model_names[0]
+        remaining = [model_name for model_name in model_names if model_name != first_model]
+
+        extraction = self._extract_with_model(
+            slide, first_model, formatted_text, slide_budget
+        )
+        if extraction is None:
+            reason = f"{first_model} failed"
+        else:
+            slide.model_extractions.append(extraction)
+            score = score_extraction(extraction.extraction, slide.text, policy)
+            reason = score.escalation_reason(policy)
 
-            except Exception as e:
+        if reason is None:
+            print(
+                Fore.GREEN
+                + f"[CASCADE] Slide {slide.slide_number}: accepted {first_model} extraction"
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("cascade.accepted")
+            return []
+
+        print(
+            Fore.YELLOW
+            + f"[CASCADE] Slide {slide.slide_number}: escalating to "
+            + f"{', '.join(remaining)} ({reason})"
+            + Style.RESET_ALL
+        )
+        run_metrics.increment("cascade.escalated")
+        return remaining
+
+    def _extract_with_quorum(self, slide, model_names, formatted_text, slide_budget):
+        """
+        Run all models concurrently and return once the quorum is met.
+
+        Models still running at that point are cancelled ("drop") or left to
+        finish and picked up by reaggregate_late_extractions ("reaggregate").
+
+        Returns:
+            Extractions available when the quorum was met, in model order
+        """
+        policy = self.quorum_policy
+        if slide.model_extractions:
+            # Extractions already on the slide (the cascade's first model) count too
+            policy = policy.model_copy(
+                update={
+                    "min_results": max(1, policy.min_results - len(slide.model_extractions))
+                }
+            )
+        futures = {
+            self._model_executor.submit(
+                self._extract_with_model, slide, model_name, formatted_text, slide_budget
+            ): model_name
+            for model_name in model_names
+        }
+        results, pending = wait_for_quorum(futures, policy)
+
+        if pending:
+            late_models = ", ".join(sorted(futures[future] for future in pending))
+            print(
+                Fore.YELLOW
+                + f"[QUORUM] Slide {slide.slide_number}: aggregating {len(results)}/{len(model_names)} "
+                + f"extractions, {policy.late_results} for {late_models}"
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("quorum.early")
+            run_metrics.increment("quorum.late_models", len(pending))
+            if policy.late_results == "reaggregate":
+                self._run.late_extractions[slide.slide_number] = list(pending)
+            else:
+                # Stops the laggards at their next budget checkpoint
+                slide_budget.cancel()
+
+        order = {model_name: i for i, model_name in enumerate(model_names)}
+        return sorted(results, key=lambda extraction: order[extraction.model_name])
+
+    def _extract_with_model(self, slide, model_name, formatted_text, slide_budget):
+        """
+        Extract a slide with a single model.
+
+        Returns:
+            ModelExtraction, or None if the model failed
+        """
+        try:
+            print(
+                Fore.BLUE
+                + f"Using {model_name} for extraction..."
+                + Style.RESET_ALL
+            )
+
+            provider_type = self.agents._determine_provider_type(model_name)
+
+            # Extract data using the provider, bounded by the model and slide budgets
+            markdown_result = self.agents.extract_with_model(
+                model_name,
+                slide.base64_image,
+                formatted_text,
+                slide_budget,
+            )
+
+            # Ensure the result is a string
+            if not isinstance(markdown_result, str):
                 print(
-                    Fore.RED
-                    + f"Error in {model_name} extraction: {str(e)}"
+                    Fore.YELLOW
+                    + f"Warning: Expected string result from {model_name}, got {type(markdown_result)}. Converting to string."
                     + Style.RESET_ALL
                 )
+                markdown_result = str(markdown_result)
 
-        # Update the state with the modified current_slide
-        updated_state = state.copy()
+            print(
+                Fore.GREEN
+                + f"Extraction with {model_name} complete."
+                + Style.RESET_ALL
+            )
 
-        # Find the slide in slides list and update it
-        for i, slide in enumerate(updated_state["slides"]):
-            if slide.slide_number == current_slide.slide_number:
-                updated_state["slides"][i] = current_slide
-                break
+            return ModelExtraction(
+                model_name=model_name,
+                provider=provider_type,
+                extraction=markdown_result,
+            )
 
-        return updated_state
+        except CircuitOpenError as e:
+            print(
+                Fore.YELLOW
+                + f"Skipping {model_name} extraction: {str(e)}"
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("extraction.skipped")
+            return None
 
+        except ExtractionCancelled:
+            print(
+                Fore.YELLOW
+                + f"{model_name} extraction for slide {slide.slide_number} cancelled."
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("extraction.cancelled")
+            return None
+
+        except Exception as e:
+            print(
+                Fore.RED
+                + f"Error in {model_name} extraction: {str(e)}"
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("extraction.failed")
+            return None
+
+    @run_scoped
     def aggregate_extractions(self, state: GraphState) -> GraphState:
         """Aggregate multiple extraction results into a single optimized extraction."""
         # Check if we have a current slide with extractions
@@ -306,7 +614,30 @@ class Nodes:
             return state
 
         current_slide = state["current_slide"]
-        model_extractions = current_slide.model_extractions
+        final_extraction = self._aggregate_slide(state, current_slide)
+
+        # Add to main extraction results list and update the slide
+        updated_state = state.copy()
+        updated_state["extracted_data"] = state["extracted_data"] + [final_extraction]
+        self._replace_slide(updated_state, current_slide)
+        return updated_state
+
+    def _aggregate_slide(self, state, slide):
+        """
+        Aggregate a slide's model extractions and index the result.
+
+        Stores the final extraction on the slide, adds its entities to the
+        deck summary and the extraction to the vector store for
+        lookup_previous, and records the slide's latency.
+
+        Args:
+            state: Current workflow state (for document metadata)
+            slide: Slide with at least one model extraction
+
+        Returns:
+            Final extraction for the slide
+        """
+        model_extractions = slide.model_extractions
 
         # If only one model was used, no need to aggregate
         if len(model_extractions) == 1:
@@ -315,33 +646,69 @@ class Nodes:
                 + "Only one model used, skipping aggregation."
                 + Style.RESET_ALL
             )
-            # Use the single extraction as the final result
-            current_slide.aggregated_extraction = model_extractions[0].extraction
+            final_extraction = model_extractions[0].extraction
+        else:
+            final_extraction = self._aggregate_multiple(state, slide)
 
-            # Add to main extraction results list
-            updated_extractions = state["extracted_data"] + [
-                model_extractions[0].extraction
-            ]
+        slide.aggregated_extraction = final_extraction
+        self.deck_state.update(final_extraction, slide.slide_number, slide.text)
 
-            # Update the state
-            updated_state = state.copy()
-            updated_state["extracted_data"] = updated_extractions
+        # Update vector store
+        update_vector_store(
+            extraction_text=final_extraction,
+            slide_number=slide.slide_number,
+        )
 
-            # Update vector store
-            update_vector_store(
-                extraction_text=model_extractions[0].extraction,
-                slide_number=current_slide.slide_number,
-            )
+        self._record_slide_finished(slide.slide_number)
+        return final_extraction
 
-            # Find and update the slide in slides list
-            for i, slide in enumerate(updated_state["slides"]):
-                if slide.slide_number == current_slide.slide_number:
-                    updated_state["slides"][i] = current_slide
-                    break
+    def _aggregate_multiple(self, state, slide):
+        """
+        Aggregate several model extractions, locally when they already agree.
 
-            return updated_state
+        If the extractions' data points agree at least as much as the agreement
+        threshold, the most complete extraction is used and the aggregator
+        model is not called. Otherwise the aggregation strategy decides between
+        the aggregator model and the local field-level merge.
+        """
+        model_extractions = slide.model_extractions
+        run_metrics.increment("aggregation.slides")
 
-        # Multiple models were used, need to aggregate
+        if self.agreement_threshold is not None:
+            agreement = extraction_agreement(
+                [extraction.extraction for extraction in model_extractions]
+            )
+            if agreement >= self.agreement_threshold:
+                chosen = most_complete_extraction(model_extractions)
+                print(
+                    Fore.GREEN
+                    + f"Extractions agree ({agreement:.0%}), using {chosen.model_name} "
+                    + "without calling the aggregator."
+                    + Style.RESET_ALL
+                )
+                run_metrics.increment("aggregation.skipped_agreement")
+                return chosen.extraction
+
+        started_at = time.monotonic()
+        if self.aggregation_strategy == "local":
+            print(
+                Fore.BLUE
+                + f"Merging extractions from {len(model_extractions)} models locally..."
+                + Style.RESET_ALL
+            )
+            final_extraction = merge_extractions(model_extractions, slide.slide_number)
+        elif self.compact_aggregation:
+            final_extraction = self._aggregate_differences(state, slide)
+        else:
+            final_extraction = self._aggregate_with_model(state, slide)
+        run_metrics.observe(
+            f"aggregation.{self.aggregation_strategy}", time.monotonic() - started_at
+        )
+        return final_extraction
+
+    def _aggregate_with_model(self, state, slide):
+        """Aggregate multiple model extractions with the aggregator model."""
+        model_extractions = slide.model_extractions
         print(
             Fore.BLUE
             + f"Aggregating extractions from {len(model_extractions)} models..."
@@ -350,84 +717,289 @@ class Nodes:
 
         # Prepare the model outputs for the prompt template
         model_outputs_formatted = ""
-        for i, extraction in enumerate(model_extractions):
+        for extraction in model_extractions:
             model_outputs_formatted += f"#### {extraction.model_name} Output:\n```\n{extraction.extraction}\n```\n\n"
 
-        # Format the aggregation prompt using AGGREGATION_USER_PROMPT_TEMPLATE
-        from .prompts import AGGREGATION_USER_PROMPT_TEMPLATE
-
         aggregation_prompt = AGGREGATION_USER_PROMPT_TEMPLATE.format(
             PRESENTATION_TITLE=state["document_metadata"].title,
             COMPANY_NAME=state["document_metadata"].company,
             PRESENTATION_DATE=state["document_metadata"].date,
             EVENT_NAME=state["document_metadata"].event,
-            SLIDE_NUMBER=current_slide.slide_number,
+            SLIDE_NUMBER=slide.slide_number,
             SLIDE_TITLE="",  # We don't have this information
             DOCUMENT_SOURCE_ID=state["document_metadata"].document_id,
             MODEL_OUTPUTS=model_outputs_formatted,
         )
 
-        # Call the aggregator model
-        aggregator_model = self.agents.aggregator_model
-        aggregator = self.agents.providers[aggregator_model]
+        run_metrics.increment("aggregation.prompt_chars", len(aggregation_prompt))
 
         try:
-            # Get the aggregated extraction
-            aggregated_result = aggregator.aggregate_extractions(
+            # Get the aggregated extraction from the aggregator model
+            aggregated_result = self.agents.aggregate_results(
                 [ext.extraction for ext in model_extractions], aggregation_prompt
             )
+            print(Fore.GREEN + "Aggregation complete." + Style.RESET_ALL)
+            return aggregated_result
 
-            # Store the aggregated result in the current slide
-            current_slide.aggregated_extraction = aggregated_result
+        except Exception as e:
+            # Fallback to the most detailed model extraction
+            fallback = max(model_extractions, key=lambda ext: len(ext.extraction))
+            print(
+                Fore.RED
+                + f"Error during aggregation: {str(e)}. "
+                + f"Using the {fallback.model_name} extraction instead."
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("aggregation.fallback")
+            return fallback.extraction
 
-            # Add to main extraction results list
-            updated_extractions = state["extracted_data"] + [aggregated_result]
+    def _aggregate_differences(self, state, slide):
+        """
+        Aggregate with the aggregator model seeing only the differing data points.
 
-            # Update the state
-            updated_state = state.copy()
-            updated_state["extracted_data"] = updated_extractions
+        Data points every model agrees on are merged locally and listed in the
+        prompt as a compact summary; the aggregator resolves the rest and its
+        output is spliced together with the agreed data points. If any
+        extraction has no parseable data points, the full outputs are
+        aggregated instead.
+        """
+        model_extractions = slide.model_extractions
+        compacted = compact_extractions(model_extractions, slide.slide_number)
+        if compacted is None:
+            print(
+                Fore.YELLOW
+                + "Some extractions have no parseable data points, "
+                + "aggregating the full outputs instead."
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("aggregation.compact_unparsed")
+            return self._aggregate_with_model(state, slide)
+        agreed, differing = compacted
+        agreed_count = sum(len(bullets) for bullets in agreed.values())
 
-            # Update vector store
-            update_vector_store(
-                extraction_text=aggregated_result,
-                slide_number=current_slide.slide_number,
+        if not any(text for _, text in differing):
+            print(
+                Fore.GREEN
+                + "All data points agree, no aggregator call needed."
+                + Style.RESET_ALL
             )
+            run_metrics.increment("aggregation.skipped_agreement")
+            return splice_aggregation(agreed, "", len(model_extractions), slide.slide_number)
 
-            # Find and update the slide in slides list
-            for i, slide in enumerate(updated_state["slides"]):
-                if slide.slide_number == current_slide.slide_number:
-                    updated_state["slides"][i] = current_slide
-                    break
+        print(
+            Fore.BLUE
+            + f"Aggregating differences between {len(model_extractions)} models "
+            + f"({agreed_count} data points already agree)..."
+            + Style.RESET_ALL
+        )
 
-            print(Fore.GREEN + "Aggregation complete." + Style.RESET_ALL)
-            return updated_state
+        model_outputs_formatted = ""
+        for model_name, text in differing:
+            model_outputs_formatted += f"#### {model_name} Output:\n```\n{text}\n```\n\n"
 
+        aggregation_prompt = AGGREGATION_DIFF_USER_PROMPT_TEMPLATE.format(
+            PRESENTATION_TITLE=state["document_metadata"].title,
+            COMPANY_NAME=state["document_metadata"].company,
+            PRESENTATION_DATE=state["document_metadata"].date,
+            EVENT_NAME=state["document_metadata"].event,
+            SLIDE_NUMBER=slide.slide_number,
+            DOCUMENT_SOURCE_ID=state["document_metadata"].document_id,
+            MODEL_COUNT=len(model_extractions),
+            AGREED_COUNT=agreed_count,
+            AGREED_SUMMARY=summarize_agreed(agreed) or "(none)",
+            MODEL_OUTPUTS=model_outputs_formatted,
+        )
+        run_metrics.increment("aggregation.prompt_chars", len(aggregation_prompt))
+
+        try:
+            aggregated_result = self.agents.aggregate_results(
+                [text for _, text in differing], aggregation_prompt
+            )
         except Exception as e:
-            print(Fore.RED + f"Error during aggregation: {str(e)}" + Style.RESET_ALL)
-            # Fallback to using the first model's extraction
-            fallback_extraction = model_extractions[0].extraction
-            current_slide.aggregated_extraction = fallback_extraction
+            print(
+                Fore.RED
+                + f"Error during aggregation: {str(e)}. Merging the differences locally instead."
+                + Style.RESET_ALL
+            )
+            run_metrics.increment("aggregation.fallback")
+            return merge_extractions(model_extractions, slide.slide_number)
+
+        print(Fore.GREEN + "Aggregation complete." + Style.RESET_ALL)
+        return splice_aggregation(
+            agreed, aggregated_result, len(model_extractions), slide.slide_number
+        )
 
-            # Add to main extraction results list
-            updated_extractions = state["extracted_data"] + [fallback_extraction]
+    @run_scoped
+    def extract_all_slides(self, state: GraphState) -> GraphState:
+        """
+        Extract and aggregate all slides concurrently (parallel_slides and speculative modes).
+
+        Slides are independent in these modes, so prompts carry no previous-slide
+        context; lookup_previous only sees slides that have already finished.
+        In speculative mode prompts carry the text of the neighbouring slides
+        instead, and reconcile_speculative_slides re-runs slides that turn out
+        to depend on earlier ones.
+        """
+        slides = state.get("slides", [])
+        if not slides or state.get("processing_complete", False):
+            return {**state, "processing_complete": True}
+
+        print(
+            Fore.YELLOW
+            + f"Extracting {len(slides)} slides with up to {self.max_workers} workers..."
+            + Style.RESET_ALL
+        )
+
+        def process(index):
+            slide = slides[index]
+            self._run.slide_started_at[slide.slide_number] = time.monotonic()
+            context = ""
+            if self.execution_mode == "speculative":
+                context = neighbour_context(slides, index)
+            formatted_text = self._format_extraction_prompt(state, slide, context)
+            return self._process_slide(state, slide, formatted_text)
 
-            # Update the state and vector store
-            updated_state = state.copy()
-            updated_state["extracted_data"] = updated_extractions
+        with ContextThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(process, range(len(slides))))
+
+        return {
+            **state,
+            "slides": slides,
+            "extracted_data": [result for result in results if result is not None],
+            "processing_complete": True,
+        }
 
-            update_vector_store(
-                extraction_text=fallback_extraction,
-                slide_number=current_slide.slide_number,
+    def _process_slide(self, state, slide, formatted_text):
+        """Extract and aggregate one slide; returns its final extraction or None."""
+        self._extract_slide(slide, formatted_text)
+        if not slide.model_extractions:
+            print(
+                Fore.RED
+                + f"No extractions for slide {slide.slide_number}!"
+                + Style.RESET_ALL
             )
+            return None
+        return self._aggregate_slide(state, slide)
 
-            # Find and update the slide in slides list
-            for i, slide in enumerate(updated_state["slides"]):
-                if slide.slide_number == current_slide.slide_number:
-                    updated_state["slides"][i] = current_slide
-                    break
+    @run_scoped
+    def reconcile_speculative_slides(self, state: GraphState) -> GraphState:
+        """
+        Re-extract speculatively extracted slides that depend on earlier slides.
+
+        A local dependency check flags slides whose extraction leaves entities
+        unresolved that earlier slides name; only those are extracted again,
+        this time with the usual previous-slide context built from the
+        speculative results of the earlier slides. Re-runs only see earlier
+        slides, and replace the slide's speculative chunks in the vector store
+        and its entities in the deck summary.
+        """
+        slides = state.get("slides", [])
+        flagged = find_unresolved_slides(slides)
+        run_metrics.increment("speculative.slides", len(slides))
+        if not flagged:
+            print(
+                Fore.GREEN
+                + "No cross-slide dependencies found, keeping all speculative extractions."
+                + Style.RESET_ALL
+            )
+            return state
 
-            return updated_state
+        for slide_number, reason in sorted(flagged.items()):
+            print(
+                Fore.YELLOW
+                + f"[SPECULATIVE] Re-extracting slide {slide_number}: {reason}"
+                + Style.RESET_ALL
+            )
+        run_metrics.increment("speculative.reruns", len(flagged))
+
+        def rerun(slide):
+            if self.context_mode == "summary":
+                # Only what earlier slides contributed to the deck summary
+                context = self.deck_state.render(before_slide=slide.slide_number)
+            else:
+                context = build_previous_context(slides, slide, self.context_token_budget)
+            formatted_text = self._format_extraction_prompt(state, slide, context)
+
+            # Models still running from the speculative pass no longer apply
+            self._run.late_extractions.pop(slide.slide_number, None)
+            speculative = (slide.model_extractions, slide.aggregated_extraction)
+            slide.model_extractions = []
+            if self._process_slide(state, slide, formatted_text) is None:
+                # Keep the speculative result if the re-run produced nothing
+                slide.model_extractions, slide.aggregated_extraction = speculative
+
+        to_rerun = [slide for slide in slides if slide.slide_number in flagged]
+        with ContextThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(rerun, to_rerun))
+
+        return {
+            **state,
+            "extracted_data": [
+                slide.aggregated_extraction
+                for slide in slides
+                if slide.aggregated_extraction is not None
+            ],
+        }
+
+    @run_scoped
+    def reaggregate_late_extractions(self, state: GraphState) -> GraphState:
+        """
+        Re-aggregate slides whose quorum was met before every model finished.
+
+        Waits for the models that missed the quorum, adds their extractions to
+        the slide and aggregates it again. The vector store keeps the earlier
+        aggregation, which later slides may already have looked up.
+        """
+        if not self._run.late_extractions:
+            return state
 
+        print(
+            Fore.YELLOW
+            + f"Waiting for late extractions on {len(self._run.late_extractions)} slides..."
+            + Style.RESET_ALL
+        )
+        for slide in state.get("slides", []):
+            futures = self._run.late_extractions.pop(slide.slide_number, None)
+            if not futures:
+                continue
+
+            late = [future.result() for future in futures]
+            late = [extraction for extraction in late if extraction is not None]
+            if not late:
+                continue
+
+            slide.model_extractions.extend(late)
+            print(
+                Fore.BLUE
+                + f"Re-aggregating slide {slide.slide_number} with "
+                + f"{len(late)} late extractions..."
+                + Style.RESET_ALL
+            )
+            slide.aggregated_extraction = self._aggregate_multiple(state, slide)
+            run_metrics.increment("quorum.reaggregated")
+
+        return {
+            **state,
+            "extracted_data": [
+                slide.aggregated_extraction
+                for slide in state.get("slides", [])
+                if slide.aggregated_extraction is not None
+            ],
+        }
+
+    def _replace_slide(self, state, slide):
+        """Find the slide in the state's slides list and replace it."""
+        for i, existing_slide in enumerate(state["slides"]):
+            if existing_slide.slide_number == slide.slide_number:
+                state["slides"][i] = slide
+                break
+
+    def _record_slide_finished(self, slide_number):
+        started_at = self._run.slide_started_at.pop(slide_number, None)
+        if started_at is not None:
+            run_metrics.record_slide(slide_number, time.monotonic() - started_at)
+
+    @run_scoped
     def check_processing_complete(self, state: GraphState) -> GraphState:
         """
         Check if all slides have been processed and mark state accordingly.
@@ -505,10 +1077,15 @@ class Nodes:
             )
             return "next_slide"
 
+    @run_scoped
     def export_results(self, state: GraphState) -> GraphState:
         """Export extraction results."""
         print(Fore.YELLOW + "Exporting results..." + Style.RESET_ALL)
 
+        # The run is over; free its vector store and run state
+        release_vector_store(state.get("run_id"))
+        self._runs.drop(state.get("run_id"))
+
         # Handle case where no slides were processed
         if not state.get("extracted_data"):
             print(
@@ -554,4 +1131,7 @@ class Nodes:
             + f"Results exported to output directory as {file_prefix}_combined.md"
             + Style.RESET_ALL
         )
+        run_metrics.report()
+        if self.agents.hedger is not None:
+            self.agents.hedger.report()
         return {}
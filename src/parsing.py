@@ -0,0 +1,89 @@
+# parsing.py
+import re
+from typing import List, Optional
+from pydantic import BaseModel
+
+# Markers that start the structured part of extraction and aggregation output
+EXTRACTION_MARKERS = ("Final Extraction:", "Extraction:")
+
+# Sections that follow the structured bullets
+TRAILING_SECTIONS = re.compile(r"^\s*(?:Reasoning:|#### Summary)", re.MULTILINE)
+
+CATEGORY_PATTERN = re.compile(r"^\s*#{2,4}\s+(?P<category>.+?)\s*$")
+
+# - **[Data Point]**: [value] (Confidence: [1-5]) [Slide: X]
+BULLET_PATTERN = re.compile(
+    r"^\s*[-*]\s+\*\*(?P<field>.+?)\*\*\s*:?\s*(?P<value>.*?)\s*"
+    r"(?:\(Confidence:\s*(?P<confidence>[1-5])(?:\s*/\s*5)?\))?\s*"
+    r"(?:\[Slide:?\s*(?P<slide>[^\]]*)\])?\s*$"
+)
+
+
+class ExtractionRecord(BaseModel):
+    """A single data point parsed from extraction markdown."""
+
+    category: str
+    field: str
+    value: str
+    confidence: Optional[int] = None
+    slide: Optional[str] = None
+
+
+def extraction_body(text):
+    """
+    Return the structured bullets section of an extraction or aggregation.
+
+    Takes everything after the last "Final Extraction:" or "Extraction:" marker
+    and before a trailing "Reasoning:" or "#### Summary" section. Text without
+    a marker is returned whole.
+
+    Args:
+        text: Model output in the extraction output format
+
+    Returns:
+        Markdown with the category headings and data point bullets
+    """
+    for marker in EXTRACTION_MARKERS:
+        index = text.rfind(marker)
+        if index != -1:
+            text = text[index + len(marker):]
+            break
+
+    match = TRAILING_SECTIONS.search(text)
+    if match:
+        text = text[: match.start()]
+    return text.strip()
+
+
+def parse_extraction(text):
+    """
+    Parse extraction markdown into data point records.
+
+    Args:
+        text: Model output in the extraction output format
+
+    Returns:
+        List of ExtractionRecord in output order
+    """
+    records: List[ExtractionRecord] = []
+    category = "Uncategorized"
+    for line in extraction_body(text).splitlines():
+        heading = CATEGORY_PATTERN.match(line)
+        if heading:
+            category = heading.group("category").strip("[] ")
+            continue
+
+        bullet = BULLET_PATTERN.match(line)
+        if not bullet:
+            continue
+        confidence = bullet.group("confidence")
+        records.append(
+            ExtractionRecord(
+                category=category,
+                field=bullet.group("field").strip("[] "),
+                value=bullet.group("value").strip(),
+                confidence=int(confidence) if confidence else None,
+                slide=(bullet.group("slide") or "").strip() or None,
+            )
+        )
+    return records
@@ -180,6 +180,19 @@ Extraction:
 Reasoning: [Document your thought process, especially for ambiguous content]
 """
 
+# Extraction system prompt for schema routing: the full schema listing is
+# replaced by a static pointer, so the prompt stays identical (and cacheable)
+# across slides while each user prompt carries only the relevant tables
+PHARMA_EXTRACTION_ROUTED_SYSTEM_PROMPT = (
+    PHARMA_EXTRACTION_SYSTEM_PROMPT.split("## DATABASE SCHEMA AWARENESS")[0]
+    + """## DATABASE SCHEMA AWARENESS
+
+Each slide's prompt lists the database schema tables relevant to that slide under "RELEVANT DATABASE SCHEMA". Use them to identify what information is valuable; you don't need to match the schema directly in your output. Use check_schema only for entities outside the listed tables.
+
+## EXTRACTION GUIDELINES"""
+    + PHARMA_EXTRACTION_SYSTEM_PROMPT.split("## EXTRACTION GUIDELINES")[1]
+)
+
 # User prompt template for pharmaceutical data extraction
 PHARMA_EXTRACTION_USER_PROMPT_TEMPLATE = """
 Extract all pharmaceutical data from this presentation slide, mapping it to our database schema using autonomous ReAct methodology.
@@ -329,3 +342,51 @@ Your final output should be:
 
 The goal is to create the most accurate, comprehensive, and well-structured representation of the pharmaceutical information on this slide by leveraging the strengths of each model's extraction.
 """
+
+BUDGET_EXHAUSTED_TOOL_MESSAGE = """Tool budget exhausted: {reason}.
+Do not call any more tools. Produce your final extraction now using the information you already have."""
+
+BUDGET_EXHAUSTED_FINAL_ANSWER_PROMPT = """Your tool and time budget for this slide is exhausted ({reason}). You cannot call any more tools.
+
+Tool results gathered so far:
+{tool_results}
+
+Using only the slide and the information above, produce your final answer now in the required output format, including the Extraction section with confidence scores (1-5) for every data point.
+"""
+
+# Aggregation prompt for compacted input: only the data points the models disagree on
+AGGREGATION_DIFF_USER_PROMPT_TEMPLATE = """
+I need you to resolve the differences between pharmaceutical data extraction results from different LLM models processing the same slide.
+
+### DOCUMENT METADATA
+- Presentation Title: {PRESENTATION_TITLE}
+- Company/Author: {COMPANY_NAME}
+- Date: {PRESENTATION_DATE}
+- Event: {EVENT_NAME}
+- Slide Number: {SLIDE_NUMBER}
+- Document Source ID: {DOCUMENT_SOURCE_ID}
+
+### AGREED DATA POINTS
+All {MODEL_COUNT} models extracted these {AGREED_COUNT} data points identically. They are already final; use them as context only and do not repeat them.
+{AGREED_SUMMARY}
+
+### DIFFERING DATA POINTS
+
+{MODEL_OUTPUTS}
+
+### AGGREGATION TASK
+
+For the differing data points only, produce a Final Extraction that:
+1. Resolves contradictions between models, choosing the most precise and best supported value
+2. Keeps data points found by only some models when they are consistent with the agreed data points
+3. Maintains appropriate confidence scores (1-5) for each data point
+4. Uses the same category headings and bullet format as the system prompt
+"""
+
+# Appended to the extraction user prompt when schema routing is on
+SCHEMA_SLICE_PROMPT_TEMPLATE = """
+## RELEVANT DATABASE SCHEMA
+Tables (key fields) of the schema modules this slide touches. They are already verified; call check_schema only for entities outside them.
+
+{schema_slice}
+"""
@@ -1,9 +1,22 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
+import hashlib
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from langgraph.prebuilt import create_react_agent
+from langgraph.errors import GraphRecursionError
+from langchain_core.messages import AIMessage, ToolMessage
 from colorama import Fore, Style
-from .prompts import AGGREGATION_SYSTEM_PROMPT
+from .prompts import AGGREGATION_SYSTEM_PROMPT, BUDGET_EXHAUSTED_FINAL_ANSWER_PROMPT
+from .env_utils import get_env
+from .http_clients import get_http_client, get_async_http_client, share_google_client
+from .budgets import ExtractionCancelled
+from .resilience import guarded_model
+from .registry import registry
 
 
 class ModelProvider:
@@ -21,7 +34,9 @@ class ModelProvider:
         self.model_name = model_name
         self.model = None  # To be initialized by subclasses
 
-    def extract_pharmaceutical_data(self, slide_image, prompt, system_prompt, tools):
+    def extract_pharmaceutical_data(
+        self, slide_image, prompt, system_prompt, tools, budget=None, guard=None
+    ):
         """
         Extract pharmaceutical data from a slide image.
 
@@ -30,6 +45,9 @@ class ModelProvider:
             prompt: The user prompt for extraction
             system_prompt: The system prompt for extraction
             tools: List of tools to use for extraction
+            budget: Optional BudgetTracker bounding tool calls, agent steps and time
+            guard: Optional callable (fn, *args, **kwargs) each model call runs
+                   through (retries and circuit breaker)
 
         Returns:
             Markdown-formatted extraction result
@@ -38,6 +56,105 @@ class ModelProvider:
             "Subclasses must implement extract_pharmaceutical_data"
         )
 
+    def _invoke_agent(self, agent, extraction_input, system_prompt, budget=None, guard=None):
+        """
+        Run a ReAct agent, forcing a final answer once the budget runs out.
+
+        Without a budget the agent is invoked as-is. With a budget the agent is
+        streamed step by step; if it still wants to call tools after the budget
+        is exhausted, the loop is stopped and the model is asked directly for its
+        final extraction using the tool results gathered so far.
+
+        Args:
+            agent: Compiled ReAct agent
+            extraction_input: Provider-formatted agent input
+            system_prompt: The system prompt for extraction
+            budget: Optional BudgetTracker
+            guard: Optional guard for the forced final answer's model call
+
+        Returns:
+            Final agent state, or the forced final AI message
+        """
+        if budget is None:
+            return agent.invoke(extraction_input)
+
+        state = None
+        messages = []
+        try:
+            for state in agent.stream(extraction_input, stream_mode="values"):
+                if budget.cancelled:
+                    raise ExtractionCancelled(f"{self.model_name} extraction cancelled")
+
+                messages = state["messages"]
+                last_message = messages[-1]
+                if not isinstance(last_message, AIMessage):
+                    continue
+
+                budget.record_step()
+                if not last_message.tool_calls:
+                    return state
+
+                reason = budget.exhausted_reason()
+                if reason:
+                    return self._force_final_answer(
+                        extraction_input, system_prompt, messages, reason, guard
+                    )
+        except GraphRecursionError:
+            return self._force_final_answer(
+                extraction_input,
+                system_prompt,
+                messages,
+                "agent hit the recursion limit",
+                guard,
+            )
+
+        return state
+
+    def _force_final_answer(
+        self, extraction_input, system_prompt, messages, reason, guard=None
+    ):
+        """
+        Ask the model for a final extraction without tools.
+
+        Args:
+            extraction_input: Provider-formatted agent input
+            system_prompt: The system prompt for extraction
+            messages: Agent messages produced so far
+            reason: Why the budget was exhausted
+            guard: Optional guard for the model call
+
+        Returns:
+            AI message with the final extraction
+        """
+        print(
+            Fore.YELLOW
+            + f"[BUDGET] {reason}; forcing final answer from {self.model_name}"
+            + Style.RESET_ALL
+        )
+
+        tool_results = "\n\n".join(
+            f"[{message.name}] {message.content}"
+            for message in messages
+            if isinstance(message, ToolMessage)
+        )
+
+        final_messages = list(extraction_input["messages"])
+        first_message = final_messages[0] if final_messages else None
+        if not (isinstance(first_message, dict) and first_message.get("role") == "system"):
+            final_messages.insert(0, {"role": "system", "content": system_prompt})
+        final_messages.append(
+            {
+                "role": "user",
+                "content": BUDGET_EXHAUSTED_FINAL_ANSWER_PROMPT.format(
+                    reason=reason, tool_results=tool_results or "None"
+                ),
+            }
+        )
+
+        if guard is None:
+            return self.model.invoke(final_messages)
+        return guard(self.model.invoke, final_messages)
+
     def aggregate_extractions(self, extractions, prompt):
         """
         Aggregate multiple extraction results.
@@ -66,9 +183,23 @@ class GoogleModelProvider(ModelProvider):
         """
         super().__init__(model_name)
         print(Fore.GREEN + f"Initializing Google model: {model_name}" + Style.RESET_ALL)
-        self.model = ChatGoogleGenerativeAI(temperature=0, model=model_name)
+        # SDKs are imported on first use so that unused providers cost nothing at startup
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        self.model = share_google_client(
+            # Retries happen in ResilientCaller, where the circuit breaker sees them.
+            # gRPC calls bypass the shared httpx pool, so they get its timeout here
+            ChatGoogleGenerativeAI(
+                temperature=0,
+                model=model_name,
+                max_retries=0,
+                timeout=float(get_env("HTTP_TIMEOUT", 600)),
+            )
+        )
 
-    def extract_pharmaceutical_data(self, slide_image, prompt, system_prompt, tools):
+    def extract_pharmaceutical_data(
+        self, slide_image, prompt, system_prompt, tools, budget=None, guard=None
+    ):
         """
         Extract pharmaceutical data using a Gemini model.
 
@@ -77,13 +208,19 @@ class GoogleModelProvider(ModelProvider):
             prompt: The user prompt for extraction
             system_prompt: The system prompt for extraction
             tools: List of tools to use for extraction
+            budget: Optional BudgetTracker bounding tool calls, agent steps and time
+            guard: Optional callable (fn, *args, **kwargs) each model call runs
+                   through (retries and circuit breaker)
 
         Returns:
             Markdown-formatted extraction result
         """
+        if budget is not None:
+            tools = budget.wrap_tools(tools)
+
         # Create ReAct agent with tools
         pharma_extractor = create_react_agent(
-            model=self.model,
+            model=guarded_model(self.model, tools, guard),
             tools=tools,
             prompt=system_prompt,
         )
@@ -111,7 +248,9 @@ class GoogleModelProvider(ModelProvider):
         )
 
         # Call the model via ReAct agent
-        result = pharma_extractor.invoke(extraction_input)
+        result = self._invoke_agent(
+            pharma_extractor, extraction_input, system_prompt, budget, guard
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
@@ -183,22 +322,38 @@ class GoogleModelProvider(ModelProvider):
             Fore.BLUE + f"Using {self.model_name} for aggregation..." + Style.RESET_ALL
         )
 
-        try:
-            result = self.model.invoke(
-                [
-                    {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ]
-            )
-        except Exception as e:
-            print(Fore.RED + f"Error in aggregation: {str(e)}" + Style.RESET_ALL)
-            # If direct invocation fails, return the first extraction as a fallback
-            return extractions[0] if extractions else "No extractions to aggregate"
+        # Errors propagate so the caller can retry or fall back to another aggregator
+        result = self.model.invoke(
+            [
+                {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ]
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
 
 
+@lru_cache(maxsize=None)
+def _pooled_chat_anthropic_class():
+    """ChatAnthropic subclass that sends requests through the shared HTTP connection pool."""
+    import anthropic
+    from langchain_anthropic import ChatAnthropic
+
+    class PooledChatAnthropic(ChatAnthropic):
+        @cached_property
+        def _client(self) -> anthropic.Client:
+            return anthropic.Client(**self._client_params, http_client=get_http_client())
+
+        @cached_property
+        def _async_client(self) -> anthropic.AsyncClient:
+            return anthropic.AsyncClient(
+                **self._client_params, http_client=get_async_http_client()
+            )
+
+    return PooledChatAnthropic
+
+
 class AnthropicModelProvider(ModelProvider):
     """
     Provider implementation for Anthropic (Claude) models.
@@ -215,9 +370,14 @@ class AnthropicModelProvider(ModelProvider):
         print(
             Fore.GREEN + f"Initializing Anthropic model: {model_name}" + Style.RESET_ALL
         )
-        self.model = ChatAnthropic(temperature=0, model=model_name)
+        # Retries happen in ResilientCaller, where the circuit breaker sees them
+        self.model = _pooled_chat_anthropic_class()(
+            temperature=0, model=model_name, max_retries=0
+        )
 
-    def extract_pharmaceutical_data(self, slide_image, prompt, system_prompt, tools):
+    def extract_pharmaceutical_data(
+        self, slide_image, prompt, system_prompt, tools, budget=None, guard=None
+    ):
         """
         Extract pharmaceutical data using a Claude model.
 
@@ -226,13 +386,19 @@ class AnthropicModelProvider(ModelProvider):
             prompt: The user prompt for extraction
             system_prompt: The system prompt for extraction
             tools: List of tools to use for extraction
+            budget: Optional BudgetTracker bounding tool calls, agent steps and time
+            guard: Optional callable (fn, *args, **kwargs) each model call runs
+                   through (retries and circuit breaker)
 
         Returns:
             Markdown-formatted extraction result
         """
+        if budget is not None:
+            tools = budget.wrap_tools(tools)
+
         # Create ReAct agent with tools
         pharma_extractor = create_react_agent(
-            model=self.model,
+            model=guarded_model(self.model, tools, guard),
             tools=tools,
             prompt=system_prompt,
         )
@@ -263,7 +429,9 @@ class AnthropicModelProvider(ModelProvider):
         )
 
         # Call the model via ReAct agent
-        result = pharma_extractor.invoke(extraction_input)
+        result = self._invoke_agent(
+            pharma_extractor, extraction_input, system_prompt, budget, guard
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
@@ -337,19 +505,13 @@ class AnthropicModelProvider(ModelProvider):
             Fore.BLUE + f"Using {self.model_name} for aggregation..." + Style.RESET_ALL
         )
 
-        try:
-            # Call the model directly
-            result = self.model.invoke(
-                [
-                    {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ]
-            )
-
-        except Exception as e:
-            print(Fore.RED + f"Error in aggregation: {str(e)}" + Style.RESET_ALL)
-            # If direct invocation fails, return the first extraction as a fallback
-            return extractions[0] if extractions else "No extractions to aggregate"
+        # Errors propagate so the caller can retry or fall back to another aggregator
+        result = self.model.invoke(
+            [
+                {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ]
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
@@ -369,9 +531,20 @@ class OpenAIModelProvider(ModelProvider):
         """
         super().__init__(model_name)
         print(Fore.GREEN + f"Initializing OpenAI model: {model_name}" + Style.RESET_ALL)
-        self.model = ChatOpenAI(temperature=0, model=model_name)
+        from langchain_openai import ChatOpenAI
+
+        # Retries happen in ResilientCaller, where the circuit breaker sees them
+        self.model = ChatOpenAI(
+            temperature=0,
+            model=model_name,
+            max_retries=0,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+        )
 
-    def extract_pharmaceutical_data(self, slide_image, prompt, system_prompt, tools):
+    def extract_pharmaceutical_data(
+        self, slide_image, prompt, system_prompt, tools, budget=None, guard=None
+    ):
         """
         Extract pharmaceutical data using an OpenAI model.
 
@@ -380,13 +553,19 @@ class OpenAIModelProvider(ModelProvider):
             prompt: The user prompt for extraction
             system_prompt: The system prompt for extraction
             tools: List of tools to use for extraction
+            budget: Optional BudgetTracker bounding tool calls, agent steps and time
+            guard: Optional callable (fn, *args, **kwargs) each model call runs
+                   through (retries and circuit breaker)
 
         Returns:
             Markdown-formatted extraction result
         """
+        if budget is not None:
+            tools = budget.wrap_tools(tools)
+
         # Create ReAct agent with tools
         pharma_extractor = create_react_agent(
-            model=self.model,
+            model=guarded_model(self.model, tools, guard),
             tools=tools,
             prompt=system_prompt,
         )
@@ -415,7 +594,9 @@ class OpenAIModelProvider(ModelProvider):
         )
 
         # Call the model via ReAct agent
-        result = pharma_extractor.invoke(extraction_input)
+        result = self._invoke_agent(
+            pharma_extractor, extraction_input, system_prompt, budget, guard
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
@@ -500,30 +681,322 @@ class OpenAIModelProvider(ModelProvider):
             Fore.BLUE + f"Using {self.model_name} for aggregation..." + Style.RESET_ALL
         )
 
-        try:
-            # Call the model directly
-            result = self.model.invoke(
-                [
-                    {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ]
-            )
-
-        except Exception as e:
-            print(Fore.RED + f"Error in aggregation: {str(e)}" + Style.RESET_ALL)
-            # If direct invocation fails, return the first extraction as a fallback
-            return extractions[0] if extractions else "No extractions to aggregate"
+        # Errors propagate so the caller can retry or fall back to another aggregator
+        result = self.model.invoke(
+            [
+                {"role": "system", "content": AGGREGATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ]
+        )
 
         # Extract and return the markdown content
         return self._extract_markdown_content(result)
 
 
+class SimulatedProviderError(Exception):
+    """Failure injected by the local provider, shaped like an HTTP API error."""
+
+    def __init__(self, message, status_code=503, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class LocalModelProvider(ModelProvider):
+    """
+    Deterministic offline provider for benchmarking and keyless runs.
+
+    Replays recorded responses when available, otherwise produces synthetic
+    markdown in the extraction output format. Latency, output length, tool-call
+    pattern and failure rate are configured through environment variables,
+    either globally (LOCAL_MODEL_<SETTING>) or per model name (e.g. model
+    "local-slow" reads LOCAL_SLOW_<SETTING> first):
+
+    - REPLAY_DIR: directory of recorded responses (slide_<n>.md,
+      aggregation_slide_<n>.md, optionally under a <model_name>/ subdirectory)
+    - LATENCY_MEDIAN: median simulated latency in seconds (default 0)
+    - LATENCY_SIGMA: log-normal spread of the latency (default 0.5)
+    - OUTPUT_TOKENS: approximate size of synthetic output (default 400)
+    - TOOL_CALLS: comma-separated tool names called per extraction (default none)
+    - FAILURE_RATE: probability that a call raises SimulatedProviderError (default 0)
+    - NOISE: fraction of synthetic data points this model drops or alters (default 0.1)
+    - SEED: base random seed (default 0)
+    """
+
+    DRUGS = [
+        "pembrolizumab", "nivolumab", "osimertinib", "trastuzumab deruxtecan",
+        "sotorasib", "tirzepatide", "semaglutide", "dupilumab", "lecanemab",
+        "zanubrutinib", "datopotamab deruxtecan", "amivantamab",
+    ]
+    COMPANIES = [
+        "Merck", "Bristol Myers Squibb", "AstraZeneca", "Daiichi Sankyo", "Amgen",
+        "Eli Lilly", "Novo Nordisk", "Regeneron", "Eisai", "BeiGene", "Johnson & Johnson",
+    ]
+    DISEASES = [
+        "non-small cell lung cancer", "HER2-positive breast cancer", "type 2 diabetes",
+        "obesity", "atopic dermatitis", "early Alzheimer's disease",
+        "chronic lymphocytic leukemia", "KRAS G12C-mutated colorectal cancer",
+    ]
+    TARGETS = ["PD-1", "EGFR", "HER2", "KRAS G12C", "GLP-1R", "IL-4Rα", "amyloid beta", "BTK"]
+    PHASES = ["Phase 1", "Phase 2", "Phase 3", "Approved"]
+    ENDPOINTS = ["ORR", "PFS", "OS", "HbA1c reduction", "EASI-75", "CDR-SB change"]
+
+    # Distinct prompts whose call counts are remembered (least recently used are forgotten)
+    MAX_TRACKED_PROMPTS = 4096
+
+    def __init__(self, model_name):
+        """
+        Initialize the local model provider.
+
+        Args:
+            model_name: Name of the local model (e.g., "local", "local-fast")
+        """
+        super().__init__(model_name)
+        print(Fore.GREEN + f"Initializing local model: {model_name}" + Style.RESET_ALL)
+        self._setting_prefix = re.sub(r"[^A-Z0-9]+", "_", model_name.upper())
+
+        self.replay_dir = self._setting("REPLAY_DIR")
+        self.latency_median = float(self._setting("LATENCY_MEDIAN", 0))
+        self.latency_sigma = float(self._setting("LATENCY_SIGMA", 0.5))
+        self.output_tokens = int(self._setting("OUTPUT_TOKENS", 400))
+        self.tool_calls = [
+            name.strip()
+            for name in self._setting("TOOL_CALLS", "").split(",")
+            if name.strip()
+        ]
+        self.failure_rate = float(self._setting("FAILURE_RATE", 0))
+        self.noise = float(self._setting("NOISE", 0.1))
+        self.seed = int(self._setting("SEED", 0))
+        # sha256 of (kind, prompt) -> calls so far, least recently used first
+        self._call_counts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _setting(self, name, default=None):
+        value = get_env(f"{self._setting_prefix}_{name}")
+        if value is None:
+            value = get_env(f"LOCAL_MODEL_{name}", default)
+        return value
+
+    def _rng(self, kind, prompt):
+        """
+        Deterministic RNG for a given model, call kind and prompt.
+
+        Repeated calls with the same prompt (e.g., retries) get the next seed in
+        sequence, so injected failures are reproducible but not permanent.
+        """
+        key = hashlib.sha256(f"{kind}:{prompt}".encode()).digest()
+        with self._lock:
+            attempt = self._call_counts.pop(key, 0)
+            self._call_counts[key] = attempt + 1
+            if len(self._call_counts) > self.MAX_TRACKED_PROMPTS:
+                self._call_counts.popitem(last=False)
+        digest = hashlib.sha256(
+            f"{self.seed}:{self.model_name}:{kind}:{prompt}:{attempt}".encode()
+        ).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _simulate_call(self, rng, budget=None):
+        """Sleep for a sampled latency and inject failures at the configured rate."""
+        if self.latency_median > 0:
+            latency = rng.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+            if budget is None:
+                time.sleep(latency)
+            elif budget.wait_cancelled(latency):
+                raise ExtractionCancelled(f"{self.model_name} extraction cancelled")
+
+        if rng.random() < self.failure_rate:
+            raise SimulatedProviderError(
+                f"Simulated failure from {self.model_name}", status_code=503
+            )
+
+    def _replay(self, filename):
+        """Return a recorded response, if one exists for this model."""
+        if not self.replay_dir:
+            return None
+
+        for path in (
+            os.path.join(self.replay_dir, self.model_name, filename),
+            os.path.join(self.replay_dir, filename),
+        ):
+            if os.path.exists(path):
+                with open(path) as f:
+                    return f.read()
+        return None
+
+    def extract_pharmaceutical_data(
+        self, slide_image, prompt, system_prompt, tools, budget=None, guard=None
+    ):
+        """
+        Produce a deterministic extraction without calling a remote model.
+
+        Args:
+            slide_image: Base64-encoded slide image (unused)
+            prompt: The user prompt for extraction
+            system_prompt: The system prompt for extraction (unused)
+            tools: List of tools to call according to TOOL_CALLS
+            budget: Optional BudgetTracker bounding tool calls, agent steps and time
+            guard: Optional callable (fn, *args, **kwargs) each model call runs
+                   through (retries and circuit breaker)
+
+        Returns:
+            Markdown-formatted extraction result
+        """
+        slide_number = self._slide_number(prompt)
+        rng = self._rng("extract", prompt)
+
+        if budget is not None:
+            tools = budget.wrap_tools(tools)
+        tools_by_name = {tool.name: tool for tool in tools}
+
+        print(
+            Fore.BLUE + f"Using {self.model_name} for extraction..." + Style.RESET_ALL
+        )
+
+        # Each simulated tool round costs one agent step plus one tool call
+        tool_results = []
+        for tool_name in self.tool_calls:
+            if budget is not None:
+                budget.record_step()
+                if budget.exhausted_reason():
+                    break
+            tool = tools_by_name.get(tool_name)
+            if tool is None:
+                continue
+            arg_name = next(iter(tool.args), None)
+            if arg_name is None:
+                continue
+            tool_results.append(tool.invoke({arg_name: rng.choice(self.DRUGS)}))
+
+        if budget is not None:
+            budget.record_step()
+
+        # The simulated model call stands in for the agent's model steps
+        if guard is None:
+            self._simulate_call(rng, budget)
+        else:
+            guard(self._simulate_call, rng, budget)
+
+        replayed = self._replay(f"slide_{slide_number}.md")
+        if replayed is not None:
+            return replayed
+
+        return self._synthetic_extraction(slide_number, rng, len(tool_results))
+
+    def aggregate_extractions(self, extractions, prompt):
+        """
+        Aggregate extractions locally by keeping the most detailed one.
+
+        Args:
+            extractions: List of extraction results
+            prompt: The aggregation prompt
+
+        Returns:
+            Aggregated extraction in markdown format
+        """
+        print(
+            Fore.BLUE + f"Using {self.model_name} for aggregation..." + Style.RESET_ALL
+        )
+        if not extractions:
+            return "No extractions to aggregate"
+
+        rng = self._rng("aggregate", prompt)
+        self._simulate_call(rng)
+
+        slide_number = self._slide_number(prompt)
+        replayed = self._replay(f"aggregation_slide_{slide_number}.md")
+        if replayed is not None:
+            return replayed
+
+        best = max(extractions, key=lambda extraction: extraction.count("- **"))
+        _, _, final_extraction = best.partition("Extraction:")
+        return (
+            f"Analysis: Compared {len(extractions)} extractions locally.\n\n"
+            "Aggregation Approach: Selected the extraction with the most data points.\n\n"
+            f"Final Extraction:\n{final_extraction or best}"
+        )
+
+    @staticmethod
+    def _slide_number(prompt):
+        match = re.search(r"Slide Number:\s*(\d+)", prompt)
+        return int(match.group(1)) if match else 0
+
+    def _synthetic_extraction(self, slide_number, rng, tool_rounds):
+        """
+        Build synthetic markdown in the extraction output format.
+
+        Facts are seeded by the slide number so that different local models
+        broadly agree; each model then drops or alters a NOISE fraction of them.
+        """
+        facts_rng = random.Random(f"{self.seed}:slide:{slide_number}")
+        drug = facts_rng.choice(self.DRUGS)
+        company = facts_rng.choice(self.COMPANIES)
+        disease = facts_rng.choice(self.DISEASES)
+        trial_id = f"NCT0{facts_rng.randint(1000000, 9999999)}"
+
+        categories = {
+            "Drug Information": [
+                ("Drug Name", drug),
+                ("Molecular Target", facts_rng.choice(self.TARGETS)),
+                ("Development Stage", facts_rng.choice(self.PHASES)),
+            ],
+            "Company Information": [
+                ("Company", company),
+                ("Development Role", "Originator"),
+            ],
+            "Clinical Trial": [
+                ("Trial ID", trial_id),
+                ("Indication", disease),
+                ("Enrollment", str(facts_rng.randint(40, 1200))),
+            ],
+        }
+
+        # Roughly 15 tokens per bullet; add efficacy data points to reach the target size
+        bullet_count = max(1, self.output_tokens // 15)
+        extra = []
+        for index in range(max(0, bullet_count - 8)):
+            endpoint = facts_rng.choice(self.ENDPOINTS)
+            extra.append(
+                (f"{endpoint} (Cohort {index + 1})", f"{facts_rng.randint(5, 80)}%")
+            )
+        categories["Efficacy Data"] = extra
+
+        lines = [
+            f"Observation: Slide {slide_number} presents data on {drug} ({company}) in {disease}.",
+            "",
+            f"Thought: Extract drug, company, trial and efficacy data points. Tool rounds used: {tool_rounds}.",
+            "",
+            "Decision: Data points below are taken from the slide content.",
+            "",
+            "Extraction:",
+        ]
+        for category, data_points in categories.items():
+            if not data_points:
+                continue
+            lines.append(f"### {category}")
+            for field, value in data_points:
+                confidence = facts_rng.randint(3, 5)
+                if rng.random() < self.noise:
+                    if rng.random() < 0.5:
+                        continue  # this model missed the data point
+                    confidence = max(1, confidence - 1)
+                    value = f"{value} (approx.)"
+                lines.append(
+                    f"- **{field}**: {value} (Confidence: {confidence}) [Slide: {slide_number}]"
+                )
+            lines.append("")
+
+        lines.append(
+            "Reasoning: Synthetic extraction generated by the local provider for offline runs."
+        )
+        return "\n".join(lines)
+
+
 def create_model_provider(provider_type, model_name):
     """
     Factory function to create the appropriate model provider.
 
     Args:
-        provider_type: Type of provider ('google', 'anthropic', 'openai')
+        provider_type: Type of provider ('google', 'anthropic', 'openai', 'local')
         model_name: Name of the specific model
 
     Returns:
@@ -537,5 +1010,26 @@ def create_model_provider(provider_type, model_name):
         return AnthropicModelProvider(model_name)
     elif provider_type == "openai":
         return OpenAIModelProvider(model_name)
+    elif provider_type == "local":
+        return LocalModelProvider(model_name)
     else:
         raise ValueError(f"Unsupported provider type: {provider_type}")
+
+
+def get_model_provider(provider_type, model_name):
+    """
+    Shared provider for a model, created on first use.
+
+    Providers are kept in the registry, so workflows built in the same process
+    (e.g., graph_instance.py and the CLI) reuse one client per model.
+
+    Args:
+        provider_type: Type of provider ('google', 'anthropic', 'openai', 'local')
+        model_name: Name of the specific model
+
+    Returns:
+        ModelProvider instance
+    """
+    name = f"provider:{model_name}"
+    registry.register_default(name, lambda: create_model_provider(provider_type, model_name))
+    return registry.get(name)
@@ -0,0 +1,56 @@
+# quorum.py
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+
+class QuorumPolicy(BaseModel):
+    """When a slide's aggregation may start before every model has returned."""
+
+    # Aggregate once this many model extractions have succeeded
+    min_results: int = 2
+    # ...or once this many seconds have passed (with at least one extraction)
+    deadline_seconds: Optional[float] = None
+    # What happens to extractions that arrive after the quorum:
+    # "drop" cancels them, "reaggregate" re-aggregates the slide before export
+    late_results: Literal["drop", "reaggregate"] = "drop"
+
+
+def wait_for_quorum(futures, policy):
+    """
+    Wait until a quorum of model extractions is available.
+
+    Futures resolve to a ModelExtraction, or None when the model failed; only
+    successful extractions count towards the quorum. If the deadline passes
+    before any extraction succeeded, waiting continues until the first one does
+    (or all futures are done).
+
+    Args:
+        futures: Futures of running model extractions
+        policy: QuorumPolicy
+
+    Returns:
+        Tuple of (list of successful extractions, set of still-pending futures)
+    """
+    deadline = None
+    if policy.deadline_seconds is not None:
+        deadline = time.monotonic() + policy.deadline_seconds
+
+    results = []
+    pending = set(futures)
+    while pending and len(results) < policy.min_results:
+        timeout = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and results:
+                break
+            timeout = remaining if remaining > 0 else None
+
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = future.result()
+            if result is not None:
+                results.append(result)
+
+    return results, pending
@@ -0,0 +1,69 @@
+# registry.py
+import threading
+from colorama import Fore, Style
+
+
+class Registry:
+    """
+    Lazily constructed, process-wide shared components.
+
+    Components (search API clients, embeddings, vector stores, ...) are
+    registered with a factory and only built on first use, so importing the
+    package stays fast and works without API keys or network access until a
+    component is actually needed.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        # Factories may look up other components, so the lock is reentrant
+        self._lock = threading.RLock()
+
+    def register(self, name, factory):
+        """
+        Register a factory for a component.
+
+        Args:
+            name: Component name (e.g., "tavily_search")
+            factory: Callable with no arguments that builds the component
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def register_default(self, name, factory):
+        """Register a factory unless one is already registered under name."""
+        with self._lock:
+            self._factories.setdefault(name, factory)
+
+    def get(self, name):
+        """
+        Return a component, building it on first use.
+
+        Raises:
+            KeyError: If no factory is registered under name
+            Exception: Whatever the factory raises (nothing is cached then)
+        """
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._factories:
+                    raise KeyError(f"No component registered as {name}")
+                print(Fore.GREEN + f"Initializing {name}..." + Style.RESET_ALL)
+                self._instances[name] = self._factories[name]()
+            return self._instances[name]
+
+    def is_initialized(self, name):
+        with self._lock:
+            return name in self._instances
+
+    def reset(self, name=None):
+        """Drop a built component (or all of them) so the next get() rebuilds it."""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+
+# Shared components of the current process
+registry = Registry()
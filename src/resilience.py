@@ -0,0 +1,301 @@
+# resilience.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+from pydantic import BaseModel
+from langchain_core.runnables import RunnableBinding
+from colorama import Fore, Style
+from .metrics import run_metrics
+
+# HTTP status codes worth retrying (529 is Anthropic's "overloaded")
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Exception class names raised by the provider SDKs for transient failures
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+    "TooManyRequests",
+    "ConnectError",
+    "ReadTimeout",
+    "ConnectTimeout",
+    "RemoteProtocolError",
+}
+
+
+class ResiliencePolicy(BaseModel):
+    """Retry and circuit breaker settings for provider calls."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    failure_threshold: int = 5
+    recovery_timeout: float = 60.0
+
+
+class CircuitOpenError(Exception):
+    """Raised when a provider's circuit breaker is open and the call is skipped."""
+
+
+def is_retryable(error):
+    """
+    Decide whether a provider error is transient.
+
+    Args:
+        error: Exception raised by a provider call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if callable(status_code):
+        status_code = status_code()
+    if isinstance(status_code, int) and status_code in RETRYABLE_STATUS_CODES:
+        return True
+
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after_seconds(error):
+    """
+    Read the server's requested retry delay from an error, if any.
+
+    Checks a retry_after attribute, then retry-after-ms and retry-after response
+    headers (seconds or an HTTP date).
+
+    Returns:
+        Delay in seconds, or None
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    Opens after failure_threshold consecutive retryable failures, rejects calls
+    for recovery_timeout seconds, then lets a single trial call through
+    (half-open). A successful trial closes the circuit; a failure reopens it.
+    """
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                # Let one trial request through
+                self.state = "half_open"
+                return True
+            # half_open: a trial request is already in flight
+            return False
+
+    def is_open(self):
+        """True while the circuit is open and still within its recovery timeout."""
+        with self._lock:
+            return (
+                self.state == "open"
+                and time.monotonic() - self.opened_at < self.recovery_timeout
+            )
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                print(
+                    Fore.GREEN
+                    + f"[CIRCUIT] {self.name} recovered, closing circuit"
+                    + Style.RESET_ALL
+                )
+            self.state = "closed"
+            self.consecutive_failures = 0
+
+    def record_neutral(self):
+        """End a call that says nothing about provider health (caller-side error, cancellation)."""
+        with self._lock:
+            if self.state == "half_open":
+                # The trial was inconclusive; let the next call be the trial
+                self.state = "open"
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if (
+                self.state == "half_open"
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != "open":
+                    print(
+                        Fore.RED
+                        + f"[CIRCUIT] {self.name} degraded after {self.consecutive_failures} failures, "
+                        + f"skipping it for {self.recovery_timeout:g}s"
+                        + Style.RESET_ALL
+                    )
+                    run_metrics.increment(f"resilience.circuit_opened.{self.name}")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class ResilientCaller:
+    """
+    Wraps provider calls with exponential backoff, jitter and circuit breakers.
+
+    One circuit breaker is kept per provider name (e.g., "google", "openai").
+    """
+
+    def __init__(self, policy: Optional[ResiliencePolicy] = None):
+        self.policy = policy or ResiliencePolicy()
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, provider_name):
+        with self._lock:
+            if provider_name not in self._breakers:
+                self._breakers[provider_name] = CircuitBreaker(
+                    provider_name,
+                    failure_threshold=self.policy.failure_threshold,
+                    recovery_timeout=self.policy.recovery_timeout,
+                )
+            return self._breakers[provider_name]
+
+    def is_available(self, provider_name):
+        """True unless the provider's circuit is open."""
+        return not self.breaker(provider_name).is_open()
+
+    def call(self, provider_name, fn, *args, **kwargs):
+        """
+        Call fn with retries on transient errors.
+
+        Args:
+            provider_name: Provider whose circuit breaker guards the call
+            fn: Callable to invoke
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open
+            Exception: The last error if it is not retryable or attempts run out
+        """
+        breaker = self.breaker(provider_name)
+        policy = self.policy
+
+        for attempt in range(1, policy.max_attempts + 1):
+            if not breaker.allow_request():
+                run_metrics.increment(f"resilience.skipped.{provider_name}")
+                raise CircuitOpenError(f"Circuit open for provider {provider_name}")
+
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    # Caller-side errors (bad request, auth) and cancellations
+                    # say nothing about provider health
+                    breaker.record_neutral()
+                    raise
+
+                breaker.record_failure()
+                run_metrics.increment(f"resilience.failures.{provider_name}")
+                if attempt == policy.max_attempts:
+                    raise
+
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    # Exponential backoff with full jitter
+                    delay = random.uniform(
+                        0, min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1))
+                    )
+                elif delay > policy.max_delay:
+                    # Provider asked us to wait longer than we are willing to
+                    raise
+
+                print(
+                    Fore.YELLOW
+                    + f"[RETRY] {provider_name} call failed ({type(e).__name__}: {e}); "
+                    + f"retrying in {delay:.1f}s (attempt {attempt + 1}/{policy.max_attempts})"
+                    + Style.RESET_ALL
+                )
+                run_metrics.increment(f"resilience.retries.{provider_name}")
+                time.sleep(delay)
+                continue
+
+            breaker.record_success()
+            return result
+
+
+class GuardedModel(RunnableBinding):
+    """
+    Chat model with tools bound whose every invoke goes through a guard.
+
+    Given to create_react_agent instead of the bare model, so that retries
+    and the circuit breaker apply to each model step of the agent rather
+    than to the whole run (which would replay earlier steps and tool calls).
+    """
+
+    guard: Callable[..., Any]
+
+    def invoke(self, input, config=None, **kwargs):
+        return self.guard(super().invoke, input, config, **kwargs)
+
+
+def guarded_model(model, tools, guard):
+    """
+    Bind tools to a chat model and route its calls through guard.
+
+    Args:
+        model: LangChain chat model
+        tools: Tools the agent may call
+        guard: Callable (fn, *args, **kwargs) -> result, e.g. a ResilientCaller.call
+               partial for the model's provider
+
+    Returns:
+        GuardedModel, or the bare model when guard is None
+    """
+    if guard is None:
+        return model
+    bound = model.bind_tools(tools) if tools else model.bind()
+    return GuardedModel(bound=bound.bound, kwargs=bound.kwargs, config=bound.config, guard=guard)
@@ -0,0 +1,79 @@
+# schema.py
+import json
+import os
+import re
+from functools import lru_cache
+
+# Compact JSON of module -> table -> {"fields", "description"}
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pharma_schema.json")
+
+
+@lru_cache(maxsize=None)
+def load_schema():
+    """
+    Load the pharmaceutical database schema on first use.
+
+    Returns:
+        Dict of module -> table -> {"fields", "description"}, shared by all callers
+    """
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Bookkeeping modules that slides never map to
+IGNORED_MODULES = {"Document_Reference_Module", "Metadata_Tracking_Module"}
+
+# Table name parts too generic to say which schema module a slide touches
+GENERIC_TABLE_TOKENS = {
+    "analysis", "area", "change", "component", "cross", "data", "detail",
+    "entity", "event", "history", "impact", "log", "mapping", "metadata",
+    "model", "period", "point", "post", "process", "project", "rate",
+    "reference", "related", "relationship", "result", "setting", "source",
+    "standard", "status", "tracking", "type", "version",
+}
+
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9-]+")
+
+
+def singular(token):
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith(("sses", "xes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+@lru_cache(maxsize=None)
+def module_keywords():
+    """Keywords per schema module, taken from the module's table names (built on first use)."""
+    keywords = {}
+    for module, tables in load_schema().items():
+        if module in IGNORED_MODULES:
+            continue
+        tokens = set()
+        for table in tables:
+            for token in table.split("_"):
+                token = singular(token)
+                if len(token) >= 4 and token not in GENERIC_TABLE_TOKENS:
+                    tokens.add(token)
+        keywords[module] = tokens
+    return keywords
+
+
+def _words(text):
+    return {singular(word) for word in WORD_PATTERN.findall(text.lower())}
+
+
+def schema_modules(text):
+    """Schema modules whose table keywords appear in the text."""
+    words = _words(text)
+    return {module for module, keywords in module_keywords().items() if words & keywords}
+
+
+def __getattr__(name):
+    # `from .schema import PHARMA_SCHEMA` keeps working and loads the schema then
+    if name == "PHARMA_SCHEMA":
+        return load_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
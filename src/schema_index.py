@@ -0,0 +1,174 @@
+# schema_index.py
+import json
+import re
+from collections import defaultdict
+from functools import lru_cache
+from .schema import singular
+
+# Names models commonly use for tables whose schema name differs
+TABLE_SYNONYMS = {
+    "drug": "drugs",
+    "company": "companies",
+    "disease": "diseases",
+    "target": "molecular_targets",
+    "trial": "clinical_trials",
+}
+
+# Minimum trigram similarity for fuzzy table suggestions
+FUZZY_MIN_SIMILARITY = 0.3
+FUZZY_MAX_MATCHES = 5
+
+
+def normalize_name(text):
+    """Lowercase and join words with underscores ("Clinical Trials" -> "clinical_trials")."""
+    return "_".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def trigrams(text):
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SchemaIndex:
+    """
+    Precomputed lookups for check_schema.
+
+    Built once from the schema: a table -> module map, an alias map covering
+    table and module names, their singular forms and common synonyms, and a
+    character trigram index over table names for partial and fuzzy matches.
+    Responses are serialized to compact JSON once per distinct query.
+    """
+
+    def __init__(self, schema):
+        """
+        Index a schema.
+
+        Args:
+            schema: Dict of module -> table -> {"description", "fields"}
+        """
+        self.schema = schema
+        self.table_modules = {}
+        self.table_aliases = {}
+        self.module_aliases = {}
+        self.table_trigrams = {}
+        self.trigram_tables = defaultdict(set)
+
+        for module, tables in schema.items():
+            module_key = normalize_name(module)
+            for alias in (module_key, module_key.removesuffix("_module")):
+                self.module_aliases.setdefault(alias, module)
+                self.module_aliases.setdefault(_singular_name(alias), module)
+            for table in tables:
+                self.table_modules.setdefault(table, module)
+                self.table_aliases.setdefault(table, table)
+                self.table_aliases.setdefault(_singular_name(table), table)
+                self.table_trigrams[table] = trigrams(table)
+                for trigram in self.table_trigrams[table]:
+                    self.trigram_tables[trigram].add(table)
+
+        for alias, table in TABLE_SYNONYMS.items():
+            if table in self.table_modules:
+                self.table_aliases[alias] = table
+
+        self.lookup = lru_cache(maxsize=1024)(self._lookup)
+
+    def _table_response(self, table):
+        module = self.table_modules[table]
+        return {
+            "module": module,
+            "table": table,
+            "description": self.schema[module][table]["description"],
+            "fields": self.schema[module][table]["fields"],
+        }
+
+    def _module_response(self, module):
+        return {
+            "module": module,
+            "tables": {
+                table: {
+                    "description": table_data["description"],
+                    "field_count": len(table_data["fields"]),
+                }
+                for table, table_data in self.schema[module].items()
+            },
+        }
+
+    def _partial_matches(self, key):
+        """Tables containing key, or failing that the most similar table names."""
+        key_trigrams = trigrams(key)
+        # A table containing key contains its inner trigrams (not the padded edges)
+        inner = {trigram for trigram in key_trigrams if " " not in trigram}
+        if inner:
+            candidates = set.intersection(*(self.trigram_tables.get(t, set()) for t in inner))
+        else:
+            candidates = set(self.table_modules)
+        matches = [table for table in self.table_modules if table in candidates and key in table]
+        if matches:
+            return matches
+
+        scores = defaultdict(int)
+        for trigram in key_trigrams:
+            for table in self.trigram_tables.get(trigram, ()):
+                scores[table] += 1
+        similar = sorted(
+            (
+                (shared / len(key_trigrams | self.table_trigrams[table]), table)
+                for table, shared in scores.items()
+            ),
+            reverse=True,
+        )
+        return [
+            table for similarity, table in similar[:FUZZY_MAX_MATCHES]
+            if similarity >= FUZZY_MIN_SIMILARITY
+        ]
+
+    def _lookup(self, key):
+        if key in self.table_aliases:
+            table = self.table_aliases[key]
+            return "table", table, _dumps(self._table_response(table))
+
+        if key in self.module_aliases:
+            module = self.module_aliases[key]
+            return "module", module, _dumps(self._module_response(module))
+
+        matches = self._partial_matches(key) if key else []
+        if matches:
+            result = {
+                "partial_matches": [
+                    {
+                        "module": self.table_modules[table],
+                        "table": table,
+                        "description": self.schema[self.table_modules[table]][table]["description"],
+                    }
+                    for table in matches
+                ]
+            }
+            return "partial", len(matches), _dumps(result)
+
+        return "none", None, _dumps(
+            {
+                "error": f"No schema information found for '{key}'",
+                "suggestion": "Try a common entity like 'drugs', 'companies', 'diseases', or a module name like 'clinical', 'regulatory'",
+            }
+        )
+
+    def find(self, entity_type):
+        """
+        Look up an entity type, table or module name.
+
+        Args:
+            entity_type: Name as written by the model (any case, spaces or underscores)
+
+        Returns:
+            Tuple of (match kind: "table", "module", "partial" or "none",
+            matched name or match count, compact JSON response)
+        """
+        return self.lookup(normalize_name(entity_type))
+
+
+def _singular_name(name):
+    return "_".join(singular(part) for part in name.split("_"))
+
+
+def _dumps(result):
+    return json.dumps(result, separators=(",", ":"))
@@ -0,0 +1,79 @@
+# schema_router.py
+from .schema import load_schema, schema_modules, singular, WORD_PATTERN
+
+# Modules every slide may need (companies, drugs, diseases, targets, ...)
+ALWAYS_MODULES = ("Core_Entity_Module",)
+
+# Modules for slides without a text layer, where the router has nothing to go on
+IMAGE_ONLY_MODULES = (
+    "Core_Entity_Module",
+    "Drug_Development_Module",
+    "Clinical_Module",
+    "Commercial_Module",
+)
+
+# Bookkeeping columns that say nothing about what to extract (foreign keys are skipped too)
+SKIPPED_FIELDS = {"id", "data", "created_at", "updated_at", "last_update_date", "source_type"}
+
+# "*_id" fields that hold identifiers printed on slides rather than foreign keys
+EXTERNAL_ID_FIELDS = {"nct_id", "uniprot_id"}
+
+
+def route_modules(slide_text):
+    """
+    Choose the schema modules relevant to a slide.
+
+    Args:
+        slide_text: Slide text layer (may be empty)
+
+    Returns:
+        List of module names in schema order
+    """
+    if not slide_text.strip():
+        selected = set(IMAGE_ONLY_MODULES)
+    else:
+        selected = set(ALWAYS_MODULES) | schema_modules(slide_text)
+    return [module for module in load_schema() if module in selected]
+
+
+def render_schema_slice(slide_text, max_tables=5, max_fields=5):
+    """
+    Render the tables of the slide's relevant modules for the extraction prompt.
+
+    Within each module, tables whose names share words with the slide come
+    first, then the rest in schema order, up to max_tables (modules in
+    ALWAYS_MODULES list every table). Each table lists its first max_fields
+    descriptive fields.
+
+    Args:
+        slide_text: Slide text layer (may be empty)
+        max_tables: Tables listed per module
+        max_fields: Fields listed per table
+
+    Returns:
+        Tuple of (markdown schema slice, list of module names)
+    """
+    schema = load_schema()
+    words = {singular(word) for word in WORD_PATTERN.findall(slide_text.lower())}
+    modules = route_modules(slide_text)
+
+    sections = []
+    for module in modules:
+        tables = list(schema[module])
+        ranked = sorted(
+            tables,
+            key=lambda table: (
+                -len({singular(part) for part in table.split("_")} & words),
+                tables.index(table),
+            ),
+        )[: None if module in ALWAYS_MODULES else max_tables]
+        lines = [f"{module.removesuffix('_Module').replace('_', ' ').upper()}:"]
+        for table in sorted(ranked, key=tables.index):
+            fields = [
+                field for field in schema[module][table]["fields"]
+                if field not in SKIPPED_FIELDS
+                and (not field.endswith("_id") or field in EXTERNAL_ID_FIELDS)
+            ][:max_fields]
+            lines.append(f"   - {table} ({', '.join(fields)})")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections), modules
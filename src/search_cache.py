@@ -0,0 +1,155 @@
+# search_cache.py
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from colorama import Fore, Style
+from .env_utils import get_env
+from .metrics import run_metrics
+from .single_flight import SingleFlight
+
+
+def normalize_query(query):
+    """Lowercase, drop punctuation and collapse whitespace so equivalent queries share a key."""
+    return " ".join(re.sub(r"[^\w\s.-]", " ", query.lower()).split())
+
+
+# Start of the message langchain-tavily's TavilySearch returned for empty results
+# (string results cached by earlier versions)
+NO_RESULTS_PREFIX = "No search results found"
+
+
+def _is_empty(result):
+    if isinstance(result, dict):
+        return not result.get("results")
+    if isinstance(result, str):
+        return result.startswith(NO_RESULTS_PREFIX)
+    return not result
+
+
+def _is_error(result):
+    # Search wrappers such as TavilySearch return {"error": exception} instead of raising
+    return isinstance(result, dict) and "error" in result
+
+
+class SearchCache:
+    """
+    Persistent cache for web search results.
+
+    Entries are keyed by the normalized query plus the search options (domain
+    set, topic, depth, result count) and stored in SQLite so they survive
+    across runs. Results expire after ttl_seconds; empty results are cached
+    too, for negative_ttl_seconds. Concurrent identical queries are coalesced
+    into a single request (single flight). Errors, including {"error": ...}
+    results, are never cached.
+    """
+
+    def __init__(self, path=None, ttl_seconds=7 * 24 * 3600, negative_ttl_seconds=3600):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for persistence (None keeps entries in memory only)
+            ttl_seconds: Lifetime of non-empty results
+            negative_ttl_seconds: Lifetime of empty results
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, result TEXT, created_at REAL, empty INTEGER, latency REAL)"
+        )
+        self._db.commit()
+
+    @classmethod
+    def from_env(cls):
+        """
+        Build the cache from SEARCH_CACHE_PATH, SEARCH_CACHE_TTL and SEARCH_CACHE_NEGATIVE_TTL.
+
+        An empty SEARCH_CACHE_PATH keeps the cache in memory for the current process.
+        """
+        return cls(
+            path=get_env("SEARCH_CACHE_PATH", ".cache/search_cache.sqlite") or None,
+            ttl_seconds=float(get_env("SEARCH_CACHE_TTL", 7 * 24 * 3600)),
+            negative_ttl_seconds=float(get_env("SEARCH_CACHE_NEGATIVE_TTL", 3600)),
+        )
+
+    @staticmethod
+    def make_key(query, **options):
+        """Cache key for a query and its search options (lists are order-insensitive)."""
+        normalized = {
+            name: sorted(value) if isinstance(value, (list, tuple, set)) else value
+            for name, value in options.items()
+        }
+        payload = json.dumps([normalize_query(query), normalized], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result, created_at, empty, latency FROM search_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        result, created_at, empty, latency = row
+        ttl = self.negative_ttl_seconds if empty else self.ttl_seconds
+        if time.time() - created_at > ttl:
+            return None
+        return json.loads(result), latency
+
+    def _store(self, key, result, latency):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(result, default=str), time.time(), int(_is_empty(result)), latency),
+            )
+            self._db.commit()
+
+    def get_or_fetch(self, key, fetch):
+        """
+        Return the cached result for key, or fetch and cache it.
+
+        Args:
+            key: Cache key from make_key
+            fetch: Callable performing the search
+
+        Returns:
+            Search result (cached, coalesced or fresh)
+        """
+        run_metrics.increment("search_cache.lookups")
+        cached = self._load(key)
+        if cached is not None:
+            result, latency = cached
+            run_metrics.increment("search_cache.hits")
+            run_metrics.observe("search_cache.saved", latency)
+            print(Fore.CYAN + "[TOOL - search] Cache hit" + Style.RESET_ALL)
+            return result
+
+        def fetch_and_store():
+            started_at = time.monotonic()
+            result = fetch()
+            if _is_error(result):
+                raise ValueError(f"Search failed: {result['error']}")
+            # Stored before the flight ends, so later queries hit the cache
+            self._store(key, result, time.monotonic() - started_at)
+            return result
+
+        # Identical queries already in flight wait for its result
+        result, latency, shared = self._flights.do(key, fetch_and_store)
+        if shared:
+            run_metrics.increment("search_cache.coalesced")
+            run_metrics.observe("search_cache.saved", latency)
+        else:
+            run_metrics.increment("search_cache.misses")
+        return result
@@ -0,0 +1,105 @@
+# single_flight.py
+import threading
+import time
+
+
+class Flight:
+    """A call in progress that concurrent identical calls wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.latency = 0.0
+
+    def wait(self):
+        """
+        Block until the call finishes.
+
+        Returns:
+            The call's result
+
+        Raises:
+            Exception: The call's error, if it failed
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call.
+
+    The first caller of a key (the leader) runs the call; callers arriving
+    while it runs wait for its result or error. Failed calls are always
+    forgotten, so the next caller tries again. With keep_results, successful
+    results stay and later callers reuse them (a memo); otherwise the key is
+    freed once the call finishes.
+    """
+
+    def __init__(self, keep_results=False):
+        self.keep_results = keep_results
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key):
+        """
+        Join the flight for key, starting one if none is in progress.
+
+        Returns:
+            (Flight, leader) where leader is True if the caller must run the
+            call and finish it with resolve or fail
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = Flight()
+            return flight, True
+
+    def resolve(self, key, result, latency=0.0):
+        """Publish the leader's result for key and wake the waiting callers."""
+        with self._lock:
+            flight = self._flights[key] if self.keep_results else self._flights.pop(key)
+        flight.result = result
+        flight.latency = latency
+        flight.done.set()
+
+    def fail(self, key, error):
+        """Publish the leader's error for key, forget the flight and wake the waiting callers."""
+        with self._lock:
+            flight = self._flights.pop(key, None)
+        if flight is not None:
+            flight.error = error
+            flight.done.set()
+
+    def do(self, key, fn):
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Hashable call key
+            fn: Callable making the call
+
+        Returns:
+            (result, latency, shared) where latency is how long the leader's
+            call took and shared is True if the result came from another caller
+
+        Raises:
+            Exception: fn's error, raised in the leader and every waiting caller
+        """
+        flight, leader = self.claim(key)
+        if not leader:
+            return flight.wait(), flight.latency, True
+
+        started_at = time.monotonic()
+        try:
+            result = fn()
+        except BaseException as e:
+            self.fail(key, e)
+            raise
+        latency = time.monotonic() - started_at
+        self.resolve(key, result, latency)
+        return result, latency, False
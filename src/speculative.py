@@ -0,0 +1,109 @@
+# speculative.py
+import re
+from .deck_state import DeckState, ENTITY_FIELD_KEYWORDS
+from .parsing import parse_extraction
+
+# Values models use when they could not identify an entity from the slide alone
+PLACEHOLDER_VALUES = {
+    "unknown", "not specified", "not stated", "not mentioned", "not shown",
+    "unclear", "unspecified", "n/a", "na", "none", "tbd",
+}
+
+# Phrases that point back to earlier slides instead of naming the entity
+BACK_REFERENCE_PATTERN = re.compile(
+    r"\b(?:previous(?:ly)? (?:slide|mentioned)|prior slide|earlier slide|aforementioned|"
+    r"as (?:above|before)|same (?:drug|compound|trial|study|company))\b",
+    re.IGNORECASE,
+)
+
+ENTITY_FIELD_WORDS = tuple(
+    keyword for keywords in ENTITY_FIELD_KEYWORDS.values() for keyword in keywords
+)
+
+
+def neighbour_context(slides, index, max_chars=600):
+    """
+    Deck-level context for speculative extraction: the text of adjacent slides.
+
+    Args:
+        slides: All slides of the document
+        index: Position of the slide being extracted
+        max_chars: Characters of text kept per neighbouring slide
+
+    Returns:
+        Markdown with the previous and next slides' text layers, or ""
+    """
+    sections = []
+    for position in (index - 1, index + 1):
+        if 0 <= position < len(slides):
+            text = " ".join(slides[position].text.split())[:max_chars]
+            if text:
+                sections.append(
+                    f"### Slide {slides[position].slide_number} Text (not yet extracted):\n{text}"
+                )
+    return "\n\n".join(sections)
+
+
+def _mentions(text, name):
+    return re.search(rf"(?<![\w-]){re.escape(name)}(?![\w-])", text) is not None
+
+
+def find_unresolved_slides(slides):
+    """
+    Flag speculatively extracted slides that depend on earlier slides.
+
+    Walks the slides in order while building a deck summary. A slide is
+    flagged when its extraction:
+    - leaves an entity field as a placeholder ("unknown", "not specified", ...)
+      although earlier slides named entities of that kind,
+    - refers back to earlier slides instead of naming the entity, or
+    - omits an entity or abbreviation from earlier slides that its own text
+      layer mentions.
+
+    Args:
+        slides: Slides in document order, with aggregated extractions
+
+    Returns:
+        Dict of slide number -> reason for slides that should be re-extracted
+    """
+    deck_state = DeckState()
+    flagged = {}
+    for slide in slides:
+        extraction = slide.aggregated_extraction
+        if not extraction:
+            continue
+
+        known = deck_state.known_names()
+        if known:
+            reason = _unresolved_reason(slide, extraction, known)
+            if reason:
+                flagged[slide.slide_number] = reason
+
+        deck_state.update(extraction, slide.slide_number, slide.text)
+    return flagged
+
+
+def _unresolved_reason(slide, extraction, known):
+    known_kinds = set(known.values())
+    for record in parse_extraction(extraction):
+        field = record.field.lower()
+        value = record.value.lower().strip(" .")
+        if value in PLACEHOLDER_VALUES and any(word in field for word in ENTITY_FIELD_WORDS):
+            kinds = {
+                kind
+                for kind, keywords in ENTITY_FIELD_KEYWORDS.items()
+                if any(keyword in field for keyword in keywords)
+            }
+            if kinds & known_kinds:
+                return f"{record.field} left as '{record.value}'"
+
+    match = BACK_REFERENCE_PATTERN.search(extraction)
+    if match:
+        return f"refers to '{match.group(0)}'"
+
+    slide_text = slide.text.lower()
+    extraction_text = extraction.lower()
+    for name in sorted(known):
+        if len(name) >= 3 and _mentions(slide_text, name) and not _mentions(extraction_text, name):
+            return f"text mentions '{name}' from an earlier slide"
+    return None
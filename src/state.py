@@ -17,6 +17,7 @@ class Slide(BaseModel):
 
     slide_number: int
     base64_image: str
+    text: str = ""  # Text layer of the PDF page (empty for image-only slides)
     model_extractions: List[ModelExtraction] = []
     aggregated_extraction: Optional[str] = None
 
@@ -40,3 +41,4 @@ class GraphState(TypedDict, total=False):
     extracted_data: List[str]
     processing_complete: bool
     pdf_path: str
+    run_id: str  # Scopes the lookup_previous vector store to this run
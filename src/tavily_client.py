@@ -0,0 +1,60 @@
+# tavily_client.py
+from .http_clients import get_http_client
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+
+class TavilyClient:
+    """
+    Minimal client for the Tavily search REST API.
+
+    Requests go through the shared HTTP connection pool. Only the search
+    endpoint is used; options are passed through as request parameters.
+    """
+
+    def __init__(self, api_key, timeout=60):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: Tavily API key
+            timeout: Request timeout in seconds
+        """
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def search(self, query, **options):
+        """
+        Run a search.
+
+        Args:
+            query: Search query
+            **options: Tavily search parameters (max_results, topic, include_domains, ...)
+
+        Returns:
+            Response dict with a "results" list of {"title", "url", "content", ...}
+
+        Raises:
+            ValueError: If the API responds with an error status
+        """
+        params = {"query": query}
+        params.update({key: value for key, value in options.items() if value is not None})
+        response = get_http_client().post(
+            TAVILY_SEARCH_URL,
+            json=params,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=self.timeout,
+        )
+        if response.status_code != 200:
+            try:
+                detail = response.json().get("detail", {})
+            except ValueError:
+                detail = {}
+            error_message = (
+                detail.get("error") if isinstance(detail, dict) else None
+            ) or response.text[:200] or "Unknown error"
+            raise ValueError(f"Error {response.status_code}: {error_message}")
+        return response.json()
@@ -0,0 +1,95 @@
+# tool_memo.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from colorama import Fore, Style
+from .metrics import run_metrics
+from .single_flight import SingleFlight
+
+# Memos the tools of the current slide share: {"document": ToolMemo, "slide": ToolMemo}.
+# Context variables follow the work into ContextThreadPoolExecutor threads, so
+# every model's agent on a slide sees the same memos.
+current_memos = ContextVar("tool_memos", default=None)
+
+
+class ToolMemo:
+    """
+    Results of tool calls, shared by all models within a scope.
+
+    The first call with a key runs the tool; identical calls made while it
+    is running wait for its result, and later ones reuse it. Failed calls
+    are not memoized.
+    """
+
+    def __init__(self):
+        self._flights = SingleFlight(keep_results=True)
+
+    def call(self, tool_name, key, fetch):
+        """
+        Return the memoized result for (tool_name, key), or run fetch.
+
+        Args:
+            tool_name: Tool being called (for reporting)
+            key: Normalized tool arguments
+            fetch: Callable running the tool
+
+        Returns:
+            Tool result
+        """
+        run_metrics.increment("tool_memo.calls")
+        run_metrics.increment(f"tool_memo.{tool_name}.calls")
+        flight, leader = self._flights.claim((tool_name, key))
+        if not leader:
+            try:
+                result = flight.wait()
+            except Exception:
+                # The call we waited for failed; try again ourselves
+                return fetch()
+            run_metrics.increment("tool_memo.reused")
+            run_metrics.increment(f"tool_memo.{tool_name}.reused")
+            run_metrics.observe("tool_memo.saved", flight.latency)
+            print(
+                Fore.CYAN
+                + f"[TOOL - {tool_name}] Reused result of an identical call"
+                + Style.RESET_ALL
+            )
+            return result
+
+        started_at = time.monotonic()
+        try:
+            result = fetch()
+        except BaseException as e:
+            self._flights.fail((tool_name, key), e)
+            raise
+        self._flights.resolve((tool_name, key), result, time.monotonic() - started_at)
+        return result
+
+
+@contextmanager
+def tool_memo_scope(document_memo, slide_memo):
+    """Share tool results within the document and slide for calls made in this context."""
+    token = current_memos.set({"document": document_memo, "slide": slide_memo})
+    try:
+        yield
+    finally:
+        current_memos.reset(token)
+
+
+def memoized(tool_name, key, scope, fetch):
+    """
+    Run a tool call through the current memo of the given scope.
+
+    Args:
+        tool_name: Tool being called
+        key: Normalized tool arguments
+        scope: "document" for results that do not depend on the slide
+               (search, check_schema), "slide" for those that do (lookup_previous)
+        fetch: Callable running the tool
+
+    Returns:
+        Tool result (run directly when no memo scope is active)
+    """
+    memos = current_memos.get()
+    if memos is None or memos.get(scope) is None:
+        return fetch()
+    return memos[scope].call(tool_name, key, fetch)
@@ -1,24 +1,99 @@
 # tools.py
 from langchain_core.tools import tool
-from langchain_tavily import TavilySearch
 from langchain_core.documents import Document
-from langchain_community.vectorstores import DocArrayInMemorySearch
-from langchain_openai import OpenAIEmbeddings
-from .constants import PHARMA_SCHEMA
 from .env_utils import get_env
-import json
+from .http_clients import get_http_client, get_async_http_client
+from .registry import registry
+from .chunking import chunk_extraction, format_snippets
+from .metrics import run_metrics
+from .search_cache import SearchCache, normalize_query
+from .schema_index import SchemaIndex, normalize_name
+from .tool_memo import memoized
+from .vector_stores import VectorStorePool, current_slide
 from colorama import Fore, Style
 
-# Initialize the underlying Tavily search API with explicit API key
-tavily_api_key = get_env("TAVILY_API_KEY", required=True)
+# Tavily search options (also part of the search cache key)
+SEARCH_OPTIONS = {
+    "max_results": 5,
+    "topic": "general",
+    "include_domains": ["pubmed.ncbi.nlm.nih.gov", "clinicaltrials.gov", "fda.gov"],
+    "search_depth": "advanced",
+}
 
-tavily_api = TavilySearch(
-    max_results=5,
-    topic="general",
-    include_domains=["pubmed.ncbi.nlm.nih.gov", "clinicaltrials.gov", "fda.gov"],
-    search_depth="advanced",
-    tavily_api_key=tavily_api_key,
-)
+
+def _create_tavily_search():
+    """Tavily search client that sends requests through the shared HTTP connection pool."""
+    from .tavily_client import TavilyClient
+
+    return TavilyClient(api_key=get_env("TAVILY_API_KEY", required=True))
+
+
+def _create_embeddings():
+    """OpenAI embeddings behind a batching, deduplicating cache."""
+    from langchain_openai import OpenAIEmbeddings
+    from .embedding_cache import CachedEmbeddings
+
+    model_name = "text-embedding-3-small"
+    return CachedEmbeddings.from_env(
+        OpenAIEmbeddings(
+            model=model_name,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+        ),
+        model_name,
+    )
+
+
+# lookup_previous retrieval backends (LOOKUP_BACKEND)
+LOOKUP_BACKENDS = ("hybrid", "lexical", "vector")
+
+# Chunks retrieved per lookup_previous call and the size cap of its response
+LOOKUP_RESULTS = 8
+LOOKUP_MAX_CHARS = int(get_env("LOOKUP_MAX_CHARS", 1200))
+
+
+def _create_vector_stores():
+    """
+    Per-run lookup_previous stores; VECTOR_STORE_MAX_RUNS bounds how many are retained.
+
+    LOOKUP_BACKEND selects BM25 plus entity-name search ("lexical", offline),
+    embeddings ("vector") or both blended ("hybrid", the default).
+    """
+    from .lexical_index import HybridIndex, LexicalIndex
+    from .vector_index import VectorIndex
+
+    backend = get_env("LOOKUP_BACKEND", "hybrid")
+    if backend not in LOOKUP_BACKENDS:
+        raise ValueError(
+            f"Unknown LOOKUP_BACKEND: {backend}. Choose from: {', '.join(LOOKUP_BACKENDS)}"
+        )
+
+    def create_vector_index():
+        return VectorIndex(embedding=registry.get("embeddings"))
+
+    factories = {
+        "hybrid": lambda: HybridIndex(vector_factory=create_vector_index),
+        "lexical": LexicalIndex,
+        "vector": create_vector_index,
+    }
+    return VectorStorePool(
+        factory=factories[backend],
+        max_namespaces=int(get_env("VECTOR_STORE_MAX_RUNS", 8)),
+    )
+
+
+def _create_schema_index():
+    from .schema import load_schema
+
+    return SchemaIndex(load_schema())
+
+
+registry.register("tavily_search", _create_tavily_search)
+# Search results shared across models, slides and runs
+registry.register("search_cache", SearchCache.from_env)
+registry.register("embeddings", _create_embeddings)
+registry.register("vector_stores", _create_vector_stores)
+registry.register("schema_index", _create_schema_index)
 
 
 @tool
@@ -36,22 +111,10 @@ def search(term: str) -> str:
     """
     print(Fore.CYAN + f"[TOOL - search] Input: {term}" + Style.RESET_ALL)
     try:
-        # Call the Tavily API with the search term
-        search_results = tavily_api.invoke({"query": f"pharmaceutical {term}"})
-
-        # Format results for readability in the agent's context
-        formatted_results = "### Search Results\n\n"
-
-        if isinstance(search_results, dict) and "results" in search_results:
-            # Handle direct API response format
-            results = search_results["results"]
-            for i, result in enumerate(results, 1):
-                formatted_results += f"{i}. **{result['title']}**\n"
-                formatted_results += f"   {result['content']}\n\n"
-        else:
-            # Handle string response format (when used with a ToolMessage)
-            formatted_results += search_results
-
+        # Identical searches by the document's models run once
+        formatted_results = memoized(
+            "search", normalize_query(term), "document", lambda: _search(term)
+        )
         print(
             Fore.CYAN
             + f"[TOOL - search] Output length: {len(formatted_results)} chars"
@@ -64,29 +127,57 @@ def search(term: str) -> str:
         return error_msg
 
 
-embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-vector_store = DocArrayInMemorySearch.from_documents(documents=[], embedding=embeddings)
+def _search(term):
+    # Call the Tavily API with the search term (cached per query and search options)
+    query = f"pharmaceutical {term}"
+    cache_key = SearchCache.make_key(query, **SEARCH_OPTIONS)
+    search_results = registry.get("search_cache").get_or_fetch(
+        cache_key, lambda: registry.get("tavily_search").search(query, **SEARCH_OPTIONS)
+    )
+
+    # Format results for readability in the agent's context
+    formatted_results = "### Search Results\n\n"
+
+    if isinstance(search_results, dict) and "results" in search_results:
+        # Handle direct API response format
+        results = search_results["results"]
+        for i, result in enumerate(results, 1):
+            formatted_results += f"{i}. **{result['title']}**\n"
+            formatted_results += f"   {result['content']}\n\n"
+    elif isinstance(search_results, str):
+        # Handle string responses (cached by earlier versions)
+        formatted_results += search_results
+    else:
+        raise ValueError(f"Unexpected search result: {str(search_results)[:200]}")
+    return formatted_results
 
 
 def update_vector_store(extraction_text: str, slide_number: int):
-    """Add an extraction to the vector store."""
+    """Add an extraction to the vector store, one document per section and data point."""
     try:
-        # Add the extraction as a document with slide number as metadata
-        doc = Document(
-            page_content=extraction_text, metadata={"slide_number": slide_number}
-        )
-
-        # Add to vector store
-        vector_store.add_documents([doc])
+        # Index the extraction in chunks with the slide number as metadata
+        docs = chunk_extraction(extraction_text, slide_number)
+
+        # Add to the vector store of the current run, replacing the chunks
+        # of an earlier extraction of the slide (speculative re-runs)
+        store = registry.get("vector_stores").get()
+        store.delete_slide(slide_number)
+        store.add_documents(docs)
         print(
             Fore.GREEN
-            + f"Added extraction from slide {slide_number} to vector store"
+            + f"Added extraction from slide {slide_number} to vector store ({len(docs)} chunks)"
             + Style.RESET_ALL
         )
     except Exception as e:
         print(Fore.RED + f"Error updating vector store: {str(e)}" + Style.RESET_ALL)
 
 
+def release_vector_store(run_id):
+    """Discard the vector store of a finished run."""
+    if registry.is_initialized("vector_stores"):
+        registry.get("vector_stores").drop(run_id)
+
+
 @tool
 def lookup_previous(concept: str) -> str:
     """
@@ -99,32 +190,43 @@ def lookup_previous(concept: str) -> str:
         Relevant information from previous slides that matches the search concept
     """
     try:
-        # Perform similarity search
-        results = vector_store.similarity_search(
-            query=concept,
-            k=3,  # Return top 3 most relevant results
+        # Earlier slides do not change while a slide is extracted, so
+        # identical lookups by the slide's models run once
+        formatted_results = memoized(
+            "lookup_previous",
+            normalize_query(concept),
+            "slide",
+            lambda: _lookup_previous(concept),
         )
+        run_metrics.increment("lookup_previous.calls")
+        run_metrics.increment("lookup_previous.chars", len(formatted_results))
+        return formatted_results
 
-        if not results:
-            return f"No information found about '{concept}' in previous slides."
-
-        # Format results - return full slide content
-        formatted_results = (
-            f"### Information about '{concept}' from previous slides:\n\n"
-        )
+    except Exception as e:
+        return f"Error searching previous slides: {str(e)}"
 
-        for doc in results:
-            slide_num = doc.metadata.get("slide_number", "Unknown")
 
-            # Include the full slide content
-            formatted_results += (
-                f"**From Slide {slide_num}:**\n\n{doc.page_content}\n\n---\n\n"
-            )
+def _lookup_previous(concept):
+    # Perform similarity search
+    # Only slides of the current run's document before the slide being
+    # extracted are searched
+    results = registry.get("vector_stores").get().similarity_search(
+        query=concept,
+        k=LOOKUP_RESULTS,
+        before_slide=current_slide.get(),
+    )
 
-        return formatted_results
+    if not results:
+        return f"No information found about '{concept}' in previous slides."
 
-    except Exception as e:
-        return f"Error searching previous slides: {str(e)}"
+    # Compact, deduplicated data points with their slides, under a size cap
+    snippets, omitted = format_snippets(results, LOOKUP_MAX_CHARS)
+    formatted_results = (
+        f"### Information about '{concept}' from previous slides:\n{snippets}\n"
+    )
+    if omitted:
+        formatted_results += f"({omitted} more matching data points omitted)\n"
+    return formatted_results
 
 
 @tool
@@ -143,88 +245,28 @@ def check_schema(entity_type: str) -> str:
         + f"[TOOL - check_schema] Input: entity_type='{entity_type}'"
         + Style.RESET_ALL
     )
-    # Normalize the entity type to handle common variations
-    entity_type = entity_type.strip().lower()
-
-    # Handle common singular/plural variations
-    if entity_type == "drug":
-        entity_type = "drugs"
-    elif entity_type == "company":
-        entity_type = "companies"
-    elif entity_type == "disease":
-        entity_type = "diseases"
-    elif entity_type == "target":
-        entity_type = "molecular_targets"
-
-    # First, search for the entity as a table name directly in any module
-    for module_name, module_tables in PHARMA_SCHEMA.items():
-        if entity_type in module_tables:
-            result = {
-                "module": module_name,
-                "table": entity_type,
-                "description": module_tables[entity_type]["description"],
-                "fields": module_tables[entity_type]["fields"],
-            }
-            json_result = json.dumps(result, indent=2)
-            print(
-                Fore.CYAN
-                + f"[TOOL - check_schema] Output: Found exact table match for '{entity_type}'"
-                + Style.RESET_ALL
-            )
-            return json_result
-
-    # If not found as a table, check if it's a module name
-    if entity_type in PHARMA_SCHEMA:
-        result = {"module": entity_type, "tables": {}}
-        for table_name, table_data in PHARMA_SCHEMA[entity_type].items():
-            result["tables"][table_name] = {
-                "description": table_data["description"],
-                "field_count": len(table_data["fields"]),
-            }
-        json_result = json.dumps(result, indent=2)
-        print(
-            Fore.CYAN
-            + f"[TOOL - check_schema] Output: Found module match for '{entity_type}' with {len(result['tables'])} tables"
-            + Style.RESET_ALL
-        )
-        return json_result
+    run_metrics.increment("check_schema.calls")
+    # Alias, synonym, module and partial matches are precomputed; responses are memoized
+    match, name, json_result = memoized(
+        "check_schema",
+        normalize_name(entity_type),
+        "document",
+        lambda: registry.get("schema_index").find(entity_type),
+    )
 
-    # If we still haven't found it, look for partial matches
-    matches = []
-
-    # Check for partial table name matches
-    for module_name, module_tables in PHARMA_SCHEMA.items():
-        for table_name in module_tables:
-            if entity_type in table_name:
-                matches.append(
-                    {
-                        "module": module_name,
-                        "table": table_name,
-                        "description": module_tables[table_name]["description"],
-                    }
-                )
-
-    if matches:
-        result = {"partial_matches": matches}
-        json_result = json.dumps(result, indent=2)
+    if match == "table":
+        message = f"Found exact table match for '{name}'"
+    elif match == "module":
+        message = f"Found module match for '{name}'"
+    elif match == "partial":
+        message = f"Found {name} partial matches for '{entity_type}'"
+    else:
         print(
-            Fore.CYAN
-            + f"[TOOL - check_schema] Output: Found {len(matches)} partial matches for '{entity_type}'"
+            Fore.RED
+            + f"[TOOL - check_schema] Output: No matches found for '{entity_type}'"
             + Style.RESET_ALL
         )
         return json_result
 
-    # If no matches found, return a helpful error
-    error_result = json.dumps(
-        {
-            "error": f"No schema information found for '{entity_type}'",
-            "suggestion": "Try a common entity like 'drugs', 'companies', 'diseases', or a module name like 'clinical', 'regulatory'",
-        },
-        indent=2,
-    )
-    print(
-        Fore.RED
-        + f"[TOOL - check_schema] Output: No matches found for '{entity_type}'"
-        + Style.RESET_ALL
-    )
-    return error_result
+    print(Fore.CYAN + f"[TOOL - check_schema] Output: {message}" + Style.RESET_ALL)
+    return json_result
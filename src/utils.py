@@ -1,5 +1,4 @@
 import base64
-import fitz  # PyMuPDF
 import os
 from typing import List
 from .state import Slide
@@ -24,6 +23,8 @@ class PDFToolsClass:
             return []
 
         try:
+            import fitz  # PyMuPDF (imported on first use to keep CLI startup fast)
+
             # Load PDF using PyMuPDF
             pdf_document = fitz.open(pdf_path)
             total_pages = len(pdf_document)
@@ -48,6 +49,7 @@ class PDFToolsClass:
                     slide = Slide(
                         slide_number=page_num + 1,  # 1-indexed for user-friendliness
                         base64_image=img_str,
+                        text=page.get_text(),
                     )
                     slides.append(slide)
                     print(f"Processed page {page_num + 1}/{total_pages}")
@@ -0,0 +1,170 @@
+# vector_index.py
+import threading
+import numpy as np
+from langchain_core.documents import Document
+
+
+class VectorIndex:
+    """
+    In-memory vector index for slide extractions.
+
+    Embeddings are stored as normalized float32 rows of a preallocated matrix
+    that doubles in size when full, so adding a document is amortized O(1)
+    and a query is one matrix-vector product plus an argpartition for the
+    top k, independent of Python-level per-document work. Slide numbers are
+    kept in a parallel integer array.
+
+    Added documents are buffered and embedded together, in one
+    embed_documents call, when batch_size of them are pending or before the
+    next query, so runs that never search embed nothing.
+
+    Exposes the subset of the LangChain vector store interface the tools use
+    (add_documents, similarity_search), plus delete_slide.
+    """
+
+    def __init__(self, embedding, initial_capacity=64, batch_size=16):
+        """
+        Initialize an empty index.
+
+        Args:
+            embedding: LangChain Embeddings used for documents and queries
+            initial_capacity: Rows preallocated before the first resize
+            batch_size: Pending documents that trigger embedding before a query does
+        """
+        self.embedding = embedding
+        self.initial_capacity = initial_capacity
+        self.batch_size = batch_size
+        self._pending = []
+        # Held while embedding pending documents so queries wait for them
+        self._flush_lock = threading.Lock()
+        self._vectors = None
+        self._slide_numbers = np.zeros(0, dtype=np.int32)
+        self._documents = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size + len(self._pending)
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def _reserve(self, count, dimension):
+        """Grow the matrix and metadata arrays to hold count more rows."""
+        if self._vectors is None:
+            capacity = max(self.initial_capacity, count)
+            self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+            self._slide_numbers = np.zeros(capacity, dtype=np.int32)
+            return
+        if self._vectors.shape[1] != dimension:
+            raise ValueError(
+                f"Embedding dimension {dimension} does not match index dimension "
+                f"{self._vectors.shape[1]}"
+            )
+        needed = self._size + count
+        if needed <= len(self._vectors):
+            return
+        capacity = max(needed, 2 * len(self._vectors))
+        vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        slide_numbers = np.zeros(capacity, dtype=np.int32)
+        slide_numbers[: self._size] = self._slide_numbers[: self._size]
+        self._vectors, self._slide_numbers = vectors, slide_numbers
+
+    def add_documents(self, documents):
+        """
+        Add documents (embedded in a batch later).
+
+        Args:
+            documents: List of Document with an optional "slide_number" metadata entry
+        """
+        with self._lock:
+            self._pending.extend(documents)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Embed all pending documents in one call and add them to the matrix."""
+        with self._flush_lock:
+            with self._lock:
+                documents, self._pending = self._pending, []
+            if not documents:
+                return
+            try:
+                vectors = self._normalize(
+                    self.embedding.embed_documents([doc.page_content for doc in documents])
+                )
+            except Exception:
+                # Keep the documents for the next attempt
+                with self._lock:
+                    self._pending[:0] = documents
+                raise
+            self._append(documents, vectors)
+
+    def delete_slide(self, slide_number):
+        """Remove the documents of a slide (before it is indexed again)."""
+        # Wait for a flush in progress so its documents are removed too
+        with self._flush_lock, self._lock:
+            self._pending = [
+                doc for doc in self._pending
+                if doc.metadata.get("slide_number") != slide_number
+            ]
+            if self._size == 0:
+                return
+            keep = np.flatnonzero(self._slide_numbers[: self._size] != slide_number)
+            self._vectors[: len(keep)] = self._vectors[keep]
+            self._slide_numbers[: len(keep)] = self._slide_numbers[keep]
+            self._documents = [self._documents[index] for index in keep]
+            self._size = len(keep)
+
+    def _append(self, documents, vectors):
+        with self._lock:
+            self._reserve(len(documents), vectors.shape[1])
+            end = self._size + len(documents)
+            self._vectors[self._size:end] = vectors
+            self._slide_numbers[self._size:end] = [
+                doc.metadata.get("slide_number", -1) for doc in documents
+            ]
+            self._documents.extend(documents)
+            self._size = end
+
+    def similarity_search(self, query, k=4, before_slide=None):
+        """
+        Return the k documents most similar to the query (cosine similarity).
+
+        Args:
+            query: Query text
+            k: Number of documents to return
+            before_slide: Only consider documents from slides before this one
+
+        Returns:
+            List of Document, most similar first
+        """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, before_slide)]
+
+    def similarity_search_with_score(self, query, k=4, before_slide=None):
+        """Like similarity_search, but returns (Document, score) pairs."""
+        self.flush()
+        if self._size == 0 or k <= 0:
+            return []
+        query_vector = self._normalize(self.embedding.embed_query(query))
+
+        with self._lock:
+            size = self._size
+            scores = self._vectors[:size] @ query_vector
+            if before_slide is not None:
+                scores = np.where(self._slide_numbers[:size] < before_slide, scores, -np.inf)
+            documents = self._documents[:size]
+
+        k = min(k, size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (documents[index], float(scores[index]))
+            for index in top
+            if np.isfinite(scores[index])
+        ]
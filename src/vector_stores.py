@@ -0,0 +1,111 @@
+# vector_stores.py
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from colorama import Fore, Style
+
+DEFAULT_NAMESPACE = "default"
+
+# Namespace (run or thread ID) of the document being processed. Context
+# variables follow the work into ContextThreadPoolExecutor threads, so tools
+# called by the agents see the namespace of the node that started them.
+current_namespace = ContextVar("vector_store_namespace", default=DEFAULT_NAMESPACE)
+
+# Slide being extracted in this context; lookups only see slides before it
+current_slide = ContextVar("lookup_slide", default=None)
+
+
+@contextmanager
+def use_namespace(namespace):
+    """Route vector store reads and writes in this context to namespace."""
+    token = current_namespace.set(namespace or DEFAULT_NAMESPACE)
+    try:
+        yield
+    finally:
+        current_namespace.reset(token)
+
+
+@contextmanager
+def use_slide(slide_number):
+    """Limit vector store lookups in this context to slides before slide_number."""
+    token = current_slide.set(slide_number)
+    try:
+        yield
+    finally:
+        current_slide.reset(token)
+
+
+def run_scoped(node):
+    """Run a graph node method in the vector store namespace of state["run_id"]."""
+
+    @functools.wraps(node)
+    def wrapper(self, state, *args, **kwargs):
+        with use_namespace(state.get("run_id")):
+            return node(self, state, *args, **kwargs)
+
+    return wrapper
+
+
+class VectorStorePool:
+    """
+    One vector store per namespace, with LRU eviction.
+
+    Keeps each document's extractions separate so lookup_previous never
+    returns slides from another deck, and bounds memory in long-running
+    servers and batch runs: stores are dropped explicitly when a run ends,
+    and the least recently used ones are evicted beyond max_namespaces.
+    """
+
+    def __init__(self, factory, max_namespaces=8, label="vector store"):
+        """
+        Initialize an empty pool.
+
+        Args:
+            factory: Callable with no arguments that builds an empty vector store
+            max_namespaces: Stores retained before the least recently used is evicted
+            label: What the pool holds, for log messages (also used for deck summaries)
+        """
+        self.factory = factory
+        self.max_namespaces = max(1, max_namespaces)
+        self.label = label
+        self._stores = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace=None):
+        """
+        Return the store for a namespace, creating it if needed.
+
+        Args:
+            namespace: Run or thread ID (defaults to the current context's namespace)
+
+        Returns:
+            Vector store
+        """
+        namespace = namespace or current_namespace.get()
+        with self._lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                store = self._stores[namespace] = self.factory()
+                while len(self._stores) > self.max_namespaces:
+                    evicted, _ = self._stores.popitem(last=False)
+                    print(
+                        Fore.YELLOW
+                        + f"Evicted {self.label} for run {evicted} (limit {self.max_namespaces})"
+                        + Style.RESET_ALL
+                    )
+            else:
+                self._stores.move_to_end(namespace)
+            return store
+
+    def drop(self, namespace=None):
+        """Discard the store of a namespace (defaults to the current one)."""
+        namespace = namespace or current_namespace.get()
+        with self._lock:
+            return self._stores.pop(namespace, None) is not None
+
+    def namespaces(self):
+        """Namespaces with a retained store, least recently used first."""
+        with self._lock:
+            return list(self._stores)